@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+API client for the Ad Watcher Bot.
+One pooled, keep-alive HTTP session and one login token shared by every
+API call the bot makes.
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_BASE_URL = 'https://api.aksystemph.com'
+
+# Words in an API error message that mean the token was not accepted
+AUTH_REJECTION_HINTS = ('token', 'login', 'log in', 'expired', 'session')
+
+# Account fields the bot reads from the login data; getUserInfo must return them for a cached token
+ACCOUNT_KEYS = ('task_num', 'level', 'useridentity')
+
+# Calls that may have taken effect even when the reply looks like a token rejection, so they are never replayed
+NO_RETRY_ENDPOINTS = ('/api/Task/submitTask', '/api/Withdraw/submitWithdraw')
+
+
+class ApiClient:
+    """Pooled HTTP client for the task site API with a cached login token."""
+
+    def __init__(self, website_url: str, username: str, password: str, user_agent: str,
+                 base_url: Optional[str] = None, timeout: Tuple[float, float] = (5, 30),
+                 pool_size: int = 4, retries: int = 2,
+                 token_cache_path: Optional[str] = None, token_ttl: float = 6 * 3600, metrics=None):
+        self.website_url = website_url
+        self.username = username
+        self.password = password
+        self.base_url = (base_url or DEFAULT_API_BASE_URL).rstrip('/')
+        self.timeout = timeout
+        self.token_cache_path = token_cache_path
+        self.token_ttl = token_ttl
+        self.metrics = metrics
+        self._login_data = None
+        self._login_from_cache = False
+
+        self.session = requests.Session()
+        # Only connection errors are retried; POSTs that reached the server are never replayed
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=retries, connect=retries, read=0, status=0, backoff_factor=0.5),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'accept': 'application/json, text/plain, */*',
+            'accept-language': 'en-US,en;q=0.9',
+            'content-type': 'application/x-www-form-urlencoded',
+            'connection': 'keep-alive',
+            'origin': website_url,
+            'referer': f'{website_url}/',
+            'user-agent': user_agent,
+        })
+
+    def post(self, endpoint: str, data: Optional[dict] = None, referer: Optional[str] = None,
+             language: str = 'fil_ph', auth: bool = True) -> requests.Response:
+        """POST form data to an API endpoint, adding language, referer and token."""
+        payload = {'language': language, 'referer': referer or f'{self.website_url}/'}
+        payload.update(data or {})
+        if auth:
+            payload['token'] = self.login()['token']
+        resp = self._send(endpoint, payload)
+
+        # A cached token may have been revoked server-side: log in again once and retry
+        if (auth and self._login_from_cache and endpoint not in NO_RETRY_ENDPOINTS
+                and self._is_auth_rejection(resp)):
+            logger.info("Cached API token rejected - logging in again")
+            if self.metrics:
+                self.metrics.inc('retries_total', kind='api_token')
+            self.invalidate_token()
+            payload['token'] = self.login()['token']
+            resp = self._send(endpoint, payload)
+        return resp
+
+    def _send(self, endpoint: str, payload: dict) -> requests.Response:
+        try:
+            resp = self.session.post(f"{self.base_url}{endpoint}", data=payload, timeout=self.timeout)
+        except requests.RequestException:
+            if self.metrics:
+                self.metrics.inc('http_requests_total', endpoint=endpoint, code='error')
+            raise
+        if self.metrics:
+            self.metrics.inc('http_requests_total', endpoint=endpoint, code=resp.status_code)
+        return resp
+
+    def login(self) -> dict:
+        """Log in once and return the login data (token, task_num, level, ...).
+
+        A token cached by an earlier run is used instead if getUserInfo still
+        accepts it; the account fields always come fresh from the server.
+        """
+        if self._login_data is None:
+            token = self._load_cached_token()
+            if token:
+                self._login_data = self._account_data(token)
+            self._login_from_cache = self._login_data is not None
+        if self._login_data is None:
+            login_resp = self.post('/api/User/login', {
+                'username': self.username,
+                'password': self.password,
+            }, referer=f'{self.website_url}/#/login', auth=False)
+            login_resp.raise_for_status()
+            login_json = login_resp.json()
+            if login_json.get('code') != 1:
+                raise Exception(f"API login error: {login_json}")
+            self._login_data = login_json['data']
+            logger.info(f"API login successful. Identity: {self._login_data['useridentity']}, "
+                        f"Level: {self._login_data['level']}")
+            self._save_cached_token()
+        return self._login_data
+
+    def _account_data(self, token: str) -> Optional[dict]:
+        """Login data for a cached token, read with getUserInfo; None if the token no longer works."""
+        resp = self.post('/api/User/getUserInfo', {'token': token}, auth=False)
+        try:
+            body = resp.json()
+        except ValueError:
+            body = None
+        data = body.get('data') if isinstance(body, dict) and body.get('code') == 1 else None
+        if not isinstance(data, dict) or any(key not in data for key in ACCOUNT_KEYS):
+            logger.info("Cached API token was not accepted - logging in again")
+            self.invalidate_token()
+            return None
+        return dict(data, token=token)
+
+    def adopt_token(self, token: str, **data):
+        """Use a token from another session (the logged-in browser) instead of logging in.
+
+        If the server rejects it, the next call falls back to a normal login.
+        The adopted data is kept in memory only: browser storage may lack
+        fields a later --api run needs, so it never goes into the token cache.
+        """
+        self._login_data = dict(data, token=token)
+        self._login_from_cache = True
+
+    def invalidate_token(self):
+        """Forget the current token, in memory and on disk."""
+        self._login_data = None
+        self._login_from_cache = False
+        if self.token_cache_path:
+            try:
+                os.remove(self.token_cache_path)
+            except FileNotFoundError:
+                pass
+
+    def _load_cached_token(self) -> Optional[str]:
+        """Return the token saved by an earlier run if it has not expired."""
+        if not self.token_cache_path:
+            return None
+        try:
+            with open(self.token_cache_path) as f:
+                cached = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable token cache: {e}")
+            return None
+
+        if not isinstance(cached, dict) or not cached.get('token'):
+            return None
+        if cached.get('username') != self.username or cached.get('base_url') != self.base_url:
+            return None
+        left = cached.get('expires_at', 0) - time.time()
+        if left <= 0:
+            logger.info("Cached API token expired")
+            return None
+        logger.info(f"Using cached API token ({left / 60:.0f} min left)")
+        return cached['token']
+
+    def _save_cached_token(self):
+        """Persist the token and its expiry so the next run can skip /api/User/login."""
+        if not self.token_cache_path:
+            return
+        cached = {
+            'username': self.username,
+            'base_url': self.base_url,
+            'token': self._login_data['token'],
+            'expires_at': time.time() + self.token_ttl,
+        }
+        try:
+            # Owner-only permissions: the file holds a live session token
+            fd = os.open(self.token_cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cached, f)
+        except OSError as e:
+            logger.warning(f"Could not save API token cache: {e}")
+
+    @staticmethod
+    def _is_auth_rejection(resp: requests.Response) -> bool:
+        """Guess whether a response means the token is no longer valid."""
+        if resp.status_code in (401, 403):
+            return True
+        try:
+            body = resp.json()
+        except ValueError:
+            return False
+        if not isinstance(body, dict) or body.get('code') == 1:
+            return False
+        message = str(body.get('msg') or body.get('info') or '').lower()
+        return any(hint in message for hint in AUTH_REJECTION_HINTS)
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
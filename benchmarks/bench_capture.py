@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Screen Capture Benchmark
+Compares the mss backend (region grab into a reused buffer) with the
+pyautogui screenshot the bot used before, for the full screen and for the
+message box region. Needs a display; on a headless Linux box run it under
+Xvfb:
+
+Usage:
+    xvfb-run -s "-screen 0 1440x900x24" python benchmarks/bench_capture.py [--repeat N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from screen_capture import ScreenCapture, BACKENDS, MSS_AVAILABLE
+from vision import ADMIN_MESSAGE_REGION
+
+TARGETS = {
+    'full screen': None,
+    'message box': ADMIN_MESSAGE_REGION,
+}
+
+
+def time_grabs(capture: ScreenCapture, region, repeat: int) -> dict:
+    """Median and p95 wall time of `repeat` grabs after one warm-up grab."""
+    frame = capture.grab(region)
+    walls = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        capture.grab(region)
+        walls.append(time.perf_counter() - start)
+    walls.sort()
+    return {
+        'median_ms': statistics.median(walls) * 1000,
+        'p95_ms': walls[min(len(walls) - 1, int(len(walls) * 0.95))] * 1000,
+        'shape': frame.shape,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark screen capture backends")
+    parser.add_argument('--repeat', type=int, default=30, help='Timed grabs per backend and target')
+    parser.add_argument('--backend', choices=BACKENDS, action='append', help='Only run these backends')
+    args = parser.parse_args()
+
+    backends = args.backend or list(BACKENDS)
+    if 'mss' in backends and not MSS_AVAILABLE:
+        print("⚠️  mss not installed - skipping the mss backend (pip install mss)")
+        backends.remove('mss')
+
+    header = f"{'Backend':<12} {'Target':<14} {'Median ms':>10} {'p95 ms':>10}  Frame"
+    print(header)
+    print("-" * len(header))
+    for backend in backends:
+        try:
+            # strict: a failing mss grab must not be timed as pyautogui under the mss label
+            capture = ScreenCapture(backend, strict=True)
+        except RuntimeError as e:
+            print(f"❌ {backend}: {e}")
+            continue
+        try:
+            for target, region in TARGETS.items():
+                stats = time_grabs(capture, region, args.repeat)
+                print(f"{backend:<12} {target:<14} {stats['median_ms']:>10.1f} {stats['p95_ms']:>10.1f}  "
+                      f"{stats['shape'][1]}x{stats['shape'][0]}")
+        except Exception as e:
+            print(f"❌ {backend}: {e}")
+        finally:
+            capture.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Hot Path Benchmarks
+Runs the CPU-heavy image and OCR paths of the bot against the screenshots
+in benchmarks/corpus/ and reports wall time, CPU time (including tesseract
+child processes), tesseract invocations and peak memory. Runs offline.
+
+Usage:
+    python benchmarks/bench_hot_paths.py [--repeat N] [--case NAME] [--json results.json]
+"""
+
+import argparse
+import json
+import os
+import re
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import cv2
+import pytesseract
+from vision import (
+    get_ocr_engine, decode_png, preprocess_tasks_screenshot, ocr_task_count,
+    count_whatsapp_green, preprocess_chatbox, contains_admin_message, WhatsAppDetector
+)
+
+CORPUS_DIR = Path(__file__).resolve().parent / 'corpus'
+
+
+def tasks_pipeline(path: Path):
+    """Decode, crop, upscale, Otsu-threshold and split the task list screenshot."""
+    data = path.read_bytes()
+    return lambda: tuple(img.shape for img in preprocess_tasks_screenshot(decode_png(data)))
+
+
+def tasks_ocr(path: Path):
+    """Full tesseract verification of the task counter (the wait_and_screenshot fallback)."""
+    expected = int(re.search(r'(\d+)', path.stem).group(1))
+    _, img1, img2 = preprocess_tasks_screenshot(cv2.imread(str(path)))
+    engine = get_ocr_engine()
+    return lambda: ocr_task_count(engine, img1, img2, expected)
+
+
+def whatsapp_fullscreen(path: Path):
+    """Colour sample plus full-screen OCR from is_whatsapp_visible."""
+    screen = cv2.cvtColor(cv2.imread(str(path)), cv2.COLOR_BGR2RGB)
+    engine = get_ocr_engine()
+
+    def run():
+        count_whatsapp_green(screen)
+        text = engine.image_to_string(screen).lower()
+        return any(indicator in text for indicator in ['whatsapp', 'chats'])
+    return run
+
+
+def whatsapp_tiered(path: Path):
+    """WhatsAppDetector: colour histogram, learned header template, then header OCR.
+
+    The warm-up run lets the detector learn the header, so timed runs show
+    the steady state of later checks.
+    """
+    screen = cv2.cvtColor(cv2.imread(str(path)), cv2.COLOR_BGR2RGB)
+    detector = WhatsAppDetector(template_dir=tempfile.mkdtemp())
+    engine = get_ocr_engine()
+    return lambda: detector.detect(screen, engine)
+
+
+def admin_region(path: Path):
+    """Message box preprocessing and OCR from check_for_admin_message."""
+    region = cv2.cvtColor(cv2.imread(str(path)), cv2.COLOR_BGR2RGB)
+    engine = get_ocr_engine()
+    return lambda: contains_admin_message(engine.image_to_string(preprocess_chatbox(region)).strip())
+
+
+# name -> (corpus prefix, setup function, needs tesseract)
+CASES = {
+    'tasks_pipeline': ('tasks_', tasks_pipeline, False),
+    'tasks_ocr': ('tasks_', tasks_ocr, True),
+    'whatsapp_fullscreen': ('screen_', whatsapp_fullscreen, True),
+    'whatsapp_tiered': ('screen_', whatsapp_tiered, True),
+    'admin_region': ('chatbox_', admin_region, True),
+}
+
+
+def cpu_seconds() -> float:
+    """CPU time of this process plus every waited-for child (tesseract)."""
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def measure(func, repeat: int) -> dict:
+    """Run func `repeat` times and collect timing, OCR call and memory figures."""
+    engine = get_ocr_engine()
+    func()  # warm-up: first call pays for model loading and caches
+    walls = []
+    calls_before = engine.calls
+    cpu_before = cpu_seconds()
+    tracemalloc.start()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        walls.append(time.perf_counter() - start)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'wall_ms': statistics.median(walls) * 1000,
+        'cpu_ms': (cpu_seconds() - cpu_before) / repeat * 1000,
+        'tesseract_calls': (engine.calls - calls_before) / repeat,
+        'peak_kb': peak / 1024,
+        'result': repr(result),
+    }
+
+
+def tesseract_available() -> bool:
+    try:
+        pytesseract.get_tesseract_version()
+        return True
+    except Exception:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark image and OCR hot paths")
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per image')
+    parser.add_argument('--case', choices=sorted(CASES), action='append', help='Only run these cases')
+    parser.add_argument('--corpus', default=str(CORPUS_DIR), help='Screenshot corpus directory')
+    parser.add_argument('--json', help='Also write results to this JSON file')
+    args = parser.parse_args()
+
+    corpus = Path(args.corpus)
+    has_tesseract = tesseract_available()
+    engine = get_ocr_engine()
+    print(f"🔬 Corpus: {corpus}  OCR backend: {engine.backend}  repeat: {args.repeat}")
+    if not has_tesseract:
+        print("⚠️  tesseract not found - OCR cases skipped")
+
+    results = []
+    header = f"{'Case':<20} {'Image':<34} {'Wall ms':>9} {'CPU ms':>9} {'OCR calls':>9} {'Peak KB':>9}  Result"
+    print(header)
+    print("-" * len(header))
+    for name in args.case or CASES:
+        prefix, setup, needs_tesseract = CASES[name]
+        if needs_tesseract and not has_tesseract:
+            continue
+        for path in sorted(corpus.glob(f'{prefix}*.png')):
+            stats = measure(setup(path), args.repeat)
+            results.append({'case': name, 'image': path.name, **stats})
+            print(f"{name:<20} {path.name:<34} {stats['wall_ms']:>9.1f} {stats['cpu_ms']:>9.1f} "
+                  f"{stats['tesseract_calls']:>9.1f} {stats['peak_kb']:>9.0f}  {stats['result']}")
+
+    maxrss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"\n📈 Process peak RSS: {maxrss_kb / 1024:.1f} MB")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'backend': engine.backend, 'repeat': args.repeat, 'results': results}, f, indent=2)
+        print(f"💾 Results written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+OCR Engine Benchmark
+Compares the persistent tesserocr engine with the pytesseract
+subprocess-per-call path. By default it runs on the task list pages in
+benchmarks/corpus/ (see make_corpus.py), cropped to the digit region the
+bot OCRs; saved debug_tasks_screenshot*.png images from --debug runs can
+be passed instead.
+
+Usage:
+    python benchmarks/bench_ocr_engine.py [fixture_glob ...] [--repeat N]
+"""
+
+import argparse
+import glob
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import cv2
+from vision import OcrEngine, TESSEROCR_AVAILABLE, preprocess_tasks_screenshot
+
+CORPUS_DIR = Path(__file__).resolve().parent / 'corpus'
+DEFAULT_FIXTURES = [str(CORPUS_DIR / 'tasks_*.png')]
+
+
+def load_fixtures(patterns):
+    """Load every fixture matching the given glob patterns as grayscale images.
+
+    Full task list pages (tasks_*.png) are cropped to the digit region the
+    bot OCRs; anything else is used as it is.
+    """
+    fixtures = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)):
+            if Path(path).name.startswith('tasks_'):
+                page = cv2.imread(path, cv2.IMREAD_COLOR)
+                img = preprocess_tasks_screenshot(page)[1] if page is not None else None
+            else:
+                img = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+            if img is not None:
+                fixtures.append((path, img))
+    return fixtures
+
+
+def run_psm_sweep(engine, img):
+    """Run the same OCR calls wait_and_screenshot makes for one image."""
+    results = []
+    for psm in [7, 10, 6, 11]:
+        results.append(engine.image_to_string(img, psm=psm, oem=3, whitelist="0123456789").strip())
+        results.append(engine.image_to_string(img, psm=psm, oem=1, whitelist="0123456789").strip())
+        results.append(engine.image_to_string(img, psm=psm, oem=3).strip())
+    return results
+
+
+def bench(engine, fixtures, repeat):
+    """Time the PSM sweep over all fixtures and return (seconds, outputs)."""
+    outputs = {}
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path, img in fixtures:
+            outputs[path] = run_psm_sweep(engine, img)
+    return time.perf_counter() - start, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark persistent vs subprocess OCR")
+    parser.add_argument('fixtures', nargs='*', default=DEFAULT_FIXTURES, help='Fixture glob patterns')
+    parser.add_argument('--repeat', type=int, default=3, help='Sweeps per fixture')
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        print(f"❌ No fixtures found for {args.fixtures}")
+        print("   Run python benchmarks/make_corpus.py first, or pass debug_tasks_screenshot*.png from a --debug run")
+        return 1
+
+    print(f"📸 {len(fixtures)} fixture(s), {args.repeat} sweep(s) each")
+    subprocess_engine = OcrEngine(persistent=False)
+    sub_time, sub_out = bench(subprocess_engine, fixtures, args.repeat)
+    print(f"   pytesseract: {sub_time:.2f}s for {subprocess_engine.calls} calls "
+          f"({sub_time / subprocess_engine.calls * 1000:.1f} ms/call)")
+
+    if not TESSEROCR_AVAILABLE:
+        print("⚠️  tesserocr not installed - persistent engine not benchmarked")
+        return 0
+
+    persistent_engine = OcrEngine(persistent=True)
+    try:
+        per_time, per_out = bench(persistent_engine, fixtures, args.repeat)
+    finally:
+        persistent_engine.close()
+    print(f"   tesserocr:   {per_time:.2f}s for {persistent_engine.calls} calls "
+          f"({per_time / persistent_engine.calls * 1000:.1f} ms/call)")
+    print(f"🚀 Speedup: {sub_time / per_time:.1f}x")
+
+    mismatches = [path for path in sub_out if sub_out[path] != per_out[path]]
+    if mismatches:
+        print(f"⚠️  Output differs between engines for: {', '.join(mismatches)}")
+    else:
+        print("✅ Both engines produced identical text")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark Corpus Generator
+Renders the representative screenshots in benchmarks/corpus/ used by
+bench_hot_paths.py. Real captures can be dropped into the same folder
+using the same name prefixes (tasks_*, screen_*, chatbox_*).
+
+Usage:
+    python benchmarks/make_corpus.py
+"""
+
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+CORPUS_DIR = Path(__file__).resolve().parent / 'corpus'
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+WHATSAPP_GREEN_BGR = (102, 211, 37)
+WHATSAPP_DARK_BGR = (84, 94, 7)
+
+
+def task_list_page(completed: int, remaining: int) -> np.ndarray:
+    """Task list page at 735px wide and 2x scale, as Chrome captures it."""
+    img = np.full((2000, 1470, 3), 255, np.uint8)
+    cv2.rectangle(img, (0, 0), (1470, 100), (250, 250, 250), -1)
+    cv2.putText(img, "Task List", (620, 65), FONT, 1.4, (34, 34, 34), 3)
+    for center, count, label in ((367, remaining, "Tasks Remaining Today"),
+                                 (1102, completed, "Tasks Completed Today")):
+        text = str(count)
+        (w, _), _ = cv2.getTextSize(text, FONT, 2.4, 6)
+        cv2.putText(img, text, (center - w // 2, 225), FONT, 2.4, (34, 34, 34), 6)
+        (w, _), _ = cv2.getTextSize(label, FONT, 1.1, 2)
+        cv2.putText(img, label, (center - w // 2, 290), FONT, 1.1, (34, 34, 34), 2)
+    for i in range(8):
+        x, y = 30 + (i % 4) * 360, 360 + (i // 4) * 260
+        cv2.rectangle(img, (x, y), (x + 320, y + 180), (250, 137, 25), -1)
+        cv2.putText(img, f"Ad {1000 + i}", (x + 100, y + 230), FONT, 1.0, (34, 34, 34), 2)
+    return img
+
+
+def whatsapp_screen(width: int, height: int, header: bool, green: bool = True) -> np.ndarray:
+    """Desktop with a maximised WhatsApp window (or a plain desktop).
+
+    With green=False the window uses the dark theme, so the colour sample
+    misses and detection has to fall through to OCR.
+    """
+    img = np.full((height, width, 3), (235, 230, 225), np.uint8)
+    if not header:
+        cv2.putText(img, "Documents", (60, 120), FONT, 1.0, (60, 60, 60), 2)
+        return img
+    scale = width / 1440
+    cv2.rectangle(img, (0, 0), (width, int(130 * scale)), WHATSAPP_DARK_BGR, -1)
+    if green:
+        cv2.rectangle(img, (0, 0), (width, int(40 * scale)), WHATSAPP_GREEN_BGR, -1)
+        cv2.rectangle(img, (0, 0), (int(180 * scale), height), WHATSAPP_GREEN_BGR, -1)
+    cv2.putText(img, "WhatsApp", (int(200 * scale), int(95 * scale)), FONT, 1.2 * scale, (255, 255, 255), max(1, int(2 * scale)))
+    cv2.putText(img, "Chats", (int(200 * scale), int(200 * scale)), FONT, 1.0 * scale, (40, 40, 40), max(1, int(2 * scale)))
+    for i in range(6):
+        y = int((260 + i * 90) * scale)
+        cv2.putText(img, f"Working Group #{i + 1}", (int(200 * scale), y), FONT, 0.8 * scale, (40, 40, 40), max(1, int(2 * scale)))
+    return img
+
+
+def chatbox(admin_only: bool) -> np.ndarray:
+    """The 1024x50 message box region check_for_admin_message captures."""
+    img = np.full((50, 1024, 3), 240, np.uint8)
+    text = "Only admins can send messages" if admin_only else "Type a message"
+    cv2.putText(img, text, (300 if admin_only else 20, 33), FONT, 0.8, (90, 90, 90), 2)
+    return img
+
+
+def main():
+    CORPUS_DIR.mkdir(exist_ok=True)
+    images = {
+        'tasks_completed_5.png': task_list_page(5, 0),
+        'tasks_completed_12.png': task_list_page(12, 3),
+        'screen_whatsapp_1440x900.png': whatsapp_screen(1440, 900, True),
+        'screen_whatsapp_2880x1800.png': whatsapp_screen(2880, 1800, True),
+        'screen_whatsapp_dark_1440x900.png': whatsapp_screen(1440, 900, True, green=False),
+        'screen_desktop_1440x900.png': whatsapp_screen(1440, 900, False),
+        'chatbox_admin_only.png': chatbox(True),
+        'chatbox_open.png': chatbox(False),
+    }
+    for name, img in images.items():
+        cv2.imwrite(str(CORPUS_DIR / name), img, [cv2.IMWRITE_PNG_COMPRESSION, 9])
+        print(f"✅ {name} {img.shape[1]}x{img.shape[0]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Daemon mode for the Ad Watcher Bot.
+Keeps one process running and fires the daily task, withdrawal and report
+windows from an in-process scheduler, warming up Chrome and the API
+connection shortly before each window instead of sleeping inside a step.
+"""
+
+import logging
+import os
+import sched
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# (window name, environment variable, default HH:MM) in the order they run each day
+WINDOWS = [
+    ('tasks', 'DAEMON_TASKS_AT', '08:30'),
+    ('withdraw', 'DAEMON_WITHDRAW_AT', '09:00'),
+    ('report', 'DAEMON_REPORT_AT', '09:30'),
+]
+
+
+def next_occurrence(hhmm: str, after: datetime) -> datetime:
+    """Return the first time HH:MM strictly after `after`."""
+    hour, minute = (int(part) for part in hhmm.split(':'))
+    candidate = after.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    return candidate if candidate > after else candidate + timedelta(days=1)
+
+
+class BotDaemon:
+    """Runs the bot's daily windows on a schedule within one long-lived process."""
+
+    def __init__(self, bot_factory: Callable, skip_whatsapp: bool = False, complete_all_steps: bool = False):
+        self.bot_factory = bot_factory
+        self.skip_whatsapp = skip_whatsapp
+        self.complete_all_steps = complete_all_steps
+        self.times: Dict[str, str] = {name: os.getenv(env, default) for name, env, default in WINDOWS}
+        self.prewarm_seconds = float(os.getenv('DAEMON_PREWARM', '120'))
+        self.scheduler = sched.scheduler(time.time, time.sleep)
+        self.bot = None
+        self.day: Optional[str] = None
+        self.logged_in = False
+        self.tasks_completed = False
+
+    def run_forever(self) -> int:
+        """Schedule every window and block until interrupted."""
+        now = datetime.now()
+        for name, _, _ in WINDOWS:
+            self._schedule(name, now)
+        logger.info("Daemon started - windows: " +
+                    ", ".join(f"{name} at {at}" for name, at in self.times.items()))
+        try:
+            # sched sleeps until the next event, so the process is idle between windows
+            self.scheduler.run()
+        except KeyboardInterrupt:
+            logger.info("Daemon stopped by user")
+        finally:
+            self._end_day()
+        return 0
+
+    def _schedule(self, name: str, after: datetime):
+        """Queue the next pre-warm and run of a window."""
+        at = next_occurrence(self.times[name], after)
+        prewarm_at = at - timedelta(seconds=self.prewarm_seconds)
+        if prewarm_at > datetime.now():
+            self.scheduler.enterabs(prewarm_at.timestamp(), 0, self._prewarm, (name,))
+        self.scheduler.enterabs(at.timestamp(), 1, self._run_window, (name, at))
+        logger.info(f"Next {name} window: {at.strftime('%Y-%m-%d %H:%M')}")
+
+    def _run_window(self, name: str, at: datetime):
+        try:
+            self._start_day(at)
+            if self.bot is None:
+                logger.info(f"Skipping {name} window - today's run already ended")
+            else:
+                with self.bot.tracer.span(f"daemon: {name}"):
+                    getattr(self, f'_window_{name}')()
+        except Exception as e:
+            logger.error(f"{name.capitalize()} window failed: {e} - ending today's run")
+            if self.bot is not None:
+                self.bot.run_info['error'] = f"{type(e).__name__}: {e}"
+            self._end_day()
+        finally:
+            if self.bot is not None:
+                self.bot.write_metrics()
+            self._schedule(name, at)
+            if name == WINDOWS[-1][0]:
+                self._end_day()
+
+    def _prewarm(self, name: str):
+        """Start Chrome, log in and open the API connection before a window starts."""
+        try:
+            self._start_day(datetime.now() + timedelta(seconds=self.prewarm_seconds))
+            if self.bot is None:
+                return
+            logger.info(f"Pre-warming for the {name} window...")
+            with self.bot.tracer.span(f"daemon: prewarm {name}"):
+                if self.bot.skip_browser:
+                    self.bot.warm_api()
+                else:
+                    self._ensure_logged_in()
+                    if self.bot.method in ('api', 'hybrid'):
+                        self.bot.warm_api()
+        except Exception as e:
+            # The window itself retries whatever the warm-up could not do
+            logger.warning(f"Pre-warm for {name} failed: {e}")
+
+    def _start_day(self, when: datetime):
+        """Create the bot for a new day; keep the existing one within the same day."""
+        day = when.strftime('%Y-%m-%d')
+        if self.day == day:
+            return
+        self._end_day()
+        self.day = day
+        self.logged_in = False
+        self.tasks_completed = False
+        logger.info(f"Starting run for {day}")
+        self.bot = self.bot_factory()
+
+    def _end_day(self):
+        """Close the browser and write the day's trace; the process keeps running."""
+        if self.bot is None:
+            return
+        bot, self.bot = self.bot, None
+        bot.log_wait_report()
+        bot.cleanup()
+
+    def _ensure_logged_in(self):
+        """Make sure Chrome is running and logged in for today."""
+        self.bot.ensure_browser()
+        if not self.logged_in:
+            self.bot.login_to_website()
+            self.logged_in = True
+
+    def _window_tasks(self):
+        bot = self.bot
+        if bot.method == 'api':
+            self.tasks_completed = bot.complete_tasks_via_api()
+            return
+        self._ensure_logged_in()
+        bot.setup_task_prerequisites()
+        self.tasks_completed = bot.start_tasks()
+
+    def _window_withdraw(self):
+        if not (self.tasks_completed or self.complete_all_steps):
+            logger.info("No tasks completed today - skipping withdrawal")
+            return
+        bot = self.bot
+        if bot.skip_browser:
+            bot.complete_withdrawal_via_api()
+            return
+        self._ensure_logged_in()
+        bot.check_balance_and_withdraw()
+        bot.wait_and_screenshot()
+
+    def _window_report(self):
+        if self.skip_whatsapp:
+            return
+        if not (self.tasks_completed or self.complete_all_steps):
+            logger.info("No tasks completed today - skipping report")
+            return
+        self.bot.open_whatsapp()
+        self.bot.navigate_and_send_message()
+        self.bot.close_whatsapp()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+DOM extraction for the Ad Watcher Bot.
+Reads everything the bot needs from a page with a single execute_script
+call instead of one WebDriver round-trip per element.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+# Page values as (label text, where the value sits relative to the label):
+# 'next' - the label's next sibling (user page: <p>label</p><p>value</p>)
+# 'prev' - a <span> inside the label's previous sibling (task page counters)
+USER_IDENTITY = ('Your Identity', 'next')
+PERSONAL_BALANCE = ('Personal Balance(PHP)', 'next')
+TASKS_REMAINING = ('Tasks Remaining Today', 'prev')
+TASKS_COMPLETED = ('Tasks Completed Today', 'prev')
+
+# Returns {name: text or null} for each {name: [label, position]}
+LABELLED_VALUES_SCRIPT = """
+    const specs = arguments[0], result = {};
+    const labels = Array.from(document.querySelectorAll('p, span'));
+    for (const [name, [text, position]] of Object.entries(specs)) {
+        const label = labels.find(el => el.textContent.trim() === text);
+        let value = null;
+        if (label && position === 'next' && label.nextElementSibling) {
+            value = label.nextElementSibling.textContent.trim();
+        } else if (label && position === 'prev' && label.previousElementSibling) {
+            const span = label.previousElementSibling.querySelector('span');
+            value = span ? span.textContent.trim() : null;
+        }
+        result[name] = value || null;
+    }
+    return result;
+"""
+
+# Returns [{date, amount, status}] for every row on the Withdrawal Records tab
+WITHDRAWAL_RECORDS_SCRIPT = """
+    const text = el => el ? el.textContent.trim() : null;
+    return Array.from(document.querySelectorAll('div.FundItem.van-cell')).map(row => {
+        const spans = Array.from(row.querySelectorAll('span'));
+        return {
+            date: text(spans.find(span => span.textContent.includes('-'))),
+            amount: text(row.querySelector('span.money-withdraw')),
+            status: text(spans.find(span => (span.getAttribute('style') || '').includes('color: gray'))),
+        };
+    });
+"""
+
+# Returns 'rows' once withdrawal rows are shown, 'empty' once the list finished
+# loading without any, or null while it is still loading
+WITHDRAWAL_RECORDS_STATE_SCRIPT = """
+    const visible = el => el.offsetParent !== null;
+    const shown = selector => Array.from(document.querySelectorAll(selector)).filter(visible);
+    const rows = shown('div.FundItem.van-cell').filter(row => row.querySelector('span.money-withdraw'));
+    if (shown('.van-list__loading, .van-loading').length) return null;
+    if (rows.length) return 'rows';
+    return shown('.van-list__finished-text, .van-empty').length ? 'empty' : null;
+"""
+
+
+def read_values(driver, **specs: Tuple[str, str]) -> Dict[str, Optional[str]]:
+    """Read several labelled values from the current page in one round-trip."""
+    return driver.execute_script(LABELLED_VALUES_SCRIPT, {name: list(spec) for name, spec in specs.items()})
+
+
+def withdrawal_records(driver) -> List[Dict[str, Optional[str]]]:
+    """Return every withdrawal record row on the current page in one round-trip."""
+    return driver.execute_script(WITHDRAWAL_RECORDS_SCRIPT) or []
+
+
+class ValuesPresent:
+    """Wait condition: returns the labelled values once all of them are on the page."""
+
+    def __init__(self, **specs: Tuple[str, str]):
+        self.specs = specs
+
+    def __call__(self, driver):
+        values = read_values(driver, **self.specs)
+        return values if all(values.values()) else False
+
+
+class WithdrawalRecordsLoaded:
+    """Wait condition: the Withdrawal Records list shows rows or has finished loading empty.
+
+    Returns 'rows' or 'empty'. Network idleness is not enough here: a slow
+    records request that has not finished yet would look like "no
+    withdrawal today" and lead to a second withdrawal.
+    """
+
+    def __call__(self, driver):
+        return driver.execute_script(WITHDRAWAL_RECORDS_STATE_SCRIPT) or False
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Deferred imports for the Ad Watcher Bot.
+Heavy dependencies (OpenCV, numpy, PyAutoGUI, Selenium, tesseract) are
+only imported by the step that first needs them, and every import is
+timed so the cost stays visible.
+"""
+
+import importlib
+import logging
+import sys
+import time
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (module name, seconds) in the order the modules were first loaded
+IMPORT_LOG: List[Tuple[str, float]] = []
+
+
+def timed_import(name: str):
+    """Import a module by name and record how long it took."""
+    already_loaded = name in sys.modules
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    if not already_loaded:
+        elapsed = time.perf_counter() - start
+        IMPORT_LOG.append((name, elapsed))
+        logger.debug(f"Imported {name} in {elapsed * 1000:.0f} ms")
+    return module
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, name: str):
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_module', None)
+
+    def _load(self):
+        if self._module is None:
+            object.__setattr__(self, '_module', timed_import(self._name))
+        return self._module
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __repr__(self):
+        state = 'loaded' if self.loaded else 'not loaded'
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def import_report(startup_seconds: float) -> List[str]:
+    """Return report lines: startup import time, then each deferred import."""
+    lines = [f"Startup imports: {startup_seconds * 1000:.0f} ms"]
+    for name, seconds in IMPORT_LOG:
+        lines.append(f"  deferred {name:<40} {seconds * 1000:>8.0f} ms")
+    total = sum(seconds for _, seconds in IMPORT_LOG)
+    lines.append(f"Deferred imports: {len(IMPORT_LOG)} modules, {total * 1000:.0f} ms")
+    lines.append(f"Modules loaded: {len(sys.modules)}")
+    try:
+        import resource
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS and kilobytes on Linux
+        maxrss_mb = maxrss / (1024 * 1024) if sys.platform == 'darwin' else maxrss / 1024
+        lines.append(f"Peak RSS: {maxrss_mb:.1f} MB")
+    except ImportError:
+        pass
+    return lines
@@ -4,8 +4,13 @@ Ad Watcher Bot - Automation script for logging into specific website
 and sending screenshots via WhatsApp.
 """
 
-import os
+from __future__ import annotations
+
 import time
+_IMPORT_START = time.perf_counter()
+
+import os
+import re
 import platform
 import subprocess
 import random
@@ -14,20 +19,21 @@ import logging
 from datetime import datetime
 from typing import Optional, Tuple
 from pathlib import Path
-import pyautogui
-import pytesseract
-import numpy as np
-import cv2
-from PIL import Image
 import io
-import requests
 from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from lazy_imports import LazyModule, timed_import, import_report
+
+# Heavy dependencies are imported by the first step that uses them, so
+# API-only runs never load OpenCV, tesseract, PyAutoGUI or Selenium
+pyautogui = LazyModule('pyautogui')
+np = LazyModule('numpy')
+cv2 = LazyModule('cv2')
+Image = LazyModule('PIL.Image')
+vision = LazyModule('vision')
+screen_capture = LazyModule('screen_capture')
+
+# Bound by _load_selenium() before the browser starts
+webdriver = By = WebDriverWait = EC = Options = TimeoutException = NoSuchElementException = None
 
 # Configure logging
 logging.basicConfig(
@@ -40,25 +46,147 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Try importing macOS permission checks
-try:
-    from check_macos_permissions import (
-        check_screenshot_permission,
-        check_accessibility_permission,
-        check_app_launching_permission,
-        check_automation_permission
-    )
-    PERMISSION_UTILITY_AVAILABLE = True
-except ImportError:
-    logger.warning("check_macos_permissions.py not found - skipping advanced permission checks")
-    PERMISSION_UTILITY_AVAILABLE = False
-    check_screenshot_permission = check_accessibility_permission = \
-        check_app_launching_permission = check_automation_permission = lambda: True
+from api_client import ApiClient
+from tracing import STATUS_OK, Tracer, traced
+import dom_extract
+from dom_extract import ValuesPresent
+from selector_cache import SelectorCache
+from run_history import RunHistory
+from metrics import get_metrics
+from webdriver_profile import WebDriverProfiler
+from resource_policy import LOGGING_PREFS, ResourceBlocker
+
+STARTUP_IMPORT_SECONDS = time.perf_counter() - _IMPORT_START
+
+
+def _load_selenium():
+    """Import Selenium and bind the names the browser steps use."""
+    global webdriver, By, WebDriverWait, EC, Options, TimeoutException, NoSuchElementException
+    if webdriver is not None:
+        return
+    webdriver = timed_import('selenium.webdriver')
+    By = timed_import('selenium.webdriver.common.by').By
+    WebDriverWait = timed_import('selenium.webdriver.support.ui').WebDriverWait
+    EC = timed_import('selenium.webdriver.support.expected_conditions')
+    Options = timed_import('selenium.webdriver.chrome.options').Options
+    exceptions = timed_import('selenium.common.exceptions')
+    TimeoutException = exceptions.TimeoutException
+    NoSuchElementException = exceptions.NoSuchElementException
+
+TASKS_SCREENSHOT_PATH = 'tasks_screenshot.png'
+
+# Login state the site keeps in localStorage, handed to the API client in hybrid mode
+BROWSER_SESSION_SCRIPT = """
+    return {token: localStorage.getItem('token'), task_num: localStorage.getItem('task_num'),
+            level: localStorage.getItem('level')};
+"""
+
+# Headless viewport. TASKS_CROP_BOX was measured on a 735px-wide window at 2x
+# device pixel ratio, so headless runs render at the same size and scale.
+HEADLESS_WINDOW_SIZE = (735, 1000)
+HEADLESS_SCALE_FACTOR = 2
+
+# Resolves once "Currently watched N seconds" reaches the requirement or the timeout elapses
+WATCH_PROGRESS_SCRIPT = """
+    const required = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+    const read = () => {
+        for (const p of document.querySelectorAll('p')) {
+            const m = p.textContent.match(/Currently watched (\\d+)/);
+            if (m) return parseInt(m[1], 10);
+        }
+        return null;
+    };
+    let finished = false, observer = null, timer = null;
+    const videos = Array.from(document.querySelectorAll('video'));
+    const check = () => {
+        const watched = read();
+        if (watched !== null && watched >= required) finish(true);
+    };
+    const finish = (reached) => {
+        if (finished) return;
+        finished = true;
+        if (observer) observer.disconnect();
+        clearTimeout(timer);
+        videos.forEach(v => v.removeEventListener('timeupdate', check));
+        done({reached: reached, watched: read()});
+    };
+    observer = new MutationObserver(check);
+    observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+    videos.forEach(v => v.addEventListener('timeupdate', check));
+    timer = setTimeout(() => finish(false), timeoutMs);
+    check();
+"""
+
+class NetworkIdle:
+    """Wait condition: document loaded and no new resource entries for `quiet` seconds."""
+
+    def __init__(self, quiet: float = 0.5):
+        self.quiet = quiet
+        self._last_state = None
+        self._stable_since = 0.0
+
+    def __call__(self, driver) -> bool:
+        state = driver.execute_script(
+            "return [document.readyState, performance.getEntriesByType('resource').length];"
+        )
+        now = time.monotonic()
+        if state != self._last_state:
+            self._last_state = state
+            self._stable_since = now
+            return False
+        return state[0] == 'complete' and now - self._stable_since >= self.quiet
+
+
+def url_contains_any(*fragments: str):
+    """Wait condition: current URL contains any of the given fragments."""
+    def _predicate(driver):
+        url = driver.current_url
+        return url if any(fragment in url for fragment in fragments) else False
+    return _predicate
+
+
+def contains_selector_xpath(selector: str) -> Optional[str]:
+    """XPath for a jQuery-style "tag:contains('text')" selector, or None for plain CSS.
+
+    :contains is not valid CSS. The XPath matches on the element's whole text,
+    so it also finds buttons whose label sits in a nested span.
+    """
+    if ":contains" not in selector:
+        return None
+    tag = selector.split(":contains")[0] or "*"
+    text = selector.split("'")[1]
+    return f"//{tag}[contains(., '{text}')]"
+
+
+# Login has settled once we leave the login route, a toast shows up or the home page renders
+LOGIN_SETTLED_SCRIPT = """
+    if (!location.hash.startsWith('#/login')) return true;
+    const toastShown = Array.from(document.querySelectorAll('.van-toast'))
+        .some(t => t.offsetParent !== null && getComputedStyle(t).display !== 'none');
+    const text = document.body.innerText.toLowerCase();
+    return toastShown || text.includes('task hall');
+"""
+
+# Language of the home page from its language switch label: 'fil', 'en', or null until the label has rendered
+HOME_LANGUAGE_SCRIPT = """
+    const text = document.body.innerText;
+    if (text.includes('Piliin ang Wika')) return 'fil';
+    return text.includes('Select Language') ? 'en' : null;
+"""
+
+# Text of the toast currently shown (the site's response to a form submit), or null
+TOAST_TEXT_SCRIPT = """
+    const toast = Array.from(document.querySelectorAll('.van-toast'))
+        .find(t => t.offsetParent !== null && getComputedStyle(t).display !== 'none');
+    return toast ? (toast.innerText.trim() || 'shown') : null;
+"""
 
 class AdWatcherBot:
     """Automation bot for task completion and WhatsApp reporting."""
     
-    def __init__(self, complete_all_steps: bool = False, method: str = 'browser', skip_browser: bool = False):
+    def __init__(self, complete_all_steps: bool = False, method: str = 'browser', skip_browser: bool = False,
+                 debug: bool = False, profile_dir: Optional[str] = None, headless: bool = False,
+                 profile_webdriver: bool = False, block_resources: bool = False):
         """Initialize the bot with environment variables and configurations."""
         load_dotenv()
 
@@ -82,12 +210,46 @@ class AdWatcherBot:
         if not all([self.username, self.password, self.fund_password]):
             raise ValueError("Missing required environment variables: WEBSITE_USERNAME, WEBSITE_PASSWORD, FUND_PASSWORD")
         
+        self.metrics = get_metrics()
+        self.metrics_path = os.getenv('METRICS_TEXTFILE', 'ad_watcher_bot.prom')
+        self.api = ApiClient(
+            self.WEBSITE_URL, self.username, self.password, self.user_agent,
+            base_url=os.getenv('API_BASE_URL'),
+            timeout=(5, float(os.getenv('API_TIMEOUT', '30'))),
+            token_cache_path=os.getenv('API_TOKEN_CACHE', '.api_token.json'),
+            token_ttl=float(os.getenv('API_TOKEN_TTL', str(6 * 3600))),
+            metrics=self.metrics,
+        )
+        
         self.is_macos = platform.system().lower() == 'darwin'
         self.complete_all_steps = complete_all_steps
         self.driver = None
         self.task_url = None
+        self.wait_timings = []
         self.tasks_screenshot = None
         self.skip_browser = skip_browser
+        self.debug = debug or os.getenv('DEBUG_ARTIFACTS', '').lower() in ('1', 'true', 'yes')
+        self.profile_dir = profile_dir or os.getenv('CHROME_PROFILE_DIR')
+        self.headless = headless
+        self._ocr = None
+        self._glyph_verifier = None
+        self._capture = None
+        self._whatsapp_detector = None
+        self.verification_mode = os.getenv('SCREENSHOT_VERIFICATION', 'tiered').lower()
+        self.tracer = Tracer()
+        self.selector_cache = SelectorCache(os.getenv('SELECTOR_CACHE', '.selector_cache.json'))
+        self.trace_dir = os.getenv('TRACE_DIR', 'traces')
+        self.history_db = os.getenv('RUN_HISTORY_DB', 'run_history.sqlite')
+        self.run_info = {'method': self.method}
+        self._cleaned_up = False
+        # Date/time the withdrawal rules (weekdays, from 9:00) are checked against; the offline e2e run pins it
+        self.clock = datetime.now
+        self.webdriver_profiler = None
+        if profile_webdriver or os.getenv('PROFILE_WEBDRIVER', '').lower() in ('1', 'true', 'yes'):
+            self.webdriver_profiler = WebDriverProfiler(top_n=int(os.getenv('WEBDRIVER_PROFILE_TOP', '10')))
+        self.resource_blocker = None
+        if block_resources or os.getenv('BLOCK_RESOURCES', '').lower() in ('1', 'true', 'yes'):
+            self.resource_blocker = ResourceBlocker()
         
         if not skip_browser:
             self._check_permissions()
@@ -97,6 +259,34 @@ class AdWatcherBot:
         else:
             logger.info("Skipping browser setup for API-only mode")
 
+    @property
+    def ocr(self):
+        """OCR engine, created on first use."""
+        if self._ocr is None:
+            self._ocr = vision.get_ocr_engine()
+        return self._ocr
+
+    @property
+    def glyph_verifier(self):
+        """Glyph template verifier, created on first use."""
+        if self._glyph_verifier is None:
+            self._glyph_verifier = vision.GlyphVerifier()
+        return self._glyph_verifier
+
+    @property
+    def whatsapp_detector(self):
+        """Tiered WhatsApp window detector, created on first use."""
+        if self._whatsapp_detector is None:
+            self._whatsapp_detector = vision.WhatsAppDetector()
+        return self._whatsapp_detector
+
+    @property
+    def capture(self):
+        """Screen capture backend, created on first use."""
+        if self._capture is None:
+            self._capture = screen_capture.get_screen_capture()
+        return self._capture
+
     def _check_permissions(self):
         """Check macOS permissions if applicable."""
         if not self.is_macos:
@@ -105,6 +295,18 @@ class AdWatcherBot:
                 self.automation_permission = self.app_launching_permission = True
             return
         
+        try:
+            from check_macos_permissions import (
+                check_screenshot_permission,
+                check_accessibility_permission,
+                check_app_launching_permission,
+                check_automation_permission
+            )
+        except ImportError:
+            logger.warning("check_macos_permissions.py not found - skipping advanced permission checks")
+            check_screenshot_permission = check_accessibility_permission = \
+                check_app_launching_permission = check_automation_permission = lambda: True
+        
         logger.info("Checking macOS permissions...")
         self.accessibility_permission = check_accessibility_permission()
         self.screenshot_permission = check_screenshot_permission()
@@ -125,14 +327,30 @@ class AdWatcherBot:
 
     def _setup_selenium(self):
         """Set up Selenium WebDriver with Chrome options."""
+        _load_selenium()
         chrome_options = Options()
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_argument(f"--user-agent={self.user_agent}")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        if self.headless:
+            width, height = HEADLESS_WINDOW_SIZE
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument(f"--window-size={width},{height}")
+            chrome_options.add_argument(f"--force-device-scale-factor={HEADLESS_SCALE_FACTOR}")
+            chrome_options.add_argument("--hide-scrollbars")
+        if self.profile_dir:
+            # Reusing a profile keeps the site's cookies/localStorage between runs
+            chrome_options.add_argument(f"--user-data-dir={os.path.abspath(self.profile_dir)}")
+            logger.info(f"Using Chrome profile: {self.profile_dir}")
+        if self.resource_blocker is not None:
+            # Blocked requests and their sizes are read back from the performance log
+            chrome_options.set_capability('goog:loggingPrefs', LOGGING_PREFS)
         
         try:
             self.driver = webdriver.Chrome(options=chrome_options)
+            self._instrument_driver()
+            self._attach_resource_blocker()
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             self._set_window_size()
             logger.info("Chrome WebDriver initialized successfully")
@@ -142,6 +360,8 @@ class AdWatcherBot:
                 from webdriver_manager.chrome import ChromeDriverManager
                 service = webdriver.chrome.service.Service(ChromeDriverManager().install())
                 self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                self._instrument_driver()
+                self._attach_resource_blocker()
                 self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
                 self._set_window_size()
                 logger.info("Chrome WebDriver initialized using webdriver-manager")
@@ -149,8 +369,73 @@ class AdWatcherBot:
                 logger.error(f"Failed to initialize Chrome WebDriver: {e2}")
                 raise
 
+    def _instrument_driver(self):
+        """Count every WebDriver command this driver sends; with the profiler on, also time it per step."""
+        execute = self.driver.execute
+
+        def counted_execute(driver_command, params=None):
+            self.metrics.inc('webdriver_commands_total', command=driver_command)
+            if self.webdriver_profiler is None:
+                return execute(driver_command, params)
+            span = self.tracer.current
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.webdriver_profiler.record(span, driver_command, time.perf_counter() - start)
+
+        self.driver.execute = counted_execute
+
+    def _attach_resource_blocker(self):
+        """Enable CDP network interception for --block-resources."""
+        if self.resource_blocker is None:
+            return
+        try:
+            self.resource_blocker.attach(self.driver)
+        except Exception as e:
+            logger.warning(f"Resource blocking unavailable: {e}")
+            self.resource_blocker = None
+
+    def _use_resource_policy(self, policy: str):
+        """Select what the next pages may load: 'read_only' (no images, fonts, trackers) or 'full'."""
+        if self.resource_blocker is None:
+            return
+        try:
+            self.resource_blocker.apply(policy)
+        except Exception as e:
+            logger.warning(f"Could not apply resource policy '{policy}': {e}")
+
+    def warm_api(self):
+        """Open the pooled API connection (TCP + TLS) and check the token with one cheap authenticated call.
+
+        api.login() makes no request once a token is in memory, e.g. one adopted from the browser.
+        """
+        self._api_user_info()
+
+    def ensure_browser(self):
+        """Start Chrome if it is not running or has stopped responding."""
+        if self.skip_browser:
+            return
+        if self.driver:
+            try:
+                self.driver.current_url
+                return
+            except Exception as e:
+                logger.warning(f"Browser not responding ({e}) - restarting")
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
+                self.driver = None
+        self._setup_selenium()
+
     def _set_window_size(self):
         """Set browser window size."""
+        if self.headless:
+            width, height = HEADLESS_WINDOW_SIZE
+            self.driver.set_window_size(width, height)
+            logger.info(f"Headless viewport set to {width}x{height} @{HEADLESS_SCALE_FACTOR}x")
+            return
         try:
             self.driver.maximize_window()
             current_size = self.driver.get_window_size()
@@ -160,27 +445,68 @@ class AdWatcherBot:
         except Exception as e:
             logger.warning(f"Could not set window size: {e}")
 
+    def _wait_until(self, condition, step: str, timeout: float = 10, replaces: float = 0,
+                    optional: bool = False):
+        """Wait for a readiness condition and record how long it took.
+
+        `replaces` is the fixed sleep this wait used to be, so the timing
+        report can show the saving. Optional waits log and return None on
+        timeout instead of raising.
+        """
+        start = time.perf_counter()
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(condition)
+        except TimeoutException:
+            if not optional:
+                raise
+            logger.warning(f"{step}: not ready after {timeout}s - continuing")
+            return None
+        finally:
+            self.wait_timings.append((step, time.perf_counter() - start, replaces))
+
+    def log_wait_report(self):
+        """Log time spent in each wait compared with the fixed sleep it replaced."""
+        if not self.wait_timings:
+            return
+        logger.info(f"{'Step':<40} {'Waited':>8} {'Was':>6} {'Saved':>8}")
+        for step, waited, replaces in self.wait_timings:
+            logger.info(f"{step:<40} {waited:>7.2f}s {replaces:>5.0f}s {replaces - waited:>+7.2f}s")
+        waited_total = sum(waited for _, waited, _ in self.wait_timings)
+        replaced_total = sum(replaces for _, _, replaces in self.wait_timings)
+        logger.info(f"{'Total':<40} {waited_total:>7.2f}s {replaced_total:>5.0f}s {replaced_total - waited_total:>+7.2f}s")
+
+    @traced()
     def login_to_website(self):
         """Log in to website using credentials from .env."""
+        self._use_resource_policy('read_only')
+        if self.profile_dir and self._has_valid_session():
+            logger.info("Existing session still valid - skipping login")
+            self._share_browser_session()
+            # The session check left us on the user page; the next steps start from home
+            self.driver.get(self.WEBSITE_URL)
+            return
+        
         logger.info("Logging into website...")
         
         try:
             self.driver.get(self.LOGIN_URL)
             WebDriverWait(self.driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            time.sleep(3)
             
             # Click button to reveal login form
             try:
-                dialog_button = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, ".van-button"))
+                dialog_button = self._wait_until(
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, ".van-button")), "login: dialog button", replaces=3
                 )
                 dialog_button.click()
-                time.sleep(2)
+                self._wait_until(
+                    EC.visibility_of_element_located((By.CSS_SELECTOR, "input[type='tel'], input[type='password']")),
+                    "login: form fields", replaces=2, optional=True
+                )
             except Exception as e:
                 logger.warning(f"Could not find dialog button: {e}")
             
             # Find login fields
-            username_field = self._find_field([
+            username_field = self._find_field('username', [
                 "input[type='tel']",
                 "input[placeholder='Ilagay ang Numero ng Telepono']",
                 "input[placeholder*='Numero ng Telepono']",
@@ -190,7 +516,7 @@ class AdWatcherBot:
                 "#username"
             ])
             
-            password_field = self._find_field([
+            password_field = self._find_field('password', [
                 "input[placeholder='Ilagay ang Password sa Pag-login']",
                 "input[type='password']",
                 ".van-field__control",
@@ -211,23 +537,65 @@ class AdWatcherBot:
             # Verify login
             self._verify_login()
             logger.info("Login successful")
+            self._share_browser_session()
             
         except Exception as e:
             logger.error(f"Login failed: {e}")
             self.driver.save_screenshot("login_error.png")
             raise
 
-    def _find_field(self, selectors: list) -> Optional[webdriver.remote.webelement.WebElement]:
-        """Find the first visible field matching any of the provided selectors."""
-        for selector in selectors:
+    def _share_browser_session(self):
+        """In hybrid mode, let the API client reuse the browser's login token."""
+        if self.method != 'hybrid':
+            return
+        try:
+            session = self.driver.execute_script(BROWSER_SESSION_SCRIPT) or {}
+        except Exception as e:
+            logger.warning(f"Could not read browser session: {e}")
+            session = {}
+        if session.get('token'):
+            self.api.adopt_token(**{key: value for key, value in session.items() if value})
+            logger.info("API client using the browser session token")
+        else:
+            logger.warning("No token in browser storage - API client will log in separately")
+
+    def _has_valid_session(self) -> bool:
+        """Check whether the reused profile is still logged in.
+
+        The user page needs a session, so the site sends expired sessions
+        back to the login route.
+        """
+        try:
+            self.driver.get(self.USER_PAGE_URL)
+            self._wait_until(NetworkIdle(), "login: check saved session", optional=True)
+            if "#/login" in self.driver.current_url:
+                logger.info("Saved session expired - logging in again")
+                return False
+            return True
+        except Exception as e:
+            logger.warning(f"Could not check saved session: {e}")
+            return False
+
+    def _find_field(self, field_name: str, selectors: list) -> Optional[webdriver.remote.webelement.WebElement]:
+        """Find the first visible field matching any of the provided selectors.
+
+        The selector that worked last time for this field is tried first.
+        """
+        for selector in self.selector_cache.ordered(field_name, selectors):
             try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                xpath = contains_selector_xpath(selector)
+                if xpath:
+                    elements = self.driver.find_elements(By.XPATH, xpath)
+                else:
+                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
                 for element in elements:
                     if element.is_displayed():
-                        logger.info(f"Found field with selector: {selector}")
+                        logger.info(f"Found {field_name} with selector: {selector}")
+                        self.selector_cache.record(field_name, selector)
                         return WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(element))
             except NoSuchElementException:
                 continue
+        self.selector_cache.record(field_name, None)
         return None
 
     def _input_credentials(self, field: webdriver.remote.webelement.WebElement, value: str):
@@ -253,18 +621,10 @@ class AdWatcherBot:
             "#login-button"
         ]
         
-        login_button = None
-        for selector in login_button_selectors:
-            try:
-                if ":contains" in selector:
-                    text = selector.split("'")[1]
-                    login_button = self.driver.find_element(By.XPATH, f"//button[contains(text(), '{text}')]")
-                else:
-                    login_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                if login_button.is_displayed():
-                    break
-            except NoSuchElementException:
-                continue
+        try:
+            login_button = self._find_field('login_button', login_button_selectors)
+        except TimeoutException:
+            login_button = None
         
         if login_button:
             self.driver.execute_script("arguments[0].scrollIntoView(true);", login_button)
@@ -280,7 +640,7 @@ class AdWatcherBot:
 
     def _verify_login(self):
         """Verify login success or handle errors."""
-        time.sleep(3)
+        self._wait_until(lambda d: d.execute_script(LOGIN_SETTLED_SCRIPT), "login: result", replaces=3, optional=True)
         toast_elements = self.driver.find_elements(By.CSS_SELECTOR, ".van-toast")
         for toast in toast_elements:
             if "display: none" not in (toast.get_attribute("style") or "") and toast.is_displayed():
@@ -304,23 +664,28 @@ class AdWatcherBot:
         else:
             logger.warning("Login status unclear - proceeding with caution")
 
+    @traced()
     def change_language_to_english(self):
         """Change website language to English."""
         logger.info("Changing language to English...")
         
         try:
+            language = self._wait_until(lambda d: d.execute_script(HOME_LANGUAGE_SCRIPT), "language: home page")
+            if language == 'en':
+                logger.info("Site already in English")
+                return
             language_button = WebDriverWait(self.driver, 10).until(
                 EC.element_to_be_clickable((By.XPATH, "//span[contains(text(), 'Piliin ang Wika')]"))
             )
             language_button.click()
             WebDriverWait(self.driver, 10).until(EC.url_contains("#/language"))
-            time.sleep(2)
             
-            english_option = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'van-cell--clickable')]//span[text()='English']"))
+            english_option = self._wait_until(
+                EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'van-cell--clickable')]//span[text()='English']")),
+                "language: English option", replaces=2
             )
             english_option.click()
-            time.sleep(3)
+            self._wait_until(lambda d: "#/language" not in d.current_url, "language: back to home", replaces=3, optional=True)
             
             WebDriverWait(self.driver, 5).until_not(
                 EC.presence_of_element_located((By.XPATH, "//span[contains(text(), 'Piliin ang Wika')]"))
@@ -329,17 +694,20 @@ class AdWatcherBot:
         except Exception as e:
             logger.warning(f"Failed to change language: {e}")
 
+    @traced()
     def check_account_identity(self) -> str:
         """Check account identity (e.g., Internship, VIP1)."""
         logger.info("Checking account identity...")
         
         try:
-            self.driver.get(self.USER_PAGE_URL)
-            time.sleep(3)
-            identity_element = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//div//p[text()='Your Identity']/following-sibling::p"))
-            )
-            identity_text = identity_element.text.strip()
+            if self.method == 'hybrid':
+                identity_text = self._api_user_info()['useridentity']
+            else:
+                self._use_resource_policy('read_only')
+                self.driver.get(self.USER_PAGE_URL)
+                identity_text = self._wait_until(
+                    ValuesPresent(identity=dom_extract.USER_IDENTITY), "identity: user page", replaces=3
+                )['identity']
             for option in ["Internship", "VIP1", "VIP2", "VIP3", "VIP4", "VIP5", "VIP6", "VIP7", "VIP8", "VIP9"]:
                 if option in identity_text:
                     logger.info(f"Account identity: {option}")
@@ -350,29 +718,30 @@ class AdWatcherBot:
             logger.error(f"Error checking identity: {e}")
             return self.default_identity
 
+    @traced()
     def navigate_to_task_button(self, identity: str):
         """Navigate to the task button based on account identity."""
         logger.info(f"Navigating to {identity} task button...")
         
         try:
+            # The task list it opens is screenshotted and its task images are clicked
+            self._use_resource_policy('full')
             self.driver.get(self.WEBSITE_URL)
-            time.sleep(3)
-            task_button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, f"//div[@class='TaskHall']//div[contains(@class, 'van-grid-item__content') and contains(text(), '{identity}')]"))
+            task_button = self._wait_until(
+                EC.element_to_be_clickable((By.XPATH, f"//div[@class='TaskHall']//div[contains(@class, 'van-grid-item__content') and contains(text(), '{identity}')]")),
+                "task button: home page", replaces=3
             )
             self.driver.execute_script("arguments[0].scrollIntoView(true);", task_button)
             task_button.click()
             logger.info(f"{identity} task button clicked")
             
-            self.task_url = self.driver.current_url
-            while "taskList" not in self.task_url:
-                self.task_url = self.driver.current_url
-                time.sleep(1)
+            self.task_url = self._wait_until(url_contains_any("taskList"), "task button: task list URL", timeout=30)
             logger.info(f"Task list URL: {self.task_url}")
         except Exception as e:
             logger.error(f"Error navigating to task button: {e}")
             raise
 
+    @traced()
     def setup_task_prerequisites(self):
         """Set up prerequisites for task execution."""
         logger.info("Setting up task prerequisites...")
@@ -380,6 +749,7 @@ class AdWatcherBot:
         user_identity = self.check_account_identity()
         self.navigate_to_task_button(user_identity)
 
+    @traced()
     def start_tasks(self) -> bool:
         """Execute tasks until none remain or progress stalls."""
         logger.info("Starting task execution...")
@@ -388,62 +758,71 @@ class AdWatcherBot:
         stalled_attempts = 0
         last_tasks_remaining = -1
         tasks_completed = 0
+        attempt = 0
         
         while stalled_attempts < max_stalled_attempts:
+            attempt += 1
             try:
-                time.sleep(3)
-                tasks_remaining = self._get_tasks_remaining()
-                if tasks_remaining == 0:
-                    logger.info("All tasks completed for today")
-                    return tasks_completed > 0
-                
-                if last_tasks_remaining != -1 and tasks_remaining >= last_tasks_remaining:
-                    stalled_attempts += 1
-                    logger.warning(f"Task count did not decrease. Stalled attempt {stalled_attempts}/{max_stalled_attempts}")
-                else:
-                    stalled_attempts = 0
-                last_tasks_remaining = tasks_remaining
+                with self.tracer.span("task", attempt=attempt) as task_span:
+                    self._wait_until(NetworkIdle(), "tasks: task list settled", replaces=3, optional=True)
+                    tasks_remaining = self._get_tasks_remaining()
+                    task_span.set_attribute("tasks_remaining", tasks_remaining)
+                    self.metrics.set('tasks_remaining', tasks_remaining)
+                    if tasks_remaining == 0:
+                        logger.info("All tasks completed for today")
+                        self.run_info.update(tasks_completed=tasks_completed, stalled_attempts=stalled_attempts)
+                        return tasks_completed > 0
                 
-                if stalled_attempts >= max_stalled_attempts:
-                    logger.error("Task loop stalled. Aborting.")
-                    break
+                    if last_tasks_remaining != -1 and tasks_remaining >= last_tasks_remaining:
+                        stalled_attempts += 1
+                        self.metrics.inc('task_stalled_attempts_total')
+                        logger.warning(f"Task count did not decrease. Stalled attempt {stalled_attempts}/{max_stalled_attempts}")
+                    else:
+                        stalled_attempts = 0
+                    last_tasks_remaining = tasks_remaining
                 
-                task_items = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".task-list .van-list .van-grid .van-grid-item"))
-                )
-                valid_tasks = [item for item in task_items if item.is_displayed() and item.find_elements(By.TAG_NAME, "img")]
+                    if stalled_attempts >= max_stalled_attempts:
+                        logger.error("Task loop stalled. Aborting.")
+                        break
                 
-                if not valid_tasks:
-                    raise Exception("No valid tasks found")
+                    task_items = WebDriverWait(self.driver, 10).until(
+                        EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".task-list .van-list .van-grid .van-grid-item"))
+                    )
+                    valid_tasks = [item for item in task_items if item.is_displayed() and item.find_elements(By.TAG_NAME, "img")]
                 
-                valid_tasks[0].click()
-                time.sleep(3)
+                    if not valid_tasks:
+                        raise Exception("No valid tasks found")
                 
-                new_url = self.driver.current_url
-                if "/task/video/" in new_url:
-                    self.handle_video_and_submit()
-                    tasks_completed += 1
-                elif "/myTask" in new_url:
-                    self._handle_in_progress_task()
-                    tasks_completed += 1
-                else:
-                    raise Exception(f"Unexpected URL: {new_url}")
+                    valid_tasks[0].click()
+                    new_url = self._wait_until(
+                        url_contains_any("/task/video/", "/myTask"), "tasks: open task", replaces=3, optional=True
+                    ) or self.driver.current_url
+                    task_span.set_attribute("url", new_url)
+                    if "/task/video/" in new_url:
+                        self.handle_video_and_submit()
+                        tasks_completed += 1
+                    elif "/myTask" in new_url:
+                        self._handle_in_progress_task()
+                        tasks_completed += 1
+                    else:
+                        raise Exception(f"Unexpected URL: {new_url}")
                 
             except Exception as e:
                 logger.error(f"Task execution error: {e}")
                 self.driver.save_screenshot("task_error.png")
                 stalled_attempts += 1
+                self.metrics.inc('task_stalled_attempts_total')
+                self.metrics.inc('retries_total', kind='task')
                 self.navigate_to_task_list()
         
+        self.run_info.update(tasks_completed=tasks_completed, stalled_attempts=stalled_attempts)
         return tasks_completed > 0
 
     def _get_tasks_remaining(self) -> int:
         """Get the number of tasks remaining today."""
         try:
-            element = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//span[text()='Tasks Remaining Today']/preceding-sibling::div//span"))
-            )
-            return int(element.text.strip())
+            values = WebDriverWait(self.driver, 10).until(ValuesPresent(remaining=dom_extract.TASKS_REMAINING))
+            return int(values['remaining'])
         except Exception as e:
             logger.error(f"Error getting tasks remaining: {e}")
             self.driver.save_screenshot("tasks_remaining_error.png")
@@ -451,6 +830,7 @@ class AdWatcherBot:
 
     def navigate_to_task_list(self):
         """Navigate to the task list page."""
+        self._use_resource_policy('full')
         if "taskList" not in self.driver.current_url:
             logger.info("Navigating to task list...")
             self.driver.get(self.task_url)
@@ -458,6 +838,7 @@ class AdWatcherBot:
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".task-list .van-list .van-grid .van-grid-item"))
             )
 
+    @traced()
     def handle_video_and_submit(self):
         """Handle video playback and submission."""
         logger.info("Handling video task...")
@@ -482,7 +863,10 @@ class AdWatcherBot:
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
                 element.click()
                 logger.info(f"Video started with selector: {selector}")
-                time.sleep(3)
+                self._wait_until(
+                    EC.presence_of_element_located((By.XPATH, "//p[contains(text(), 'Currently watched')]")),
+                    "video: playback started", replaces=3, optional=True
+                )
                 return
             except Exception:
                 continue
@@ -502,7 +886,6 @@ class AdWatcherBot:
             requirement = WebDriverWait(self.driver, 5).until(
                 EC.presence_of_element_located((By.XPATH, "//p[contains(text(), 'Watch') and contains(text(), 'seconds')]"))
             )
-            import re
             numbers = re.findall(r'\d+', requirement.text)
             if numbers:
                 required_seconds = int(numbers[0])
@@ -512,6 +895,29 @@ class AdWatcherBot:
         
         max_wait = 600
         start_time = time.time()
+        
+        # Let the page notify us instead of polling; each call blocks for up to one chunk
+        chunk = 60
+        self.driver.set_script_timeout(chunk + 10)
+        try:
+            while time.time() - start_time < max_wait:
+                remaining = max_wait - (time.time() - start_time)
+                result = self.driver.execute_async_script(
+                    WATCH_PROGRESS_SCRIPT, required_seconds, int(min(chunk, remaining) * 1000)
+                )
+                logger.info(f"Progress: {result.get('watched')}/{required_seconds} seconds")
+                if result.get('reached'):
+                    return required_seconds
+        except Exception as e:
+            logger.warning(f"Event-driven progress monitor failed, falling back to polling: {e}")
+            return self._poll_video_progress(required_seconds, max_wait - (time.time() - start_time))
+        
+        logger.warning("Video progress monitoring timed out")
+        return required_seconds
+
+    def _poll_video_progress(self, required_seconds: int, max_wait: float) -> int:
+        """Poll the progress text once per second until the requirement is met."""
+        start_time = time.time()
         last_watched = 0
         
         while time.time() - start_time < max_wait:
@@ -544,7 +950,7 @@ class AdWatcherBot:
             "#submit"
         ]
         
-        submit_button = self._find_field(selectors)
+        submit_button = self._find_field('submit_button', selectors)
         if not submit_button:
             self.driver.save_screenshot("submit_button_error.png")
             raise Exception("Submit button not found")
@@ -570,8 +976,7 @@ class AdWatcherBot:
             button = pane.find_element(By.CSS_SELECTOR, ".van-list .van-cell .TaskItem button")
             if "submit" in button.text.lower():
                 button.click()
-                time.sleep(3)
-                if "/task/video/" in self.driver.current_url:
+                if self._wait_until(url_contains_any("/task/video/"), "tasks: resume task", replaces=3, optional=True):
                     self.handle_video_and_submit()
                 else:
                     raise Exception("Did not navigate to video page after clicking 'Submit'")
@@ -581,12 +986,19 @@ class AdWatcherBot:
             logger.error(f"Error handling in-progress task: {e}")
             raise
 
+    @traced()
     def wait_and_screenshot(self):
         """Take screenshot of task list page and verify task completion."""
+        png, tasks_completed = self.capture_tasks_screenshot()
+        self.verify_tasks_screenshot(png, tasks_completed)
+
+    @traced()
+    def capture_tasks_screenshot(self) -> Tuple[bytes, int]:
+        """Open the task list, save the screenshot and return it with the DOM's completed count."""
         logger.info("Taking task list screenshot...")
         
         self.navigate_to_task_list()
-        time.sleep(5)
+        self._wait_until(NetworkIdle(), "screenshot: task list settled", replaces=5, optional=True)
         
         try:
             WebDriverWait(self.driver, 10).until(
@@ -597,66 +1009,54 @@ class AdWatcherBot:
             logger.warning("Timeout waiting for images to load")
         
         tasks_completed = self._get_tasks_completed()
-        screenshot_path = 'tasks_screenshot.png'
-        self.driver.save_screenshot(screenshot_path)
-        
-        # Verify screenshot text
-        screenshot = Image.open(screenshot_path).crop((720, 100, 1420, 325))
-        img = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
-        img = cv2.resize(img, None, fx=2, fy=2)
-        img = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        img = cv2.threshold(img, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
-        cv2.imwrite("debug_tasks_screenshot.png", img)
-
-        # Split image into two parts
-        height, width = img.shape[:2]
-        img1 = img[int(height*0.2):int(height*0.6), int(width*0.45):int(width*0.6)]
-        img2 = img[int(height*0.6):height, 0:width]
-
-        # Optimize img1 for single digit OCR
-        h, w = img1.shape
-        target_height = 32  # Optimal height for digit recognition
-        if h != target_height:
-            scale = target_height / h
-            new_w = int(w * scale)
-            img1 = cv2.resize(img1, (new_w, target_height), interpolation=cv2.INTER_CUBIC)
-
-        # Add padding around the digit
-        img1 = cv2.copyMakeBorder(img1, 10, 10, 10, 10, cv2.BORDER_CONSTANT, value=255)
-        cv2.imwrite("debug_tasks_screenshot_part1.png", img1)
-        cv2.imwrite("debug_tasks_screenshot_part2.png", img2)
+        screenshot_path = TASKS_SCREENSHOT_PATH
+        png = self.driver.get_screenshot_as_png()
+        with open(screenshot_path, 'wb') as f:
+            f.write(png)
+        logger.info(f"Screenshot saved: {screenshot_path}")
+        return png, tasks_completed
+
+    @traced()
+    def verify_tasks_screenshot(self, png: bytes, tasks_completed: int):
+        """Check that the screenshot shows the completed count; needs no browser."""
+        screenshot_path = TASKS_SCREENSHOT_PATH
+        binary, img1, img2 = vision.preprocess_tasks_screenshot(vision.decode_png(png))
+        self._save_debug_image("debug_tasks_screenshot.png", binary)
+        self._save_debug_image("debug_tasks_screenshot_part1.png", img1)
+        self._save_debug_image("debug_tasks_screenshot_part2.png", img2)
         
-        for psm in [7, 10, 6, 11]:
-            # Config for part1: Digit whitelist + PSM for single digit/line
-            config1 = f"--oem 3 --psm {psm} -c tessedit_char_whitelist=0123456789"
-            text1 = pytesseract.image_to_string(img1, config=config1).strip().replace("\n", "")
-
-            # If OEM 3 fails, try legacy engine for part1
-            if not text1.isdigit():
-                config1_legacy = f"--oem 1 --psm {psm} -c tessedit_char_whitelist=0123456789"
-                text1 = pytesseract.image_to_string(img1, config=config1_legacy).strip().replace("\n", "")
-
-            # Config for part2: Standard config (since it's working)
-            config2 = f"--oem 3 --psm {psm}"
-            text2 = pytesseract.image_to_string(img2, config=config2).strip().replace("\n", "")
-            text = f"{text1} {text2}"
-            logger.info(f"Tasks page screenshot text with PSM {psm}: {text}")
-            if f'{tasks_completed} Tasks Completed Today' in text:
-                logger.info(f"Screenshot verified with PSM {psm}")
-                break
+        # DOM already gave us the count; confirm the pixels cheaply before paying for tesseract
+        if self.verification_mode == 'tiered' and self.glyph_verifier.verify(img1, img2, tasks_completed):
+            logger.info("Screenshot verified via glyph template match")
+            self.glyph_verifier.record('template')
+        elif self._ocr_verify_tasks(img1, img2, tasks_completed):
+            self.glyph_verifier.learn(img1, img2, tasks_completed)
+            self.glyph_verifier.record('tesseract')
         else:
+            self.glyph_verifier.record('failed')
             raise Exception(f"Screenshot does not contain '{tasks_completed} Tasks Completed Today'")
         
         self.tasks_screenshot = screenshot_path
-        logger.info(f"Screenshot saved: {screenshot_path}")
+        logger.info(f"Screenshot verified: {screenshot_path}")
+
+    def _ocr_verify_tasks(self, img1: np.ndarray, img2: np.ndarray, tasks_completed: int) -> bool:
+        """Verify the task count with tesseract, trying several page segmentation modes."""
+        psm = vision.ocr_task_count(self.ocr, img1, img2, tasks_completed)
+        if psm is None:
+            return False
+        logger.info(f"Screenshot verified with PSM {psm}")
+        return True
+
+    def _save_debug_image(self, filename: str, img: np.ndarray):
+        """Write an intermediate image to disk only when debug artifacts are enabled."""
+        if self.debug:
+            cv2.imwrite(filename, img)
 
     def _get_tasks_completed(self) -> int:
         """Get the number of tasks completed today."""
         try:
-            element = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//span[text()='Tasks Completed Today']/preceding-sibling::div//span"))
-            )
-            return int(element.text.strip())
+            values = WebDriverWait(self.driver, 10).until(ValuesPresent(completed=dom_extract.TASKS_COMPLETED))
+            return int(values['completed'])
         except Exception as e:
             logger.error(f"Error getting tasks completed: {e}")
             raise
@@ -684,31 +1084,12 @@ class AdWatcherBot:
         
         # Visual detection
         try:
-            screenshot = pyautogui.screenshot()
-            whatsapp_green = (37, 211, 102)
-            tolerance = 30
-            width, height = screenshot.size
-            sample_points = [
-                (width // 4, height // 10),
-                (width // 10, height // 4),
-                (width // 2, height // 10),
-                (50, 50),
-                (100, 100)
-            ]
-            
-            green_pixels = sum(
-                1 for x, y in sample_points
-                if 0 <= x < width and 0 <= y < height
-                and all(abs(screenshot.getpixel((x, y))[i] - whatsapp_green[i]) <= tolerance for i in range(3))
+            screenshot = self.capture.grab()
+            tier = vision.get_frame_cache().get_or_compute(
+                'whatsapp_visible', screenshot, lambda: self.whatsapp_detector.detect(screenshot, self.ocr)
             )
-            
-            if green_pixels >= 2:
-                logger.info("WhatsApp detected via color signature")
-                return True
-            
-            text = pytesseract.image_to_string(screenshot, lang='eng').lower()
-            if any(indicator in text for indicator in ['whatsapp', 'chats']):
-                logger.info("WhatsApp detected via OCR")
+            if tier:
+                logger.info(f"WhatsApp detected via {tier} (window at {self.whatsapp_detector.geometry})")
                 return True
         except Exception as e:
             logger.warning(f"Visual detection failed: {e}")
@@ -716,6 +1097,7 @@ class AdWatcherBot:
         logger.warning("WhatsApp not detected")
         return False
 
+    @traced()
     def open_whatsapp(self):
         """Open WhatsApp and ensure it's visible."""
         logger.info("Opening WhatsApp...")
@@ -785,6 +1167,7 @@ class AdWatcherBot:
                     elif retry == 'q':
                         raise KeyboardInterrupt("User quit")
 
+    @traced()
     def navigate_and_send_message(self):
         """Navigate WhatsApp and send screenshots."""
         logger.info("Navigating WhatsApp and sending message...")
@@ -861,24 +1244,32 @@ class AdWatcherBot:
             return False
         
         try:
-            screenshot = pyautogui.screenshot(region=(445, 905, 1024, 50))
-            img = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
-            img = cv2.resize(img, None, fx=2, fy=2)
-            img = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-            img = cv2.threshold(img, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)[1]
-            cv2.imwrite("debug_whatsapp_chatbox.png", img)
-            
-            text = pytesseract.image_to_string(img, lang='eng').strip()
-            return any(msg in text for msg in ["Only admins can send messages", "Only admins"])
+            screenshot = self.capture.grab(region=vision.ADMIN_MESSAGE_REGION)
+            # The retry loop re-checks an unchanged message box; reuse the last verdict
+            return vision.get_frame_cache().get_or_compute(
+                'admin_message', screenshot, lambda: self._read_admin_message(screenshot)
+            )
         except Exception as e:
             logger.warning(f"Admin message check failed: {e}")
             return False
 
+    def _read_admin_message(self, region: np.ndarray) -> bool:
+        """OCR the message box and look for the admins-only notice."""
+        img = vision.preprocess_chatbox(region)
+        self._save_debug_image("debug_whatsapp_chatbox.png", img)
+        text = self.ocr.image_to_string(img).strip()
+        return vision.contains_admin_message(text)
+
+    @traced()
     def check_balance_and_withdraw(self):
         """Check balance and withdraw if possible."""
+        if self.method == 'hybrid':
+            # Balance, records and the withdrawal itself are plain API calls
+            self.complete_withdrawal_via_api()
+            return
         logger.info("Checking balance and withdrawal...")
         
-        current_time = datetime.now()
+        current_time = self.clock()
         if current_time.weekday() > 4:
             logger.info(f"Today is {current_time.strftime('%A')} - no withdrawals on weekends")
             return
@@ -889,24 +1280,19 @@ class AdWatcherBot:
             time.sleep(time_until_9am)
         
         try:
+            self._use_resource_policy('read_only')
             self.driver.get(self.USER_PAGE_URL)
-            time.sleep(3)
-            balance = float(WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//div//p[text()='Personal Balance(PHP)']/following-sibling::p"))
-            ).text.strip())
+            balance = float(self._wait_until(
+                ValuesPresent(balance=dom_extract.PERSONAL_BALANCE), "withdrawal: user page", replaces=3
+            )['balance'])
+            self.run_info['balance'] = balance
             logger.info(f"Balance: {balance} PHP")
             
             if balance < float(self.withdrawal_amount):
                 logger.info("Balance insufficient for withdrawal")
                 return
             
-            self.driver.get(self.WALLET_PAGE_URL)
-            time.sleep(3)
-            withdrawal_tab = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'van-tab')]//span[text()='Withdrawal Records']"))
-            )
-            withdrawal_tab.click()
-            time.sleep(3)
+            self._open_withdrawal_records()
             
             today = current_time.strftime('%d-%m-%Y')
             if self._has_withdrawal_today(today):
@@ -919,28 +1305,45 @@ class AdWatcherBot:
             logger.error(f"Withdrawal process failed: {e}")
             self.driver.save_screenshot("withdrawal_error.png")
 
+    def _open_withdrawal_records(self):
+        """Open the wallet page on the Withdrawal Records tab and wait for it to load."""
+        self.driver.get(self.WALLET_PAGE_URL)
+        withdrawal_tab = self._wait_until(
+            EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'van-tab')]//span[text()='Withdrawal Records']")),
+            "withdrawal: wallet page", replaces=3
+        )
+        withdrawal_tab.click()
+        # Not optional: reading the list before it loaded would look like "no withdrawal today"
+        state = self._wait_until(dom_extract.WithdrawalRecordsLoaded(), "withdrawal: records loaded",
+                                 timeout=20, replaces=3)
+        logger.info(f"Withdrawal records loaded ({state})")
+
+    def _find_withdrawal_record(self, today: str) -> Optional[dict]:
+        """Return today's row from the Withdrawal Records tab, read in one round-trip."""
+        for record in dom_extract.withdrawal_records(self.driver):
+            if record['date'] and today in record['date']:
+                return record
+        return None
+
     def _has_withdrawal_today(self, today: str) -> bool:
-        """Check if a withdrawal was made today."""
-        try:
-            items = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'FundItem') and contains(@class, 'van-cell')]")
-            for item in items:
-                date_text = item.find_element(By.XPATH, ".//span[contains(text(), '-')]").text.strip()
-                if today in date_text:
-                    amount = item.find_element(By.XPATH, ".//span[contains(@class, 'money-withdraw')]").text.strip()
-                    status = item.find_element(By.XPATH, ".//span[contains(@style, 'color: gray')]").text.strip()
-                    logger.info(f"Today's withdrawal: Date={date_text}, Amount={amount}, Status={status}")
-                    return True
-            return False
-        except Exception as e:
-            logger.warning(f"Error checking withdrawal records: {e}")
-            return False
+        """Check if a withdrawal was made today.
+
+        Errors propagate: treating an unreadable list as "no withdrawal"
+        would submit a second one.
+        """
+        record = self._find_withdrawal_record(today)
+        if record:
+            logger.info(f"Today's withdrawal: Date={record['date']}, Amount={record['amount']}, Status={record['status']}")
+            self.run_info['withdrawal_status'] = record['status']
+            return True
+        return False
 
     def _perform_withdrawal(self):
         """Perform the withdrawal process."""
         self.driver.get(self.WITHDRAW_PAGE_URL)
-        time.sleep(3)
-        amount_button = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, f"//div[contains(@class, 'van-grid-item__content') and normalize-space(text()) = '{self.withdrawal_amount}']"))
+        amount_button = self._wait_until(
+            EC.element_to_be_clickable((By.XPATH, f"//div[contains(@class, 'van-grid-item__content') and normalize-space(text()) = '{self.withdrawal_amount}']")),
+            "withdrawal: withdraw page", replaces=3
         )
         amount_button.click()
         logger.info(f"Selected {self.withdrawal_amount} PHP withdrawal")
@@ -952,28 +1355,24 @@ class AdWatcherBot:
         submit_button = self.driver.find_element(By.XPATH, "//button[contains(@class, 'van-button--danger') and .//span[text()='Submit']]")
         submit_button.click()
         logger.info("Withdrawal submitted")
-        time.sleep(3)
+        # Wait for the site's answer rather than network idle, so the submit is never cut off by navigating away
+        message = self._wait_until(lambda d: d.execute_script(TOAST_TEXT_SCRIPT), "withdrawal: submit result",
+                                   timeout=15, replaces=3)
+        logger.info(f"Withdrawal response: {message}")
 
     def _verify_withdrawal(self, today: str):
         """Verify the withdrawal was successful."""
-        self.driver.get(self.WALLET_PAGE_URL)
-        time.sleep(3)
-        withdrawal_tab = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'van-tab')]//span[text()='Withdrawal Records']"))
-        )
-        withdrawal_tab.click()
-        time.sleep(3)
+        self._open_withdrawal_records()
         
-        items = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'FundItem') and contains(@class, 'van-cell')]")
-        for item in items:
-            date_text = item.find_element(By.XPATH, ".//span[contains(text(), '-')]").text.strip()
-            if today in date_text:
-                status = item.find_element(By.XPATH, ".//span[contains(@style, 'color: gray')]").text.strip()
-                logger.info(f"Withdrawal verified: Status={status}")
-                return
+        record = self._find_withdrawal_record(today)
+        if record:
+            logger.info(f"Withdrawal verified: Status={record['status']}")
+            self.run_info['withdrawal_status'] = record['status']
+            return
         logger.warning("No withdrawal found after submission")
         self.driver.save_screenshot("withdrawal_verification_error.png")
 
+    @traced()
     def send_image_to_whatsapp(self, image_path: str, caption: str) -> bool:
         """Send an image to WhatsApp with a caption."""
         os_name = platform.system().lower()
@@ -1061,6 +1460,7 @@ class AdWatcherBot:
                 logger.warning(f"Generic image sending failed: {e}")
                 return False
 
+    @traced()
     def close_whatsapp(self):
         """Close WhatsApp application."""
         logger.info("Closing WhatsApp...")
@@ -1073,48 +1473,24 @@ class AdWatcherBot:
         except Exception as e:
             logger.warning(f"Error closing WhatsApp: {e}")
 
+    @traced()
     def complete_tasks_via_api(self) -> bool:
         """Complete tasks using API method."""
         logger.info("Completing tasks via API...")
         
-        session = requests.Session()
-        headers = {
-            'accept': 'application/json, text/plain, */*',
-            'content-type': 'application/x-www-form-urlencoded',
-            'origin': self.WEBSITE_URL,
-            'referer': f'{self.WEBSITE_URL}/',
-            'user-agent': self.user_agent,
-        }
-        
-        login_data = {
-            'username': self.username,
-            'password': self.password,
-            'language': 'fil_ph',
-            'referer': self.LOGIN_URL,
-        }
-        
         try:
-            login_resp = session.post('https://api.aksystemph.com/api/User/login', headers=headers, data=login_data)
-            login_resp.raise_for_status()
-            login_json = login_resp.json()
-            if login_json.get('code') != 1:
-                raise Exception(f"API login error: {login_json}")
-            
-            token = login_json['data']['token']
-            task_num = login_json['data']['task_num']
-            level = login_json['data']['level']
-            logger.info(f"API login successful. Identity: {login_json['data']['useridentity']}, Level: {level}")
+            login_data = self.api.login()
+            task_num = login_data['task_num']
+            level = login_data['level']
+            task_list_referer = f'{self.WEBSITE_URL}/#/taskList/{task_num}/{level}'
+            submitted = 0
             
             while True:
-                task_list_data = {
+                task_list_resp = self.api.post('/api/Task/getTaskList', {
                     'id': str(task_num),
                     'task_level': str(level),
                     'page_no': '1',
-                    'language': 'fil_ph',
-                    'referer': f'{self.WEBSITE_URL}/#/taskList/{task_num}/{level}',
-                    'token': token,
-                }
-                task_list_resp = session.post('https://api.aksystemph.com/api/Task/getTaskList', headers=headers, data=task_list_data)
+                }, referer=task_list_referer)
                 task_list_resp.raise_for_status()
                 task_list_json = task_list_resp.json()
                 
@@ -1124,47 +1500,41 @@ class AdWatcherBot:
                 
                 tasks_remaining = task_list_json['data']['taskNumArr'][0] if task_list_json['data']['taskNumArr'] else 0
                 logger.info(f"Tasks remaining: {tasks_remaining}")
+                self.metrics.set('tasks_remaining', tasks_remaining)
                 
                 if not task_list_json['data']['list'] or tasks_remaining == 0:
                     logger.info("No tasks available via API")
                     break
                 
                 task_id = task_list_json['data']['list'][0]['id']
-                receive_data = {
-                    'id': str(task_id),
-                    'language': 'fil_ph',
-                    'referer': f'{self.WEBSITE_URL}/#/taskList/{task_num}/{level}',
-                    'token': token,
-                }
-                receive_resp = session.post('https://api.aksystemph.com/api/Task/receiveTask', headers=headers, data=receive_data)
+                receive_resp = self.api.post('/api/Task/receiveTask', {'id': str(task_id)}, referer=task_list_referer)
                 if receive_resp.status_code != 200 or receive_resp.json().get('code') != 1:
                     logger.warning(f"Failed to receive task {task_id}: {receive_resp.text}")
                     continue
                 
-                submit_data = {
+                submit_resp = self.api.post('/api/Task/submitTask', {
                     'id': str(task_id),
                     'seconds': '11',
-                    'language': 'fil_ph',
-                    'referer': f'{self.WEBSITE_URL}/#/task/video/{task_id}',
-                    'token': token,
-                }
-                submit_resp = session.post('https://api.aksystemph.com/api/Task/submitTask', headers=headers, data=submit_data)
+                }, referer=f'{self.WEBSITE_URL}/#/task/video/{task_id}')
                 if submit_resp.status_code == 200 and submit_resp.json().get('code') == 1:
                     logger.info(f"Task {task_id} submitted successfully")
+                    submitted += 1
                     time.sleep(10)
                 else:
                     logger.warning(f"Failed to submit task {task_id}: {submit_resp.text}")
             
+            self.run_info['tasks_completed'] = submitted
             return True
         except Exception as e:
             logger.error(f"API task completion failed: {e}")
             return False
 
+    @traced()
     def complete_withdrawal_via_api(self, wallet_id: int = 2) -> bool:
         """Complete withdrawal using API method."""
         logger.info("Completing withdrawal via API...")
         
-        current_time = datetime.now()
+        current_time = self.clock()
         if current_time.weekday() > 4:
             logger.info(f"Today is {current_time.strftime('%A')} - no withdrawals on weekends")
             return False
@@ -1174,45 +1544,9 @@ class AdWatcherBot:
             logger.info(f"Waiting {time_until_9am} seconds until 9:00 AM")
             time.sleep(time_until_9am)
         
-        session = requests.Session()
-        headers = {
-            'accept': 'application/json, text/plain, */*',
-            'accept-language': 'en-US,en;q=0.9',
-            'content-type': 'application/x-www-form-urlencoded',
-            'origin': self.WEBSITE_URL,
-            'referer': f'{self.WEBSITE_URL}/',
-            'user-agent': self.user_agent,
-        }
-        
         try:
-            login_data = {
-                'username': self.username,
-                'password': self.password,
-                'language': 'fil_ph',
-                'referer': self.LOGIN_URL,
-            }
-            
-            login_resp = session.post('https://api.aksystemph.com/api/User/login', headers=headers, data=login_data)
-            login_resp.raise_for_status()
-            login_json = login_resp.json()
-            if login_json.get('code') != 1:
-                raise Exception(f"API login error: {login_json}")
-            
-            token = login_json['data']['token']
-            
-            user_data = {
-                'language': 'fil_ph',
-                'referer': f'{self.WEBSITE_URL}/#/user',
-                'token': token,
-            }
-            
-            user_resp = session.post('https://api.aksystemph.com/api/User/getUserInfo', headers=headers, data=user_data)
-            user_resp.raise_for_status()
-            user_json = user_resp.json()
-            if user_json.get('code') != 1:
-                raise Exception(f"API user info error: {user_json}")
-            
-            balance = float(user_json['data']['balance'])
+            balance = float(self._api_user_info()['balance'])
+            self.run_info['balance'] = balance
             withdrawal_amount = float(self.withdrawal_amount)
             logger.info(f"Balance: {balance} PHP")
             
@@ -1224,12 +1558,10 @@ class AdWatcherBot:
             record_data = {
                 'state': '0',
                 'page_no': '1',
-                'language': 'en_us',
-                'referer': self.WALLET_PAGE_URL,
-                'token': token,
             }
             
-            record_resp = session.post('https://api.aksystemph.com/api/Withdraw/getWithdrawRecord', headers=headers, data=record_data)
+            record_resp = self.api.post('/api/Withdraw/getWithdrawRecord', record_data,
+                                        referer=self.WALLET_PAGE_URL, language='en_us')
             record_resp.raise_for_status()
             record_json = record_resp.json()
             
@@ -1238,15 +1570,10 @@ class AdWatcherBot:
                 for record in records:
                     if today in record.get('created_time', ''):
                         logger.info(f"Withdrawal already made today: Order {record['order_id']}")
+                        self.run_info.update(withdrawal_order_id=record['order_id'], withdrawal_status=record.get('status'))
                         return True
             
-            wallet_list_data = {
-                'language': 'fil_ph',
-                'referer': f'{self.WEBSITE_URL}/#/user/bindWallet',
-                'token': token,
-            }
-            
-            wallet_list_resp = session.post('https://api.aksystemph.com/api/Account/getWalletList', headers=headers, data=wallet_list_data)
+            wallet_list_resp = self.api.post('/api/Account/getWalletList', referer=f'{self.WEBSITE_URL}/#/user/bindWallet')
             wallet_list_resp.raise_for_status()
             wallet_list_json = wallet_list_resp.json()
             if wallet_list_json.get('code') != 1:
@@ -1259,17 +1586,12 @@ class AdWatcherBot:
             selected_wallet = wallets[0]
             logger.info(f"Using wallet: {selected_wallet['wallet_name']}")
             
-            withdraw_data = {
+            withdraw_resp = self.api.post('/api/Withdraw/submitWithdraw', {
                 'myWalletId': str(selected_wallet['id']),
                 'walletId': str(wallet_id),
                 'amount': str(int(self.withdrawal_amount)),
                 'password': self.fund_password,
-                'language': 'en_us',
-                'referer': self.WITHDRAW_PAGE_URL,
-                'token': token,
-            }
-            
-            withdraw_resp = session.post('https://api.aksystemph.com/api/Withdraw/submitWithdraw', headers=headers, data=withdraw_data)
+            }, referer=self.WITHDRAW_PAGE_URL, language='en_us')
             withdraw_resp.raise_for_status()
             withdraw_json = withdraw_resp.json()
             if withdraw_json.get('code') != 1:
@@ -1278,7 +1600,8 @@ class AdWatcherBot:
             logger.info("Withdrawal submitted successfully")
             time.sleep(5)
             
-            record_resp = session.post('https://api.aksystemph.com/api/Withdraw/getWithdrawRecord', headers=headers, data=record_data)
+            record_resp = self.api.post('/api/Withdraw/getWithdrawRecord', record_data,
+                                        referer=self.WALLET_PAGE_URL, language='en_us')
             record_resp.raise_for_status()
             record_json = record_resp.json()
             if record_json.get('code') != 1:
@@ -1290,6 +1613,7 @@ class AdWatcherBot:
             
             latest_withdraw = records[0]
             status = latest_withdraw['status']
+            self.run_info.update(withdrawal_order_id=latest_withdraw['order_id'], withdrawal_status=status)
             logger.info(f"Withdrawal order {latest_withdraw['order_id']}: status {status}")
             
             if status == 1:
@@ -1306,10 +1630,33 @@ class AdWatcherBot:
             logger.error(f"API withdrawal failed: {e}")
             return False
 
-    def run(self, skip_whatsapp: bool = False):
+    def _api_user_info(self) -> dict:
+        """Return the account's user info (identity, balance) from the API."""
+        user_resp = self.api.post('/api/User/getUserInfo', referer=f'{self.WEBSITE_URL}/#/user')
+        user_resp.raise_for_status()
+        user_json = user_resp.json()
+        if user_json.get('code') != 1:
+            raise Exception(f"API user info error: {user_json}")
+        return user_json['data']
+
+    def run(self, skip_whatsapp: bool = False, parallel: bool = False):
         """Execute the full automation workflow."""
+        try:
+            self._run(skip_whatsapp, parallel)
+        finally:
+            # After the 'run' span has closed, so the trace and history see how the run ended
+            self.log_wait_report()
+            self.cleanup()
+
+    @traced('run')
+    def _run(self, skip_whatsapp: bool, parallel: bool):
         logger.info("Starting Ad Watcher Bot...")
         try:
+            # Without the browser the run is tasks then withdrawal, both API calls: nothing to overlap
+            if parallel and not self.skip_browser:
+                self._run_stages(skip_whatsapp)
+                logger.info("Bot completed successfully")
+                return
             if not self.skip_browser:
                 self.login_to_website() 
                 self.setup_task_prerequisites()
@@ -1327,13 +1674,122 @@ class AdWatcherBot:
             logger.info("Bot completed successfully")
         except Exception as e:
             logger.error(f"Bot execution failed: {e}")
+            self.run_info['error'] = f"{type(e).__name__}: {e}"
             raise
-        finally:
-            self.cleanup()
+
+    def _run_stages(self, skip_whatsapp: bool):
+        """Run the workflow as a stage graph so independent steps overlap.
+
+        The browser and the desktop are locked resources: stages that drive
+        Chrome run one at a time, but screenshot OCR, API calls and the
+        WhatsApp steps run alongside them.
+        """
+        from orchestrator import StageOrchestrator
+        graph = StageOrchestrator()
+        proceed = lambda: bool(graph.stages['tasks'].result) or self.complete_all_steps
+
+        graph.add('login', self.login_to_website, resources=['driver'])
+        graph.add('prerequisites', self.setup_task_prerequisites, deps=['login'], resources=['driver'])
+        if self.method == 'api':
+            # API tasks need neither the browser login nor the task page
+            graph.add('tasks', self.complete_tasks_via_api)
+        else:
+            graph.add('tasks', self.start_tasks, deps=['prerequisites'], resources=['driver'])
+
+        browser_ready = ['tasks', 'prerequisites']
+        graph.add('capture', self.capture_tasks_screenshot, deps=browser_ready, resources=['driver'], condition=proceed)
+        graph.add('verify', lambda: self.verify_tasks_screenshot(*graph.stages['capture'].result), deps=['capture'])
+        # After capture: the withdrawal may hold the browser until 9:00
+        # Hybrid withdrawals are API calls and leave the browser free
+        withdraw_resources = [] if self.method == 'hybrid' else ['driver']
+        graph.add('withdraw', self.check_balance_and_withdraw, deps=browser_ready, resources=withdraw_resources,
+                  condition=proceed, after=['capture'])
+        if not skip_whatsapp:
+            graph.add('open_whatsapp', self.open_whatsapp, deps=['tasks'], resources=['desktop'], condition=proceed)
+            graph.add('send_report', self.navigate_and_send_message, deps=['open_whatsapp', 'verify'],
+                      resources=['desktop'], after=['withdraw'])
+            graph.add('close_whatsapp', self.close_whatsapp, deps=['send_report'], resources=['desktop'])
+        graph.run()
+
+    def record_history(self):
+        """Store this run's steps and run info in the SQLite run history."""
+        if not self.tracer.spans:
+            return
+        try:
+            history = RunHistory(self.history_db)
+            try:
+                history.record_run(self.tracer, self.run_info)
+            finally:
+                history.close()
+        except Exception as e:
+            logger.warning(f"Could not record run history: {e}")
+        self.run_info = {'method': self.method}
+
+    def record_metrics(self):
+        """Add this run's step latencies and outcome to the metrics, then write the textfile."""
+        for span in self.tracer.spans:
+            if span.end_ns:
+                self.metrics.observe('step_duration_seconds', span.duration, step=span.name)
+        roots = [span for span in self.tracer.spans if span.parent is None]
+        if roots:
+            self.metrics.set('last_run_timestamp_seconds', round(time.time()))
+            failed = self.run_info.get('error') or any(span.status != STATUS_OK for span in roots)
+            self.metrics.set('last_run_success', int(not failed))
+        self.write_metrics()
+
+    def write_metrics(self):
+        """Write the Prometheus textfile (METRICS_TEXTFILE) atomically."""
+        if not self.metrics_path:
+            return
+        if self._ocr is not None:
+            self.metrics.set_counter('tesseract_calls_total', self._ocr.calls)
+        if self.run_info.get('balance') is not None:
+            self.metrics.set('balance_php', self.run_info['balance'])
+        try:
+            self.metrics.write(self.metrics_path)
+        except OSError as e:
+            logger.warning(f"Could not write metrics to {self.metrics_path}: {e}")
+
+    def log_resource_report(self):
+        """Log requests blocked by --block-resources and the bytes they would have cost."""
+        if self.resource_blocker is None or not self.driver:
+            return
+        try:
+            for line in self.resource_blocker.report():
+                logger.info(line)
+        except Exception as e:
+            logger.warning(f"Could not read resource blocking stats: {e}")
+
+    def log_webdriver_profile(self):
+        """Log the top WebDriver steps and commands by time, then start a fresh profile."""
+        if self.webdriver_profiler is None:
+            return
+        for line in self.webdriver_profiler.report():
+            logger.info(line)
+        self.webdriver_profiler.clear()
+
+    def write_trace(self):
+        """Export the spans collected so far and log a per-step summary table."""
+        if not self.tracer.spans:
+            return
+        try:
+            path = self.tracer.export(self.trace_dir)
+            logger.info("Run timing summary:")
+            for line in self.tracer.summary():
+                logger.info(line)
+            logger.info(f"Trace written to {path}")
+        except OSError as e:
+            logger.warning(f"Could not write trace: {e}")
+        # Start a fresh trace so a second cleanup() or a later run does not re-export these spans
+        self.tracer = Tracer()
 
     def cleanup(self):
-        """Clean up resources."""
+        """Clean up resources. Only the first call does anything; later calls return straight away."""
+        if self._cleaned_up:
+            return
+        self._cleaned_up = True
         logger.info("Cleaning up...")
+        self.log_resource_report()
         if self.driver:
             try:
                 self.driver.quit()
@@ -1342,24 +1798,58 @@ class AdWatcherBot:
                 logger.warning(f"Error closing browser: {e}")
         elif self.skip_browser:
             logger.info("No browser to clean up in API-only mode")
+        self.api.close()
+        self.selector_cache.save()
+        for line in self.selector_cache.stats():
+            logger.info(f"Selector cache: {line}")
+        if self._ocr is not None:
+            self._ocr.close()
+        if self._capture is not None:
+            self._capture.close()
+            logger.info(f"Frame cache: {vision.get_frame_cache().stats()}")
+        self.log_webdriver_profile()
+        self.record_metrics()
+        self.record_history()
+        self.write_trace()
 
 def main():
     """Main entry point for the script."""
     parser = argparse.ArgumentParser(description="Ad Watcher Bot")
     parser.add_argument('-c', '--complete', action='store_true', help='Complete all steps even if no tasks were done')
     parser.add_argument('--api', action='store_true', help='Use API method for task completion')
+    parser.add_argument('--hybrid', action='store_true', help='Watch tasks in the browser but read account state and withdraw via the API')
     parser.add_argument('-sw', '--skip-whatsapp', action='store_true', help='Skip WhatsApp message sending')
+    parser.add_argument('--debug', action='store_true', help='Write intermediate debug_*.png images')
+    parser.add_argument('--headless', action='store_true', help='Run Chrome headless (requires -sw)')
+    parser.add_argument('--profile-dir', help='Reuse this Chrome user-data-dir so a saved session skips login')
+    parser.add_argument('--import-report', action='store_true', help='Log startup and deferred import times on exit')
+    parser.add_argument('--daemon', action='store_true', help='Keep running and do the task, withdrawal and report windows every day')
+    parser.add_argument('--profile-webdriver', action='store_true', help='Time every WebDriver command per step and log the top ones on exit')
+    parser.add_argument('--block-resources', action='store_true', help='Skip images, fonts and trackers on pages the bot only reads')
+    parser.add_argument('--parallel', action='store_true', help='Run independent steps (withdrawal, screenshot OCR, WhatsApp) concurrently')
     args = parser.parse_args()
     
     bot = None
     try:
         skip_browser = args.api and args.skip_whatsapp
-        bot = AdWatcherBot(complete_all_steps=args.complete, method='api' if args.api else 'browser', skip_browser=skip_browser)
+        if args.headless and not args.skip_whatsapp:
+            logger.warning("--headless needs -sw (WhatsApp uses the desktop) - running with a visible browser")
+            args.headless = False
+        make_bot = lambda: AdWatcherBot(
+            complete_all_steps=args.complete, method='api' if args.api else 'hybrid' if args.hybrid else 'browser',
+            skip_browser=skip_browser,
+            debug=args.debug, profile_dir=args.profile_dir, headless=args.headless,
+            profile_webdriver=args.profile_webdriver, block_resources=args.block_resources
+        )
+        if args.daemon:
+            from daemon import BotDaemon
+            return BotDaemon(make_bot, skip_whatsapp=args.skip_whatsapp, complete_all_steps=args.complete).run_forever()
+        bot = make_bot()
         if args.api:
             success = bot.complete_tasks_via_api()
             logger.info("API tasks completed successfully" if success else "API task completion failed")
         else:
-            bot.run(skip_whatsapp=args.skip_whatsapp)
+            bot.run(skip_whatsapp=args.skip_whatsapp, parallel=args.parallel)
         return 0
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
@@ -1368,8 +1858,12 @@ def main():
         logger.error(f"Fatal error: {e}")
         return 1
     finally:
-        if bot and not (args.api and args.skip_whatsapp):
+        # run() has already cleaned up; this covers the --api path and errors before run()
+        if bot:
             bot.cleanup()
+        if args.import_report:
+            for line in import_report(STARTUP_IMPORT_SECONDS):
+                logger.info(line)
 
 if __name__ == "__main__":
     exit(main())
\ No newline at end of file
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Prometheus metrics for the Ad Watcher Bot.
+Collects counters, gauges and histograms in memory and writes them in the
+text exposition format for node-exporter's textfile collector.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PREFIX = 'adwatcher'
+
+# Step latency buckets in seconds: from a quick DOM read up to a full task loop
+DEFAULT_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+HELP = {
+    'step_duration_seconds': 'Duration of bot steps (tracer spans)',
+    'webdriver_commands_total': 'WebDriver commands sent to Chrome',
+    'tesseract_calls_total': 'Tesseract OCR invocations',
+    'http_requests_total': 'HTTP calls to the task site API',
+    'retries_total': 'Retried operations',
+    'task_stalled_attempts_total': 'Stalled attempts in the browser task loop',
+    'balance_php': 'Last balance seen, in PHP',
+    'tasks_remaining': 'Tasks remaining today at the last check',
+    'last_run_timestamp_seconds': 'Unix time the last run finished',
+    'last_run_success': '1 if the last run finished without error',
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Metrics:
+    """Thread-safe in-memory metric registry with Prometheus text output."""
+
+    def __init__(self, prefix: str = PREFIX, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._gauges: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, list]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """Add to a counter."""
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels):
+        """Set a gauge."""
+        with self._lock:
+            self._gauges.setdefault(name, {})[_labels(labels)] = value
+
+    def set_counter(self, name: str, value: float, **labels):
+        """Set a counter from a running total that is kept elsewhere."""
+        with self._lock:
+            self._counters.setdefault(name, {})[_labels(labels)] = value
+
+    def observe(self, name: str, value: float, **labels):
+        """Record one observation in a histogram."""
+        key = _labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            # [per-bucket counts..., sum, count]
+            state = series.setdefault(key, [0] * len(self.buckets) + [0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for kind, metrics in (('counter', self._counters), ('gauge', self._gauges)):
+                for name in sorted(metrics):
+                    full = f"{self.prefix}_{name}"
+                    lines += [f"# HELP {full} {HELP.get(name, name)}", f"# TYPE {full} {kind}"]
+                    for key, value in sorted(metrics[name].items()):
+                        lines.append(f"{full}{_format_labels(key)} {_format_value(value)}")
+            for name in sorted(self._histograms):
+                full = f"{self.prefix}_{name}"
+                lines += [f"# HELP {full} {HELP.get(name, name)}", f"# TYPE {full} histogram"]
+                for key, state in sorted(self._histograms[name].items()):
+                    for bound, count in zip(self.buckets, state):
+                        lines.append(f"{full}_bucket{_format_labels(key + (('le', _format_value(bound)),))} {count}")
+                    lines.append(f"{full}_bucket{_format_labels(key + (('le', '+Inf'),))} {state[-1]}")
+                    lines.append(f"{full}_sum{_format_labels(key)} {_format_value(state[-2])}")
+                    lines.append(f"{full}_count{_format_labels(key)} {state[-1]}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """Write the metrics to `path` atomically (temp file in the same directory, then rename)."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.prom.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(self.render())
+            os.chmod(tmp_path, 0o644)  # readable by node-exporter
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+def _labels(labels: dict) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(key: Labels) -> str:
+    if not key:
+        return ''
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in key)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(key, escaped)) + '}'
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+_metrics: Optional[Metrics] = None
+
+
+def get_metrics() -> Metrics:
+    """Return the process-wide registry (shared across daemon days)."""
+    global _metrics
+    if _metrics is None:
+        _metrics = Metrics()
+    return _metrics
@@ -0,0 +1,538 @@
+#!/usr/bin/env python3
+"""
+Mock Task Site for the Ad Watcher Bot
+A local stand-in for the task website and its API so both bot methods can be
+run, timed and regression-tested offline.
+
+Usage:
+    python mock_server.py                      # serve on http://127.0.0.1:8765
+    python mock_server.py --e2e --method api   # run the bot against it and time it
+"""
+
+import argparse
+import json
+import os
+import secrets
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+MOCK_USERNAME = '09171234567'
+MOCK_PASSWORD = 'mockpass'
+MOCK_FUND_PASSWORD = '123456'
+IDENTITIES = ["Internship", "VIP1", "VIP2", "VIP3", "VIP4", "VIP5", "VIP6", "VIP7", "VIP8", "VIP9"]
+WITHDRAW_STATUS = {0: 'Pending', 1: 'Success', 2: 'Rejected', 3: 'Processing'}
+
+APP_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Mock Task Site</title>
+<link rel="stylesheet" href="/static/app.css">
+</head>
+<body>
+<div id="app"></div>
+<div class="van-toast" style="display: none"></div>
+<script src="/static/app.js"></script>
+</body>
+</html>
+"""
+
+APP_CSS = """
+body { margin: 0; font-family: Arial, sans-serif; background: #fff; color: #222; }
+.title-bar { height: 50px; line-height: 50px; text-align: center; font-weight: bold; background: #fafafa; }
+.van-button { padding: 10px 16px; border: 0; border-radius: 4px; background: #1989fa; color: #fff; font-size: 16px; }
+.van-button--danger { background: #ee0a24; }
+.van-button--large, .van-button--block { display: block; width: 90%; margin: 12px auto; }
+.van-field { padding: 10px 16px; }
+.van-field__control { width: 100%; padding: 8px; font-size: 16px; }
+.van-cell { padding: 10px 16px; border-bottom: 1px solid #eee; }
+.van-cell--clickable { cursor: pointer; }
+.van-grid { display: flex; flex-wrap: wrap; }
+.van-grid-item { width: 25%; box-sizing: border-box; padding: 8px; text-align: center; }
+.van-grid-item__content { padding: 12px 0; background: #f7f8fa; cursor: pointer; }
+.van-grid-item img { width: 100%; height: 80px; }
+.van-tabs { display: flex; }
+.van-tab { flex: 1; text-align: center; padding: 12px 0; cursor: pointer; }
+.counters { display: flex; height: 112px; text-align: center; }
+.counters > div { flex: 1; padding-top: 22px; }
+.counters .count { font-size: 36px; line-height: 45px; font-weight: bold; }
+.counters .label { display: block; font-size: 16px; line-height: 45px; }
+.video-js { height: 200px; background: #000; position: relative; }
+.vjs-big-play-button { position: absolute; left: 45%; top: 40%; color: #fff; font-size: 32px; cursor: pointer; }
+.van-toast { position: fixed; top: 40%; left: 20%; width: 60%; padding: 12px; background: rgba(0,0,0,.7); color: #fff; text-align: center; }
+"""
+
+# Single-page app with the same class names and hash routes the bot's selectors expect
+APP_JS = r"""
+const app = document.getElementById('app');
+const toastEl = document.querySelector('.van-toast');
+let timer = null;
+
+function api(path, data) {
+    const body = new URLSearchParams(Object.assign({token: localStorage.getItem('token') || ''}, data || {}));
+    return fetch('/api/' + path, {method: 'POST', body: body}).then(r => r.json());
+}
+
+function toast(text) {
+    toastEl.textContent = text;
+    toastEl.style.display = 'block';
+    setTimeout(() => { toastEl.style.display = 'none'; }, 1500);
+}
+
+function go(hash) { location.hash = hash; }
+
+const routes = [
+    [/^#\/login$/, renderLogin],
+    [/^#\/language$/, renderLanguage],
+    [/^#\/user$/, renderUser],
+    [/^#\/user\/wallet$/, renderWallet],
+    [/^#\/user\/withdraw$/, renderWithdraw],
+    [/^#\/taskList\/(\d+)\/(\d+)$/, renderTaskList],
+    [/^#\/task\/video\/(\d+)$/, renderVideo],
+    [/^#\/myTask$/, renderMyTask],
+    [/^#?\/?$/, renderHome],
+];
+
+function route() {
+    clearInterval(timer);
+    const hash = location.hash || '#/';
+    if (!localStorage.getItem('token') && hash !== '#/login') { go('#/login'); return; }
+    for (const [pattern, render] of routes) {
+        const match = hash.match(pattern);
+        if (match) { render(...match.slice(1)); return; }
+    }
+    go('#/');
+}
+
+function renderLogin() {
+    app.innerHTML = '<div class="title-bar">Mag-log in</div>' +
+        '<button class="van-button van-button--primary" id="reveal">Mag-log in</button>' +
+        '<div class="login-form" style="display: none">' +
+        '<div class="van-field"><input type="tel" class="van-field__control" placeholder="Ilagay ang Numero ng Telepono"></div>' +
+        '<div class="van-field"><input type="password" class="van-field__control" placeholder="Ilagay ang Password sa Pag-login"></div>' +
+        '<button class="van-button van-button--danger van-button--large" id="submit">Mag-log in Ngayon</button>' +
+        '</div>';
+    document.getElementById('reveal').onclick = () => {
+        document.getElementById('reveal').style.display = 'none';
+        app.querySelector('.login-form').style.display = 'block';
+    };
+    document.getElementById('submit').onclick = () => {
+        const inputs = app.querySelectorAll('input');
+        api('User/login', {username: inputs[0].value, password: inputs[1].value}).then(res => {
+            if (res.code !== 1) { toast(res.msg); return; }
+            localStorage.setItem('token', res.data.token);
+            localStorage.setItem('task_num', res.data.task_num);
+            localStorage.setItem('level', res.data.level);
+            go('#/');
+        });
+    };
+}
+
+function renderHome() {
+    const lang = localStorage.getItem('lang') === 'en' ? 'Select Language' : 'Piliin ang Wika';
+    const items = IDENTITIES.map((name, i) =>
+        '<div class="van-grid-item"><div class="van-grid-item__content" data-level="' + (i + 1) + '">' + name + '</div></div>'
+    ).join('');
+    app.innerHTML = '<div class="title-bar">Task Hall</div>' +
+        '<div class="van-cell van-cell--clickable" id="lang"><span>' + lang + '</span></div>' +
+        '<div class="TaskHall"><div class="van-grid">' + items + '</div></div>' +
+        '<div class="van-tabbar"><span>Home</span></div>';
+    document.getElementById('lang').onclick = () => go('#/language');
+    app.querySelectorAll('.TaskHall .van-grid-item__content').forEach(el => {
+        el.onclick = () => go('#/taskList/' + (localStorage.getItem('task_num') || 1) + '/' + el.dataset.level);
+    });
+}
+
+function renderLanguage() {
+    app.innerHTML = '<div class="title-bar">Language</div>' +
+        '<div class="van-cell van-cell--clickable" data-lang="en"><span>English</span></div>' +
+        '<div class="van-cell van-cell--clickable" data-lang="fil"><span>Filipino</span></div>';
+    app.querySelectorAll('.van-cell--clickable').forEach(el => {
+        el.onclick = () => { localStorage.setItem('lang', el.dataset.lang); go('#/'); };
+    });
+}
+
+function renderUser() {
+    api('User/getUserInfo').then(res => {
+        if (res.code !== 1) { localStorage.removeItem('token'); go('#/login'); return; }
+        app.innerHTML = '<div class="title-bar">Mine</div>' +
+            '<div class="van-cell"><p>Your Identity</p><p>' + res.data.useridentity + '</p></div>' +
+            '<div class="van-cell"><p>Personal Balance(PHP)</p><p>' + Number(res.data.balance).toFixed(2) + '</p></div>';
+    });
+}
+
+function renderTaskList(taskNum, level) {
+    api('Task/getTaskList', {id: taskNum, task_level: level, page_no: 1}).then(res => {
+        if (res.code !== 1) { localStorage.removeItem('token'); go('#/login'); return; }
+        const [remaining, completed] = res.data.taskNumArr;
+        // Finished tasks stay listed without a thumbnail, like the real page
+        const items = res.data.list.map(task =>
+            '<div class="van-grid-item" data-id="' + task.id + '"><img src="' + task.img + '">' +
+            '<div class="van-grid-item__content">' + task.title + '</div></div>'
+        ).join('') + res.data.done.map(task =>
+            '<div class="van-grid-item done"><div class="van-grid-item__content">' + task.title + ' &#10003;</div></div>'
+        ).join('');
+        app.innerHTML = '<div class="title-bar">Task List</div>' +
+            '<div class="counters">' +
+            '<div><div><span class="count">' + remaining + '</span></div><span class="label">Tasks Remaining Today</span></div>' +
+            '<div><div><span class="count">' + completed + '</span></div><span class="label">Tasks Completed Today</span></div>' +
+            '</div>' +
+            '<div class="task-list"><div class="van-list"><div class="van-grid">' + items + '</div></div></div>';
+        app.querySelectorAll('.task-list .van-grid-item:not(.done)').forEach(el => {
+            el.onclick = () => api('Task/receiveTask', {id: el.dataset.id}).then(r => {
+                if (r.code === 1) go('#/task/video/' + el.dataset.id); else toast(r.msg);
+            });
+        });
+    });
+}
+
+function renderVideo(taskId) {
+    const required = WATCH_SECONDS;
+    let watched = 0;
+    app.innerHTML = '<div class="title-bar">Video</div>' +
+        '<div class="video-js"><div class="vjs-big-play-button" role="button">&#9654;</div></div>' +
+        '<p>Watch ' + required + ' seconds to complete this task</p>' +
+        '<div class="progress"></div>' +
+        '<button class="van-button van-button--danger van-button--block">Submit Complete Task</button>';
+    app.querySelector('.vjs-big-play-button').onclick = (e) => {
+        e.target.style.display = 'none';
+        app.querySelector('.progress').innerHTML = '<p>Currently watched 0 seconds</p>';
+        timer = setInterval(() => {
+            watched += 1;
+            app.querySelector('.progress p').textContent = 'Currently watched ' + watched + ' seconds';
+        }, 1000);
+    };
+    app.querySelector('.van-button--danger').onclick = () => {
+        if (watched < required) { toast('Please watch ' + required + ' seconds'); return; }
+        api('Task/submitTask', {id: taskId, seconds: watched}).then(res => {
+            if (res.code !== 1) { toast(res.msg); return; }
+            go('#/taskList/' + (localStorage.getItem('task_num') || 1) + '/' + (localStorage.getItem('level') || 1));
+        });
+    };
+}
+
+function renderMyTask() {
+    app.innerHTML = '<div class="title-bar">My Tasks</div>' +
+        '<div class="van-tabs__content"><div class="van-tab__pane"><div class="van-list"></div></div></div>';
+}
+
+function renderWallet() {
+    app.innerHTML = '<div class="title-bar">Wallet</div>' +
+        '<div class="van-tabs"><div class="van-tab"><span>Recharge Records</span></div>' +
+        '<div class="van-tab" id="withdraw-tab"><span>Withdrawal Records</span></div></div>' +
+        '<div class="van-list records"></div>';
+    document.getElementById('withdraw-tab').onclick = () => {
+        const list = app.querySelector('.records');
+        list.innerHTML = '<div class="van-list__loading">Loading...</div>';
+        api('Withdraw/getWithdrawRecord', {state: 0, page_no: 1}).then(res => {
+            list.innerHTML = res.data.lists.map(rec =>
+                '<div class="FundItem van-cell"><span>Withdraw</span><span>' + rec.created_time + '</span>' +
+                '<span class="money-withdraw">-' + rec.amount + '</span>' +
+                '<span style="color: gray">' + rec.status_text + '</span></div>'
+            ).join('') + '<div class="van-list__finished-text">No more</div>';
+        });
+    };
+}
+
+function renderWithdraw() {
+    const amounts = [60, 250, 750, 4700, 21000, 77000, 170000, 370000];
+    let selected = null;
+    app.innerHTML = '<div class="title-bar">Withdraw</div>' +
+        '<div class="van-grid">' + amounts.map(a =>
+            '<div class="van-grid-item"><div class="van-grid-item__content">' + a + '</div></div>').join('') + '</div>' +
+        '<div class="van-field"><input type="password" class="van-field__control" placeholder="Please enter the fund password"></div>' +
+        '<button class="van-button van-button--danger van-button--block"><span>Submit</span></button>';
+    app.querySelectorAll('.van-grid-item__content').forEach(el => {
+        el.onclick = () => { selected = el.textContent.trim(); };
+    });
+    app.querySelector('button').onclick = () => {
+        api('Account/getWalletList').then(wallets => api('Withdraw/submitWithdraw', {
+            myWalletId: wallets.data.data[0].id, walletId: 2, amount: selected || '',
+            password: app.querySelector('input').value,
+        })).then(res => toast(res.msg));
+    };
+}
+
+window.addEventListener('hashchange', route);
+route();
+"""
+
+TASK_IMAGE = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="160" height="90">'
+    '<rect width="160" height="90" fill="#1989fa"/>'
+    '<polygon points="65,25 65,65 100,45" fill="#fff"/></svg>'
+)
+
+
+class MockState:
+    """In-memory account, task and withdrawal state shared by every request."""
+
+    def __init__(self, username: str, password: str, fund_password: str, tasks: int = 5,
+                 balance: float = 300.0, identity: str = 'Internship'):
+        self.username = username
+        self.password = password
+        self.fund_password = fund_password
+        self.identity = identity
+        self.level = IDENTITIES.index(identity) + 1
+        self.start_balance = balance
+        self.tasks_total = tasks
+        self.clock = datetime.now  # stamps withdrawal records; run_e2e shares its clock with the bot
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Start over with a fresh day: starting balance, no tasks, withdrawals or sessions."""
+        with self.lock:
+            self.balance = self.start_balance
+            self.completed = set()
+            self.received = set()
+            self.records = []
+            self.tokens = set()
+            self.stats = defaultdict(list)  # endpoint -> handling times in seconds
+
+    def task_ids(self):
+        return [1000 + i for i in range(self.tasks_total)]
+
+
+def ok(data=None, msg='Success'):
+    return {'code': 1, 'msg': msg, 'data': data}
+
+
+def fail(msg, code=0):
+    return {'code': code, 'msg': msg, 'data': None}
+
+
+def handle_api(state: MockState, endpoint: str, form: dict) -> dict:
+    """Apply one API call to the mock state and return the JSON body."""
+    if endpoint == 'User/login':
+        if form.get('username') != state.username or form.get('password') != state.password:
+            return fail('Mali ang password')
+        token = secrets.token_hex(16)
+        state.tokens.add(token)
+        return ok({'token': token, 'task_num': 1, 'level': state.level, 'useridentity': state.identity})
+
+    if form.get('token') not in state.tokens:
+        return fail('Token expired, please log in again', code=-1)
+
+    if endpoint == 'Task/getTaskList':
+        remaining = [task_id for task_id in state.task_ids() if task_id not in state.completed]
+        tasks = [{'id': task_id, 'title': f'Ad {task_id}', 'img': '/static/task.svg'} for task_id in remaining]
+        done = [{'id': task_id, 'title': f'Ad {task_id}'} for task_id in sorted(state.completed)]
+        return ok({'taskNumArr': [len(remaining), len(state.completed)], 'list': tasks, 'done': done})
+    if endpoint == 'Task/receiveTask':
+        task_id = int(form.get('id', 0))
+        if task_id not in state.task_ids() or task_id in state.completed:
+            return fail('Task not available')
+        state.received.add(task_id)
+        return ok()
+    if endpoint == 'Task/submitTask':
+        task_id = int(form.get('id', 0))
+        if task_id not in state.received:
+            return fail('Task not received')
+        state.received.discard(task_id)
+        state.completed.add(task_id)
+        state.balance += 2.5
+        return ok()
+    if endpoint == 'User/getUserInfo':
+        return ok({'username': state.username, 'task_num': 1, 'level': state.level, 'useridentity': state.identity,
+                   'balance': f'{state.balance:.2f}'})
+    if endpoint == 'Withdraw/getWithdrawRecord':
+        return ok({'lists': list(reversed(state.records))})
+    if endpoint == 'Account/getWalletList':
+        return ok({'data': [{'id': 7, 'wallet_name': 'GCash'}]})
+    if endpoint == 'Withdraw/submitWithdraw':
+        if form.get('password') != state.fund_password:
+            return fail('Wrong fund password')
+        try:
+            amount = int(form.get('amount', ''))
+        except ValueError:
+            return fail('Select an amount')
+        if amount > state.balance:
+            return fail('Insufficient balance')
+        state.balance -= amount
+        state.records.append({
+            'order_id': f'W{int(time.time() * 1000)}',
+            'created_time': state.clock().strftime('%d-%m-%Y %H:%M:%S'),
+            'amount': amount,
+            'status': 0,
+            'status_text': WITHDRAW_STATUS[0],
+        })
+        return ok(msg='Submitted')
+    return fail(f'Unknown endpoint {endpoint}')
+
+
+def make_handler(state: MockState, latency: float, watch_seconds: int):
+    """Build a request handler bound to the given state."""
+    app_js = f"const IDENTITIES = {json.dumps(IDENTITIES)};\nconst WATCH_SECONDS = {watch_seconds};\n{APP_JS}"
+    static = {
+        '/': ('text/html', APP_HTML),
+        '/static/app.js': ('application/javascript', app_js),
+        '/static/app.css': ('text/css', APP_CSS),
+        '/static/task.svg': ('image/svg+xml', TASK_IMAGE),
+    }
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            content_type, body = static.get(self.path.split('?')[0], (None, None))
+            if body is None:
+                self._send(404, 'text/plain', 'Not found')
+            else:
+                self._send(200, content_type, body)
+
+        def do_POST(self):
+            start = time.perf_counter()
+            if not self.path.startswith('/api/'):
+                self._send(404, 'text/plain', 'Not found')
+                return
+            length = int(self.headers.get('Content-Length', 0))
+            form = {k: v[0] for k, v in parse_qs(self.rfile.read(length).decode()).items()}
+            endpoint = self.path[len('/api/'):]
+            if latency:
+                time.sleep(latency)
+            with state.lock:
+                body = handle_api(state, endpoint, form)
+                state.stats[endpoint].append(time.perf_counter() - start)
+            self._send(200, 'application/json', json.dumps(body))
+
+        def _send(self, status, content_type, body):
+            data = body.encode()
+            self.send_response(status)
+            self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def start_server(state: MockState, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0,
+                 watch_seconds: int = 10) -> ThreadingHTTPServer:
+    """Start the mock server on a background thread and return it."""
+    server = ThreadingHTTPServer((host, port), make_handler(state, latency, watch_seconds))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def print_api_stats(state: MockState):
+    """Print per-endpoint call counts and server-side latency."""
+    print(f"   {'Endpoint':<30} {'Calls':>5} {'Avg ms':>8}")
+    for endpoint, times in sorted(state.stats.items()):
+        print(f"   {endpoint:<30} {len(times):>5} {sum(times) / len(times) * 1000:>8.1f}")
+
+
+def e2e_clock() -> datetime:
+    """The current time moved to a weekday at or after 9:00, so the withdrawal runs on any day."""
+    now = datetime.now()
+    now -= timedelta(days=max(0, now.weekday() - 4))  # Saturday/Sunday -> Friday
+    return now.replace(hour=10) if now.hour < 9 else now
+
+
+def e2e_problems(state: MockState):
+    """What an end-to-end run left undone on the mock: tasks, the withdrawal record, the balance."""
+    problems = []
+    if len(state.completed) != state.tasks_total:
+        problems.append(f"completed {len(state.completed)} of {state.tasks_total} tasks")
+    if len(state.records) != 1:
+        problems.append(f"expected one new withdrawal record, found {len(state.records)}")
+    if state.balance >= state.start_balance:
+        problems.append(f"balance did not drop ({state.start_balance:.2f} -> {state.balance:.2f})")
+    return problems
+
+
+def run_e2e(server: ThreadingHTTPServer, state: MockState, methods, headless: bool):
+    """Run the bot against the mock site and report wall time per method."""
+    url = f"http://{server.server_address[0]}:{server.server_address[1]}"
+    os.environ.update({
+        'WEBSITE_URL': url,
+        'API_BASE_URL': url,
+        'WEBSITE_USERNAME': state.username,
+        'WEBSITE_PASSWORD': state.password,
+        'FUND_PASSWORD': state.fund_password,
+        'WITHDRAWAL_AMOUNT': '60',
+        'DEFAULT_IDENTITY': state.identity,
+        'API_TOKEN_CACHE': os.path.join(tempfile.mkdtemp(), 'api_token.json'),
+    })
+    os.environ.pop('DEFAULT_METHOD', None)
+    from main import AdWatcherBot
+
+    state.clock = e2e_clock
+    results = []
+    for method in methods:
+        state.reset()
+        print(f"\n🚀 Running {method} method against {url}")
+        start = time.perf_counter()
+        try:
+            if method == 'api':
+                bot = AdWatcherBot(complete_all_steps=True, method='api', skip_browser=True)
+                bot.clock = e2e_clock
+                success = bot.complete_tasks_via_api() and bot.complete_withdrawal_via_api()
+                bot.cleanup()
+            else:
+                bot = AdWatcherBot(complete_all_steps=True, method=method, headless=headless)
+                bot.clock = e2e_clock
+                bot.run(skip_whatsapp=True)
+                success = True
+        except Exception as e:
+            print(f"❌ {method} run failed: {e}")
+            success = False
+        # The bot reporting success is not enough: check what it actually did on the mock
+        for problem in e2e_problems(state):
+            print(f"❌ {method}: {problem}")
+            success = False
+        elapsed = time.perf_counter() - start
+        print(f"{'✅' if success else '❌'} {method}: {elapsed:.1f}s, "
+              f"{len(state.completed)}/{state.tasks_total} tasks, balance {state.balance:.2f}")
+        print_api_stats(state)
+        results.append(success)
+    return all(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local mock of the task site and API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--tasks', type=int, default=5, help='Tasks available per day')
+    parser.add_argument('--balance', type=float, default=300.0, help='Starting balance (PHP)')
+    parser.add_argument('--latency', type=float, default=0.05, help='Artificial API latency in seconds')
+    parser.add_argument('--watch-seconds', type=int, default=10, help='Required video watch time')
+    parser.add_argument('--e2e', action='store_true', help='Run the bot end-to-end against the mock and exit')
+    parser.add_argument('--method', choices=['api', 'browser', 'hybrid', 'both'], default='both', help='Method(s) for --e2e')
+    parser.add_argument('--headless', action='store_true', help='Headless Chrome for the browser e2e run')
+    args = parser.parse_args()
+
+    state = MockState(MOCK_USERNAME, MOCK_PASSWORD, MOCK_FUND_PASSWORD, tasks=args.tasks, balance=args.balance)
+    server = start_server(state, args.host, 0 if args.e2e else args.port, args.latency, args.watch_seconds)
+
+    if args.e2e:
+        methods = ['api', 'browser'] if args.method == 'both' else [args.method]
+        try:
+            return 0 if run_e2e(server, state, methods, args.headless) else 1
+        finally:
+            server.shutdown()
+
+    print(f"🌐 Mock task site on http://{args.host}:{args.port}")
+    print(f"   Login: {MOCK_USERNAME} / {MOCK_PASSWORD}, fund password {MOCK_FUND_PASSWORD}")
+    print("   Point the bot at it with WEBSITE_URL and API_BASE_URL. Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print()
+        print_api_stats(state)
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
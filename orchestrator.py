@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Stage orchestrator for the Ad Watcher Bot.
+Runs a bot run as a dependency graph of stages: a stage starts as soon as
+its dependencies are done and the resources it needs (the browser, the
+desktop) are free, so independent work such as screenshot OCR and the
+withdrawal overlap. Blocking Selenium/tesseract calls run in a thread pool.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class Stage:
+    """One unit of work in the run graph."""
+
+    def __init__(self, name: str, func: Callable, deps: Sequence[str] = (), resources: Sequence[str] = (),
+                 condition: Optional[Callable[[], bool]] = None, after: Sequence[str] = ()):
+        self.name = name
+        self.func = func
+        self.deps = list(deps)
+        self.after = list(after)
+        self.resources = sorted(resources)  # fixed order, so locks never deadlock
+        self.condition = condition
+        self.status = 'pending'
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.ready_at = self.start = self.end = 0.0
+        self.blocked_by: Optional[str] = None  # stage whose end released this one
+
+
+class StageOrchestrator:
+    """Runs stages concurrently while respecting dependencies and resource locks."""
+
+    def __init__(self, max_workers: int = 3):
+        self.max_workers = max_workers
+        self.stages: Dict[str, Stage] = {}
+
+    def add(self, name: str, func: Callable, deps: Sequence[str] = (), resources: Sequence[str] = (),
+            condition: Optional[Callable[[], bool]] = None, after: Sequence[str] = ()) -> Stage:
+        """Add a stage.
+
+        deps must succeed before the stage runs; `after` stages only have to
+        finish, whatever their outcome. `condition` is checked when the stage
+        is ready; False skips it and its dependents.
+        """
+        missing = [dep for dep in list(deps) + list(after) if dep not in self.stages]
+        if missing:
+            raise ValueError(f"Stage '{name}' depends on unknown stages: {', '.join(missing)}")
+        stage = self.stages[name] = Stage(name, func, deps, resources, condition, after)
+        return stage
+
+    def run(self) -> Dict[str, Stage]:
+        """Run every stage and raise the first stage error once the graph has settled."""
+        asyncio.run(self._run_all())
+        self.log_report()
+        failed = [stage for stage in self.stages.values() if stage.status == 'failed']
+        if failed:
+            raise failed[0].error
+        return self.stages
+
+    async def _run_all(self):
+        self._origin = time.perf_counter()
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._last_holder: Dict[str, str] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='stage') as executor:
+            self._executor = executor
+            for name in self.stages:
+                self._tasks[name] = asyncio.ensure_future(self._run_stage(self.stages[name]))
+            await asyncio.gather(*self._tasks.values())
+
+    async def _run_stage(self, stage: Stage):
+        await asyncio.gather(*(self._tasks[name] for name in stage.deps + stage.after))
+        stage.ready_at = self._now()
+        deps = [self.stages[dep] for dep in stage.deps]
+        if any(dep.status != 'done' for dep in deps):
+            stage.status = 'skipped'
+            return
+        finished = [self.stages[name] for name in stage.deps + stage.after if self.stages[name].end]
+        if finished:
+            stage.blocked_by = max(finished, key=lambda prev: prev.end).name
+        if stage.condition and not stage.condition():
+            stage.status = 'skipped'
+            logger.info(f"Stage {stage.name} skipped")
+            return
+
+        locks = [self._locks.setdefault(resource, asyncio.Lock()) for resource in stage.resources]
+        for lock in locks:
+            await lock.acquire()
+        try:
+            stage.start = self._now()
+            # Waiting on a resource means the previous holder is what held this stage up
+            if stage.start - stage.ready_at > 0.01:
+                holders = [self.stages[self._last_holder[r]] for r in stage.resources if r in self._last_holder]
+                if holders:
+                    stage.blocked_by = max(holders, key=lambda holder: holder.end).name
+            stage.status = 'running'
+            logger.info(f"Stage {stage.name} started")
+            # Copy the context so tracer spans opened in the worker nest under the caller's span
+            context = contextvars.copy_context()
+            loop = asyncio.get_running_loop()
+            try:
+                stage.result = await loop.run_in_executor(self._executor, context.run, stage.func)
+                stage.status = 'done'
+            except Exception as e:
+                stage.error = e
+                stage.status = 'failed'
+                logger.error(f"Stage {stage.name} failed: {e}")
+            stage.end = self._now()
+            for resource in stage.resources:
+                self._last_holder[resource] = stage.name
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._origin
+
+    def critical_path(self) -> List[Stage]:
+        """The chain of stages, each blocked by the previous one, that ended last."""
+        ran = [stage for stage in self.stages.values() if stage.status in ('done', 'failed')]
+        if not ran:
+            return []
+        path = [max(ran, key=lambda stage: stage.end)]
+        while path[-1].blocked_by:
+            path.append(self.stages[path[-1].blocked_by])
+        return list(reversed(path))
+
+    def log_report(self):
+        """Log each stage's timeline and the critical path."""
+        logger.info(f"{'Stage':<20} {'Start':>8} {'Seconds':>9}  Status")
+        for stage in sorted(self.stages.values(), key=lambda s: (s.status not in ('done', 'failed'), s.start, s.name)):
+            if stage.status in ('done', 'failed'):
+                logger.info(f"{stage.name:<20} {stage.start:>8.2f} {stage.end - stage.start:>9.2f}  {stage.status}")
+            else:
+                logger.info(f"{stage.name:<20} {'-':>8} {'-':>9}  {stage.status}")
+        path = self.critical_path()
+        if path:
+            busy = sum(stage.end - stage.start for stage in path)
+            logger.info(f"Critical path ({busy:.2f}s busy of {path[-1].end:.2f}s): "
+                        f"{' -> '.join(stage.name for stage in path)}")
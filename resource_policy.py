@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Resource blocking for the Ad Watcher Bot.
+Uses the Chrome DevTools Protocol to stop images, fonts and trackers
+loading on pages where the bot only reads text (login, user, wallet,
+withdraw), while pages whose pixels matter (task list screenshot, video)
+load everything. Blocked requests and an estimate of the bytes they would
+have cost are read back from Chrome's performance log.
+"""
+
+import json
+import logging
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+IMAGE_PATTERNS = ('*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.svg*', '*.ico*')
+FONT_PATTERNS = ('*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*')
+TRACKER_PATTERNS = (
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*connect.facebook.net*', '*hotjar.com*', '*clarity.ms*', '*hm.baidu.com*',
+)
+
+# Policy name -> URL patterns passed to Network.setBlockedURLs
+POLICIES: Dict[str, Tuple[str, ...]] = {
+    'read_only': IMAGE_PATTERNS + FONT_PATTERNS + TRACKER_PATTERNS,
+    'full': (),
+}
+
+# Chrome options capability that turns on the performance (DevTools event) log
+LOGGING_PREFS = {'performance': 'ALL'}
+
+
+class ResourceBlocker:
+    """Applies a per-page blocking policy to one Chrome session and tallies what it saved."""
+
+    def __init__(self):
+        self.driver = None
+        self.policy: Optional[str] = None
+        self.blocked: List[Tuple[str, str]] = []  # (url, resource type)
+        self._requests: Dict[str, Tuple[str, str]] = {}
+        self._sizes: Dict[str, int] = {}  # bytes of each URL that did load
+        self._type_sizes: Dict[str, List[int]] = {}  # resource type -> [total bytes, count]
+        self._log_available = True
+
+    def attach(self, driver):
+        """Start intercepting on a (new) Chrome session; nothing is blocked until apply()."""
+        self.driver = driver
+        self.policy = None
+        self._requests.clear()
+        driver.execute_cdp_cmd('Network.enable', {})
+
+    def apply(self, policy: str):
+        """Switch to `policy` before the next navigation; a no-op if it is already active."""
+        if self.driver is None or policy == self.policy:
+            return
+        self.collect()
+        self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(POLICIES[policy])})
+        self.policy = policy
+        logger.debug(f"Resource policy: {policy}")
+
+    def collect(self):
+        """Drain Chrome's performance log into the request tallies."""
+        if self.driver is None or not self._log_available:
+            return
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception as e:
+            logger.warning(f"Performance log unavailable - blocked bytes will not be reported: {e}")
+            self._log_available = False
+            return
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            method, params = message.get('method'), message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                self._requests[params['requestId']] = (params['request']['url'], params.get('type', 'Other'))
+            elif method == 'Network.loadingFinished':
+                url, kind = self._requests.pop(params['requestId'], (None, 'Other'))
+                if url:
+                    size = int(params.get('encodedDataLength', 0))
+                    self._sizes[url] = size
+                    total = self._type_sizes.setdefault(kind, [0, 0])
+                    total[0] += size
+                    total[1] += 1
+            elif method == 'Network.loadingFailed':
+                url, kind = self._requests.pop(params['requestId'], (None, 'Other'))
+                if url and params.get('blockedReason'):
+                    self.blocked.append((url, params.get('type') or kind))
+
+    def estimated_bytes(self, url: str, kind: str) -> int:
+        """Size of a blocked request: the same URL if it loaded elsewhere, else the average for its type."""
+        if url in self._sizes:
+            return self._sizes[url]
+        total, count = self._type_sizes.get(kind, (0, 0))
+        return total // count if count else 0
+
+    def report(self) -> List[str]:
+        """Requests blocked and estimated bytes saved, in total and per resource type."""
+        self.collect()
+        if not self.blocked:
+            return ["Resource blocking: no requests blocked"]
+        by_type = Counter()
+        bytes_by_type = Counter()
+        for url, kind in self.blocked:
+            by_type[kind] += 1
+            bytes_by_type[kind] += self.estimated_bytes(url, kind)
+        lines = [f"Resource blocking: {len(self.blocked)} requests blocked, "
+                 f"~{sum(bytes_by_type.values()) / 1024:.0f} KB saved (estimated)"]
+        for kind, count in by_type.most_common():
+            lines.append(f"  {kind:<12} {count:>5} requests  ~{bytes_by_type[kind] / 1024:>7.0f} KB")
+        return lines
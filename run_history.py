@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Run History
+SQLite store of every bot run: start and end, per-step durations from
+the tracer, tasks completed, balance, withdrawal and failure. The CLI
+answers questions about past runs without reading the log file.
+
+Usage:
+    python run_history.py runs [--limit N]
+    python run_history.py steps [--since YYYY-MM-DD | --month]
+    python run_history.py percentile login_to_website [--p 95] [--since YYYY-MM-DD | --month]
+    python run_history.py stalled [--since YYYY-MM-DD | --month]
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from tracing import STATUS_OK
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = 'run_history.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    trace_id TEXT,
+    day TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    ended_at REAL NOT NULL,
+    method TEXT,
+    status TEXT NOT NULL,
+    error TEXT,
+    tasks_completed INTEGER,
+    stalled_attempts INTEGER,
+    balance REAL,
+    withdrawal_order_id TEXT,
+    withdrawal_status TEXT
+);
+CREATE TABLE IF NOT EXISTS steps (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    name TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started_at ON runs(started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_day ON runs(day);
+CREATE INDEX IF NOT EXISTS idx_steps_name_started_at ON steps(name, started_at);
+CREATE INDEX IF NOT EXISTS idx_steps_run_id ON steps(run_id);
+"""
+
+
+class RunHistory:
+    """Writes and queries the run history database."""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def record_run(self, tracer, info: dict) -> Optional[int]:
+        """Store one run from its tracer spans and the bot's run info; returns the run id."""
+        if not tracer.spans:
+            return None
+        started_at = min(span.start_ns for span in tracer.spans) / 1e9
+        ended_at = max((span.end_ns or time.time_ns()) for span in tracer.spans) / 1e9
+        failed_roots = [span for span in tracer.spans if span.parent is None and span.status != STATUS_OK]
+        error = info.get('error') or (failed_roots[0].error if failed_roots else None)
+
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (trace_id, day, started_at, ended_at, method, status, error, tasks_completed, "
+                "stalled_attempts, balance, withdrawal_order_id, withdrawal_status) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (tracer.trace_id, datetime.fromtimestamp(started_at).strftime('%Y-%m-%d'), started_at, ended_at,
+                 info.get('method'), 'error' if error else 'ok', error, info.get('tasks_completed'),
+                 info.get('stalled_attempts'), info.get('balance'),
+                 _text(info.get('withdrawal_order_id')), _text(info.get('withdrawal_status'))),
+            )
+            run_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT INTO steps (run_id, name, depth, started_at, duration, status, error) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, span.name, span.depth, span.start_ns / 1e9, span.duration,
+                  'ok' if span.status == STATUS_OK else 'error', span.error) for span in tracer.spans],
+            )
+        return run_id
+
+    def step_durations(self, name: str, since: Optional[float] = None) -> List[float]:
+        """Durations of a step, in seconds, sorted ascending."""
+        rows = self.conn.execute(
+            "SELECT duration FROM steps WHERE name = ? AND started_at >= ? ORDER BY duration",
+            (name, since or 0),
+        )
+        return [row[0] for row in rows]
+
+    def step_names(self, since: Optional[float] = None) -> List[str]:
+        rows = self.conn.execute(
+            "SELECT DISTINCT name FROM steps WHERE started_at >= ? ORDER BY name", (since or 0,)
+        )
+        return [row[0] for row in rows]
+
+    def stalled_days(self, since: Optional[float] = None) -> List[tuple]:
+        """Days on which the task loop registered stalled attempts."""
+        return self.conn.execute(
+            "SELECT day, COUNT(*), MAX(stalled_attempts), SUM(tasks_completed) FROM runs "
+            "WHERE stalled_attempts > 0 AND started_at >= ? GROUP BY day ORDER BY day",
+            (since or 0,),
+        ).fetchall()
+
+    def recent_runs(self, limit: int = 10) -> List[tuple]:
+        return self.conn.execute(
+            "SELECT id, started_at, ended_at - started_at, method, status, tasks_completed, balance, "
+            "withdrawal_order_id, withdrawal_status, error FROM runs ORDER BY started_at DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+def _text(value) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        raise ValueError("no values")
+    rank = max(1, -(-len(sorted_values) * p // 100))  # ceil(n * p / 100)
+    return sorted_values[int(rank) - 1]
+
+
+def parse_since(args) -> Optional[float]:
+    if args.month:
+        return datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0).timestamp()
+    if args.since:
+        return datetime.strptime(args.since, '%Y-%m-%d').timestamp()
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the bot's run history")
+    parser.add_argument('--db', default=os.getenv('RUN_HISTORY_DB', DEFAULT_DB_PATH), help='History database path')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    runs = commands.add_parser('runs', help='List the most recent runs')
+    runs.add_argument('--limit', type=int, default=10)
+
+    for name, help_text in (('steps', 'Duration percentiles for every step'),
+                            ('percentile', 'Duration percentile of one step'),
+                            ('stalled', 'Days with stalled task loops')):
+        command = commands.add_parser(name, help=help_text)
+        if name == 'percentile':
+            command.add_argument('step', help='Step name, e.g. login_to_website (see the steps command)')
+            command.add_argument('--p', type=float, default=95, help='Percentile (default 95)')
+        command.add_argument('--since', help='Only runs on or after this date (YYYY-MM-DD)')
+        command.add_argument('--month', action='store_true', help='Only runs this calendar month')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"❌ No run history at {args.db}")
+        return 1
+    history = RunHistory(args.db)
+    try:
+        if args.command == 'runs':
+            print(f"{'Run':>5} {'Started':<17} {'Seconds':>8} {'Method':<8} {'Status':<6} {'Tasks':>5} "
+                  f"{'Balance':>9} {'Order':<14} {'W/D':<10} Error")
+            for run_id, started, seconds, method, status, tasks, balance, order, wd_status, error in history.recent_runs(args.limit):
+                print(f"{run_id:>5} {datetime.fromtimestamp(started):%Y-%m-%d %H:%M} {seconds:>8.1f} {method or '-':<8} "
+                      f"{status:<6} {tasks if tasks is not None else '-':>5} "
+                      f"{balance if balance is not None else '-':>9} {order or '-':<14} {wd_status or '-':<10} {error or ''}")
+        elif args.command == 'steps':
+            since = parse_since(args)
+            print(f"{'Step':<32} {'Count':>6} {'p50 s':>8} {'p95 s':>8} {'Max s':>8}")
+            for name in history.step_names(since):
+                durations = history.step_durations(name, since)
+                print(f"{name:<32} {len(durations):>6} {percentile(durations, 50):>8.2f} "
+                      f"{percentile(durations, 95):>8.2f} {durations[-1]:>8.2f}")
+        elif args.command == 'percentile':
+            durations = history.step_durations(args.step, parse_since(args))
+            if not durations:
+                print(f"⚠️  No '{args.step}' steps in range")
+                return 1
+            print(f"p{args.p:g} {args.step}: {percentile(durations, args.p):.2f}s over {len(durations)} runs")
+        elif args.command == 'stalled':
+            days = history.stalled_days(parse_since(args))
+            if not days:
+                print("✅ No stalled task loops in range")
+            for day, runs_count, stalled, tasks in days:
+                print(f"{day}: {runs_count} run(s), up to {stalled} stalled attempts, {tasks or 0} tasks completed")
+    finally:
+        history.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Screen capture for the Ad Watcher Bot.
+Grabs the desktop (or one region of it) straight into a reusable NumPy
+buffer with MSS when it is installed, falling back to pyautogui.
+"""
+
+import logging
+import os
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Optional: mss reads the framebuffer directly (XShm on Linux, CoreGraphics on
+# macOS, BitBlt on Windows) instead of going through a screenshot tool
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
+BACKENDS = ('mss', 'pyautogui')
+
+# (left, top, width, height) in physical screen pixels, the same convention as pyautogui
+Region = Tuple[int, int, int, int]
+
+
+class ScreenCapture:
+    """Captures RGB frames of the screen with the fastest available backend."""
+
+    def __init__(self, backend: Optional[str] = None, strict: bool = False):
+        """strict: never fall back to pyautogui; raise instead (benchmarks time exactly one backend)."""
+        backend = (backend or os.getenv('SCREEN_CAPTURE_BACKEND', '')).lower() or None
+        if backend not in (None,) + BACKENDS:
+            raise ValueError(f"Unknown capture backend '{backend}' (choose from {', '.join(BACKENDS)})")
+        self.strict = strict
+        if backend == 'mss' and not MSS_AVAILABLE:
+            if strict:
+                raise RuntimeError("mss is not installed (pip install mss)")
+            logger.warning("mss is not installed - falling back to pyautogui screenshots")
+            backend = 'pyautogui'
+        self.backend = backend or ('mss' if MSS_AVAILABLE else 'pyautogui')
+        self._sct = None
+        self._scale: Optional[float] = None
+        self._buffers: Dict[Tuple[int, int], np.ndarray] = {}
+
+    def grab(self, region: Optional[Region] = None) -> np.ndarray:
+        """Return an RGB frame of the screen, or of `region` only.
+
+        With the mss backend the array is a reused buffer: it is overwritten by
+        the next grab of the same size, so copy it if it has to be kept.
+        """
+        if self.backend == 'mss':
+            try:
+                return self._grab_mss(region)
+            except Exception as e:
+                if self.strict:
+                    raise
+                logger.warning(f"mss capture failed ({e}) - falling back to pyautogui screenshots")
+                self.close()
+                self.backend = 'pyautogui'
+        return self._grab_pyautogui(region)
+
+    def _grab_mss(self, region: Optional[Region]) -> np.ndarray:
+        if self._sct is None:
+            self._sct = mss.mss()
+        crop = None
+        if region:
+            monitor, crop = self._mss_region(region)
+        else:
+            monitor = self._sct.monitors[1]  # primary display
+        shot = self._sct.grab(monitor)
+        # mss hands back BGRA bytes; convert into a buffer kept per frame size
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        if crop:
+            x, y, width, height = crop
+            bgra = bgra[y:y + height, x:x + width]
+        key = bgra.shape[:2]
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = self._buffers[key] = np.empty(key + (3,), dtype=np.uint8)
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2RGB, dst=buffer)
+
+    def _mss_region(self, region: Region) -> Tuple[dict, Optional[Region]]:
+        """Turn a pixel region into the mss monitor to grab, plus the pixel crop of the result.
+
+        mss takes regions in logical points but returns physical pixels, while
+        pyautogui regions (and the tuned ADMIN_MESSAGE_REGION) are physical
+        pixels. On a HiDPI/Retina display the region is scaled down to points,
+        widened to whole points, and the grab cropped back to the exact pixels.
+        """
+        left, top, width, height = region
+        scale = self._display_scale()
+        if scale == 1:
+            return {'left': left, 'top': top, 'width': width, 'height': height}, None
+        point_left, point_top = int(left // scale), int(top // scale)
+        point_right, point_bottom = -int(-(left + width) // scale), -int(-(top + height) // scale)
+        monitor = {'left': point_left, 'top': point_top,
+                   'width': point_right - point_left, 'height': point_bottom - point_top}
+        crop = (round(left - point_left * scale), round(top - point_top * scale), width, height)
+        return monitor, crop
+
+    def _display_scale(self) -> float:
+        """Physical pixels per logical point on the primary display (2 on Retina)."""
+        if self._scale is None:
+            primary = self._sct.monitors[1]
+            probe = self._sct.grab({'left': primary['left'], 'top': primary['top'], 'width': 16, 'height': 16})
+            self._scale = probe.width / 16
+            if self._scale != 1:
+                logger.info(f"Display scale {self._scale:g}x - converting capture regions from pixels to points")
+        return self._scale
+
+    @staticmethod
+    def _grab_pyautogui(region: Optional[Region]) -> np.ndarray:
+        import pyautogui
+        return np.asarray(pyautogui.screenshot(region=region))
+
+    def close(self):
+        """Release the display connection and buffers."""
+        if self._sct is not None:
+            self._sct.close()
+            self._sct = None
+        self._buffers.clear()
+
+
+_capture: Optional[ScreenCapture] = None
+
+
+def get_screen_capture() -> ScreenCapture:
+    """Return the process-wide screen capture instance."""
+    global _capture
+    if _capture is None:
+        _capture = ScreenCapture()
+        logger.info(f"Screen capture backend: {_capture.backend}")
+    return _capture
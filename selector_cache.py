@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Selector cache for the Ad Watcher Bot.
+Remembers which selector found each logical field (username, password,
+login button) so the next run tries that one first instead of walking
+the whole fallback list.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SelectorCache:
+    """Persisted map of field name -> winning selector, with per-field hit counts."""
+
+    def __init__(self, path: Optional[str] = '.selector_cache.json'):
+        self.path = path
+        self.fields: Dict[str, dict] = {}
+        self._dirty = False
+        self._load()
+
+    def ordered(self, field: str, selectors: List[str]) -> List[str]:
+        """Return the selectors with the last winner for this field moved to the front."""
+        preferred = self.fields.get(field, {}).get('selector')
+        if preferred in selectors:
+            return [preferred] + [selector for selector in selectors if selector != preferred]
+        return list(selectors)
+
+    def record(self, field: str, selector: Optional[str]):
+        """Record which selector matched (None if none did); a hit means the cached one matched."""
+        entry = self.fields.setdefault(field, {'selector': None, 'hits': 0, 'misses': 0})
+        if selector is not None and selector == entry['selector']:
+            entry['hits'] += 1
+        else:
+            entry['misses'] += 1
+            if selector is not None:
+                logger.info(f"Selector cache: '{field}' now resolves with {selector}")
+                entry['selector'] = selector
+        self._dirty = True
+
+    def save(self):
+        """Write the cache if it changed, atomically so a crash never leaves half a file."""
+        if not self.path or not self._dirty:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.selector_cache.')
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'fields': self.fields}, f, indent=2)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not save selector cache: {e}")
+
+    def stats(self) -> List[str]:
+        """One line per field with its cached selector and hit rate."""
+        lines = []
+        for field, entry in sorted(self.fields.items()):
+            total = entry['hits'] + entry['misses']
+            rate = entry['hits'] / total if total else 0.0
+            lines.append(f"{field}: {entry['selector']} (hit rate {rate:.0%}, {entry['hits']}/{total})")
+        return lines
+
+    def _load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path) as f:
+                self.fields = json.load(f).get('fields', {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable selector cache: {e}")
+            self.fields = {}
@@ -0,0 +1,27 @@
+import pytest
+
+
+@pytest.fixture
+def api_bot(tmp_path, monkeypatch):
+    """Return a factory for API-only bots whose cache, trace, history and metrics files live in tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    env = {
+        'WEBSITE_URL': 'http://127.0.0.1:9',
+        'API_BASE_URL': 'http://127.0.0.1:9',
+        'WEBSITE_USERNAME': '09171234567',
+        'WEBSITE_PASSWORD': 'secret',
+        'FUND_PASSWORD': '123456',
+        'DEFAULT_METHOD': 'api',
+        'API_TOKEN_CACHE': str(tmp_path / 'api_token.json'),
+        'SELECTOR_CACHE': str(tmp_path / 'selector_cache.json'),
+        'TRACE_DIR': str(tmp_path / 'traces'),
+        'RUN_HISTORY_DB': str(tmp_path / 'run_history.sqlite'),
+        'METRICS_TEXTFILE': str(tmp_path / 'bot.prom'),
+    }
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+
+    def make_bot(**kwargs):
+        from main import AdWatcherBot
+        return AdWatcherBot(method='api', skip_browser=True, **kwargs)
+    return make_bot
@@ -0,0 +1,209 @@
+import json
+import time
+
+import pytest
+import requests
+
+from api_client import ApiClient
+from metrics import Metrics
+
+BASE_URL = 'http://api.test'
+ACCOUNT = {'task_num': 1, 'level': 2, 'useridentity': 'VIP1'}
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self.body = body
+        self.status_code = status_code
+
+    def json(self):
+        return self.body
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Answers like the task site API: login hands out tokens, other calls need a live one."""
+
+    def __init__(self):
+        self.calls = []
+        self.live_tokens = set()
+        self.issued = 0
+
+    def post(self, url, data, timeout):
+        endpoint = url[len(BASE_URL):]
+        self.calls.append((endpoint, data.get('token')))
+        if endpoint == '/api/User/login':
+            self.issued += 1
+            token = f'token-{self.issued}'
+            self.live_tokens.add(token)
+            return FakeResponse({'code': 1, 'data': dict(ACCOUNT, token=token)})
+        if data.get('token') not in self.live_tokens:
+            return FakeResponse({'code': -1, 'msg': 'Token expired, please log in again'})
+        return FakeResponse({'code': 1, 'data': dict(ACCOUNT, balance='312.50')})
+
+    def close(self):
+        pass
+
+
+def make_client(tmp_path, session=None, username='09171234567', metrics=None, token_ttl=3600):
+    client = ApiClient('http://site.test', username, 'secret', 'test-agent', base_url=BASE_URL,
+                       token_cache_path=str(tmp_path / 'token.json'), token_ttl=token_ttl, metrics=metrics)
+    client.session = session or FakeSession()
+    return client
+
+
+def endpoints(session):
+    return [endpoint for endpoint, _ in session.calls]
+
+
+def test_one_login_is_shared_by_every_call(tmp_path):
+    session = FakeSession()
+    client = make_client(tmp_path, session)
+
+    client.post('/api/Task/getTaskList', {'id': '1'}, referer='http://site.test/#/taskList/1/2')
+    client.post('/api/User/getUserInfo')
+
+    assert endpoints(session) == ['/api/User/login', '/api/Task/getTaskList', '/api/User/getUserInfo']
+    assert [token for _, token in session.calls[1:]] == ['token-1', 'token-1']
+
+
+def test_post_adds_language_referer_and_token(tmp_path):
+    sent = []
+
+    class RecordingSession(FakeSession):
+        def post(self, url, data, timeout):
+            sent.append(dict(data))
+            return super().post(url, data, timeout)
+
+    client = make_client(tmp_path, RecordingSession())
+    client.post('/api/Task/getTaskList', {'id': '1'}, referer='http://site.test/#/taskList/1/2')
+
+    assert sent[-1] == {'language': 'fil_ph', 'referer': 'http://site.test/#/taskList/1/2', 'id': '1',
+                        'token': 'token-1'}
+
+
+def test_submits_are_not_replayed_by_the_connection_pool():
+    client = ApiClient('http://site.test', 'user', 'secret', 'test-agent', base_url=BASE_URL)
+    retry = client.session.get_adapter(BASE_URL).max_retries
+    # Connection errors are retried, but a POST that reached the server is never sent twice
+    assert (retry.connect, retry.read, retry.status) == (2, 0, 0)
+    client.close()
+
+
+def test_requests_are_counted_per_endpoint_and_outcome(tmp_path):
+    class FlakySession(FakeSession):
+        def post(self, url, data, timeout):
+            if url.endswith('getUserInfo'):
+                raise requests.ConnectionError("connection reset")
+            return super().post(url, data, timeout)
+
+    metrics = Metrics(prefix='test')
+    client = make_client(tmp_path, FlakySession(), metrics=metrics)
+    client.post('/api/Task/getTaskList')
+    with pytest.raises(requests.ConnectionError):
+        client.post('/api/User/getUserInfo')
+
+    lines = metrics.render().splitlines()
+    assert 'test_http_requests_total{code="200",endpoint="/api/User/login"} 1' in lines
+    assert 'test_http_requests_total{code="200",endpoint="/api/Task/getTaskList"} 1' in lines
+    assert 'test_http_requests_total{code="error",endpoint="/api/User/getUserInfo"} 1' in lines
+
+
+def test_login_caches_only_the_token_and_its_expiry(tmp_path):
+    client = make_client(tmp_path)
+
+    assert client.login() == dict(ACCOUNT, token='token-1')
+
+    path = tmp_path / 'token.json'
+    cached = json.loads(path.read_text())
+    assert set(cached) == {'username', 'base_url', 'token', 'expires_at'}
+    assert cached['token'] == 'token-1'
+    assert time.time() < cached['expires_at'] <= time.time() + 3600
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_cached_token_is_checked_and_account_data_refreshed(tmp_path):
+    session = FakeSession()
+    make_client(tmp_path, session).login()
+
+    client = make_client(tmp_path, session)
+    assert client.login() == dict(ACCOUNT, balance='312.50', token='token-1')
+    assert endpoints(session) == ['/api/User/login', '/api/User/getUserInfo']
+
+
+def test_expired_cache_logs_in(tmp_path):
+    session = FakeSession()
+    make_client(tmp_path, session, token_ttl=-1).login()
+
+    assert make_client(tmp_path, session).login()['token'] == 'token-2'
+    assert endpoints(session) == ['/api/User/login', '/api/User/login']
+
+
+@pytest.mark.parametrize('cached', [
+    {'username': 'someone-else', 'base_url': BASE_URL, 'token': 'token-1', 'expires_at': 1e12},
+    {'username': '09171234567', 'base_url': 'http://other.test', 'token': 'token-1', 'expires_at': 1e12},
+    # Cache written before only the token was kept
+    {'username': '09171234567', 'base_url': BASE_URL, 'saved_at': 1e12, 'data': dict(ACCOUNT, token='token-1')},
+])
+def test_cache_for_another_account_or_format_is_ignored(tmp_path, cached):
+    (tmp_path / 'token.json').write_text(json.dumps(cached))
+    session = FakeSession()
+    session.live_tokens.add('token-1')
+
+    assert make_client(tmp_path, session).login()['token'] == 'token-1'
+    assert endpoints(session) == ['/api/User/login']
+
+
+def test_rejected_cached_token_falls_back_to_login(tmp_path):
+    session = FakeSession()
+    make_client(tmp_path, session).login()
+    session.live_tokens.clear()
+
+    client = make_client(tmp_path, session)
+    assert client.login()['token'] == 'token-2'
+    assert endpoints(session) == ['/api/User/login', '/api/User/getUserInfo', '/api/User/login']
+    assert json.loads((tmp_path / 'token.json').read_text())['token'] == 'token-2'
+
+
+def test_token_revoked_mid_run_is_renewed_once(tmp_path):
+    session = FakeSession()
+    make_client(tmp_path, session).login()
+    metrics = Metrics(prefix='test')
+    client = make_client(tmp_path, session, metrics=metrics)
+    client.login()
+    session.live_tokens.clear()
+
+    resp = client.post('/api/Task/getTaskList', {'id': '1'})
+
+    assert resp.json()['code'] == 1
+    assert session.calls[-3:] == [('/api/Task/getTaskList', 'token-1'), ('/api/User/login', None),
+                                  ('/api/Task/getTaskList', 'token-2')]
+    assert 'test_retries_total{kind="api_token"} 1' in metrics.render().splitlines()
+
+
+def test_withdrawal_is_never_replayed(tmp_path):
+    session = FakeSession()
+    make_client(tmp_path, session).login()
+    client = make_client(tmp_path, session)
+    client.login()
+    session.live_tokens.clear()
+
+    resp = client.post('/api/Withdraw/submitWithdraw', {'amount': '60'})
+
+    assert resp.json()['code'] == -1
+    assert endpoints(session).count('/api/Withdraw/submitWithdraw') == 1
+    assert endpoints(session)[-1] == '/api/Withdraw/submitWithdraw'
+
+
+def test_fresh_login_is_not_retried(tmp_path):
+    session = FakeSession()
+    client = make_client(tmp_path, session)
+    client.login()
+    session.live_tokens.clear()
+
+    resp = client.post('/api/Task/getTaskList')
+
+    assert resp.json()['code'] == -1
+    assert endpoints(session) == ['/api/User/login', '/api/Task/getTaskList']
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+
+def fail_tasks(bot):
+    def complete_tasks_via_api():
+        with bot.tracer.span('complete_tasks_via_api'):
+            raise RuntimeError("task list unavailable")
+    bot.complete_tasks_via_api = complete_tasks_via_api
+
+
+def test_trace_of_failed_run_marks_root_span_as_error(api_bot, tmp_path):
+    bot = api_bot()
+    fail_tasks(bot)
+
+    with pytest.raises(RuntimeError):
+        bot.run(skip_whatsapp=True)
+
+    [trace_file] = (tmp_path / 'traces').iterdir()
+    spans = json.loads(trace_file.read_text())['resourceSpans'][0]['scopeSpans'][0]['spans']
+    root = next(span for span in spans if 'parentSpanId' not in span)
+    assert root['name'] == 'run'
+    assert root['status'] == {'code': 2, 'message': 'RuntimeError: task list unavailable'}
+
+
+def test_failed_run_is_recorded_as_error(api_bot, tmp_path):
+    from run_history import RunHistory
+
+    bot = api_bot()
+    fail_tasks(bot)
+
+    with pytest.raises(RuntimeError):
+        bot.run(skip_whatsapp=True)
+
+    history = RunHistory(str(tmp_path / 'run_history.sqlite'))
+    try:
+        [run] = history.recent_runs()
+        assert (run[3], run[4], run[9]) == ('api', 'error', 'RuntimeError: task list unavailable')
+    finally:
+        history.close()
+
+
+def metric_value(path, name):
+    for line in path.read_text().splitlines():
+        if line.startswith(f'adwatcher_{name} '):
+            return float(line.split()[1])
+    raise AssertionError(f"{name} not in {path}")
+
+
+def test_last_run_success_follows_the_run_outcome(api_bot, tmp_path):
+    bot = api_bot()
+    bot.complete_tasks_via_api = lambda: False
+    bot.run(skip_whatsapp=True)
+    assert metric_value(tmp_path / 'bot.prom', 'last_run_success') == 1
+
+    bot = api_bot()
+    fail_tasks(bot)
+    with pytest.raises(RuntimeError):
+        bot.run(skip_whatsapp=True)
+    assert metric_value(tmp_path / 'bot.prom', 'last_run_success') == 0
+
+
+def test_second_cleanup_does_nothing(api_bot, tmp_path):
+    from run_history import RunHistory
+
+    bot = api_bot()
+    bot.complete_tasks_via_api = lambda: False
+    closes = []
+    bot.api.close = lambda: closes.append(True)
+
+    bot.run(skip_whatsapp=True)
+    bot.cleanup()  # what main() does after run() returns
+
+    assert closes == [True]
+    history = RunHistory(str(tmp_path / 'run_history.sqlite'))
+    try:
+        assert len(history.recent_runs()) == 1
+    finally:
+        history.close()
+
+
+def test_parallel_api_only_run_goes_step_by_step(api_bot):
+    bot = api_bot(complete_all_steps=True)
+    steps = []
+    bot.complete_tasks_via_api = lambda: steps.append('tasks') or True
+    bot.complete_withdrawal_via_api = lambda: steps.append('withdraw')
+    bot._run_stages = lambda skip_whatsapp: pytest.fail("API-only runs have no stage graph")
+
+    bot.run(skip_whatsapp=True, parallel=True)
+
+    assert steps == ['tasks', 'withdraw']
@@ -0,0 +1,151 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from daemon import WINDOWS, BotDaemon, next_occurrence
+from tracing import Tracer
+
+
+class FakeBot:
+    """Records which bot steps the daemon calls."""
+
+    def __init__(self, method='api', skip_browser=True, tasks_completed=True, fail=None):
+        self.method = method
+        self.skip_browser = skip_browser
+        self.tracer = Tracer()
+        self.run_info = {'method': method}
+        self.calls = []
+        self._tasks_completed = tasks_completed
+        self._fail = fail
+
+    def _call(self, name, result=None):
+        self.calls.append(name)
+        if name == self._fail:
+            raise RuntimeError(f"{name} failed")
+        return result
+
+    def complete_tasks_via_api(self):
+        return self._call('complete_tasks_via_api', self._tasks_completed)
+
+    def complete_withdrawal_via_api(self):
+        return self._call('complete_withdrawal_via_api')
+
+    def warm_api(self):
+        return self._call('warm_api')
+
+    def ensure_browser(self):
+        return self._call('ensure_browser')
+
+    def login_to_website(self):
+        return self._call('login_to_website')
+
+    def write_metrics(self):
+        self.calls.append('write_metrics')
+
+    def log_wait_report(self):
+        pass
+
+    def cleanup(self):
+        self.calls.append('cleanup')
+
+
+@pytest.fixture
+def daemon(monkeypatch):
+    for _, env, _ in WINDOWS:
+        monkeypatch.delenv(env, raising=False)
+    monkeypatch.setenv('DAEMON_PREWARM', '60')
+
+    def make(**kwargs):
+        bots = []
+
+        def factory():
+            bots.append(FakeBot(**kwargs))
+            return bots[-1]
+        daemon = BotDaemon(factory, skip_whatsapp=True)
+        daemon.bots = bots
+        return daemon
+    return make
+
+
+@pytest.mark.parametrize('after, expected', [
+    (datetime(2026, 10, 16, 8, 0), datetime(2026, 10, 16, 8, 30)),
+    (datetime(2026, 10, 16, 8, 30), datetime(2026, 10, 17, 8, 30)),  # strictly after
+    (datetime(2026, 10, 16, 23, 59), datetime(2026, 10, 17, 8, 30)),
+    (datetime(2026, 12, 31, 9, 0), datetime(2027, 1, 1, 8, 30)),
+])
+def test_next_occurrence(after, expected):
+    assert next_occurrence('08:30', after) == expected
+
+
+def test_window_times_come_from_the_environment(daemon, monkeypatch):
+    monkeypatch.setenv('DAEMON_WITHDRAW_AT', '09:15')
+    assert daemon().times == {'tasks': '08:30', 'withdraw': '09:15', 'report': '09:30'}
+
+
+def test_schedule_queues_prewarm_before_the_window(daemon):
+    bot_daemon = daemon()
+    now = datetime.now()
+    at = next_occurrence('08:30', now)
+    if at - timedelta(seconds=60) <= now:
+        pytest.skip("window starts within the pre-warm lead time")
+
+    bot_daemon._schedule('tasks', now)
+
+    prewarm, run = sorted(bot_daemon.scheduler.queue)
+    assert (prewarm.action.__name__, prewarm.time) == ('_prewarm', (at - timedelta(seconds=60)).timestamp())
+    assert (run.action.__name__, run.time, run.argument) == ('_run_window', at.timestamp(), ('tasks', at))
+
+
+def test_one_bot_per_day_across_the_windows(daemon):
+    bot_daemon = daemon()
+    day = datetime(2026, 10, 16, 8, 30)
+
+    bot_daemon._run_window('tasks', day)
+    bot_daemon._run_window('withdraw', day.replace(hour=9))
+    bot_daemon._run_window('report', day.replace(hour=9, minute=30))
+
+    [bot] = bot_daemon.bots
+    assert bot.calls == ['complete_tasks_via_api', 'write_metrics',
+                         'complete_withdrawal_via_api', 'write_metrics',
+                         'write_metrics', 'cleanup']
+    assert [span.name for span in bot.tracer.spans] == ['daemon: tasks', 'daemon: withdraw', 'daemon: report']
+    assert bot_daemon.bot is None
+    # Every window is queued again for the next day
+    runs = [event.argument[0] for event in bot_daemon.scheduler.queue if event.action == bot_daemon._run_window]
+    assert sorted(runs) == ['report', 'tasks', 'withdraw']
+
+
+def test_api_prewarm_opens_the_connection(daemon):
+    bot_daemon = daemon()
+    bot_daemon._prewarm('tasks')
+    assert bot_daemon.bot.calls == ['warm_api']
+
+
+def test_hybrid_prewarm_logs_in_and_opens_the_api_connection(daemon):
+    bot_daemon = daemon(method='hybrid', skip_browser=False)
+    bot_daemon._prewarm('tasks')
+    assert bot_daemon.bot.calls == ['ensure_browser', 'login_to_website', 'warm_api']
+    assert bot_daemon.logged_in
+
+
+def test_no_tasks_skips_the_withdrawal(daemon):
+    bot_daemon = daemon(tasks_completed=False)
+    day = datetime(2026, 10, 16, 8, 30)
+
+    bot_daemon._run_window('tasks', day)
+    bot_daemon._run_window('withdraw', day.replace(hour=9))
+
+    assert 'complete_withdrawal_via_api' not in bot_daemon.bot.calls
+
+
+def test_failed_window_ends_the_day_with_the_error(daemon):
+    bot_daemon = daemon(fail='complete_tasks_via_api')
+    day = datetime(2026, 10, 16, 8, 30)
+
+    bot_daemon._run_window('tasks', day)
+    bot_daemon._run_window('withdraw', day.replace(hour=9))
+
+    [bot] = bot_daemon.bots
+    assert bot.calls == ['complete_tasks_via_api', 'cleanup']
+    assert bot.run_info['error'] == 'RuntimeError: complete_tasks_via_api failed'
+    assert bot_daemon.bot is None
@@ -0,0 +1,53 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+import dom_extract
+from dom_extract import (PERSONAL_BALANCE, USER_IDENTITY, ValuesPresent, WithdrawalRecordsLoaded, read_values,
+                         withdrawal_records)
+
+
+class FakeDriver:
+    """Plays back one result per execute_script call and records the calls."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        self.calls.append((script, args))
+        return self.results.pop(0) if len(self.results) > 1 else self.results[0]
+
+
+def test_read_values_sends_all_specs_in_one_call():
+    driver = FakeDriver({'identity': 'VIP1', 'balance': '312.50'})
+
+    values = read_values(driver, identity=USER_IDENTITY, balance=PERSONAL_BALANCE)
+
+    assert values == {'identity': 'VIP1', 'balance': '312.50'}
+    assert driver.calls == [(dom_extract.LABELLED_VALUES_SCRIPT, ({'identity': ['Your Identity', 'next'],
+                                                                   'balance': ['Personal Balance(PHP)', 'next']},))]
+
+
+def test_values_present_waits_for_every_value():
+    driver = FakeDriver({'identity': 'VIP1', 'balance': None}, {'identity': 'VIP1', 'balance': '312.50'})
+    condition = ValuesPresent(identity=USER_IDENTITY, balance=PERSONAL_BALANCE)
+
+    assert condition(driver) is False
+    assert condition(driver) == {'identity': 'VIP1', 'balance': '312.50'}
+
+
+def test_withdrawal_records_of_an_empty_page():
+    assert withdrawal_records(FakeDriver(None)) == []
+
+
+def test_records_wait_returns_once_the_list_has_loaded():
+    driver = FakeDriver(None, None, 'empty')
+    assert WebDriverWait(driver, 2, poll_frequency=0.01).until(WithdrawalRecordsLoaded()) == 'empty'
+    assert len(driver.calls) == 3
+
+
+def test_records_wait_times_out_while_still_loading():
+    # A slow records request must not be mistaken for "no withdrawal today"
+    with pytest.raises(TimeoutException):
+        WebDriverWait(FakeDriver(None), 0.05, poll_frequency=0.01).until(WithdrawalRecordsLoaded())
@@ -0,0 +1,15 @@
+import pytest
+
+from main import contains_selector_xpath
+
+
+@pytest.mark.parametrize('selector, xpath', [
+    ("button:contains('Submit Complete Task')", "//button[contains(., 'Submit Complete Task')]"),
+    (":contains('Mag-log in Ngayon')", "//*[contains(., 'Mag-log in Ngayon')]"),
+])
+def test_contains_selector_becomes_xpath(selector, xpath):
+    assert contains_selector_xpath(selector) == xpath
+
+
+def test_plain_css_is_left_alone():
+    assert contains_selector_xpath(".van-button--danger.van-button--large") is None
@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+from metrics import Metrics
+
+
+def test_counter_and_gauge_rendering():
+    metrics = Metrics(prefix='test')
+    metrics.inc('http_requests_total', endpoint='/api/User/login', code=200)
+    metrics.inc('http_requests_total', endpoint='/api/User/login', code=200)
+    metrics.inc('http_requests_total', endpoint='/api/Task/getTaskList', code=200)
+    metrics.set('balance_php', 312.5)
+    metrics.set('tasks_remaining', 0)
+
+    lines = metrics.render().splitlines()
+    assert lines[:2] == ['# HELP test_http_requests_total HTTP calls to the task site API',
+                         '# TYPE test_http_requests_total counter']
+    assert 'test_http_requests_total{code="200",endpoint="/api/Task/getTaskList"} 1' in lines
+    assert 'test_http_requests_total{code="200",endpoint="/api/User/login"} 2' in lines
+    assert '# TYPE test_balance_php gauge' in lines
+    assert 'test_balance_php 312.5' in lines
+    assert 'test_tasks_remaining 0' in lines
+
+
+def test_set_counter_overwrites_running_total():
+    metrics = Metrics(prefix='test')
+    metrics.set_counter('tesseract_calls_total', 4)
+    metrics.set_counter('tesseract_calls_total', 9)
+    assert 'test_tesseract_calls_total 9' in metrics.render().splitlines()
+
+
+def test_label_values_are_escaped():
+    metrics = Metrics(prefix='test')
+    metrics.inc('retries_total', kind='say "hi"\\now\nnext')
+    assert 'test_retries_total{kind="say \\"hi\\"\\\\now\\nnext"} 1' in metrics.render().splitlines()
+
+
+def test_histogram_buckets_are_cumulative():
+    metrics = Metrics(prefix='test', buckets=(1, 5, 10))
+    for value in (0.5, 3, 3, 7, 60):
+        metrics.observe('step_duration_seconds', value, step='login')
+
+    lines = metrics.render().splitlines()
+    assert '# TYPE test_step_duration_seconds histogram' in lines
+    assert 'test_step_duration_seconds_bucket{step="login",le="1"} 1' in lines
+    assert 'test_step_duration_seconds_bucket{step="login",le="5"} 3' in lines
+    assert 'test_step_duration_seconds_bucket{step="login",le="10"} 4' in lines
+    assert 'test_step_duration_seconds_bucket{step="login",le="+Inf"} 5' in lines
+    assert 'test_step_duration_seconds_sum{step="login"} 73.5' in lines
+    assert 'test_step_duration_seconds_count{step="login"} 5' in lines
+
+
+def test_write_replaces_file_and_leaves_no_temp_files(tmp_path):
+    path = tmp_path / 'bot.prom'
+    path.write_text('old\n')
+    metrics = Metrics(prefix='test')
+    metrics.set('tasks_remaining', 3)
+
+    metrics.write(str(path))
+
+    assert path.read_text() == metrics.render()
+    assert os.listdir(tmp_path) == ['bot.prom']
+    assert path.stat().st_mode & 0o777 == 0o644
+
+
+def test_failed_write_keeps_previous_file(tmp_path, monkeypatch):
+    path = tmp_path / 'bot.prom'
+    path.write_text('previous\n')
+    metrics = Metrics(prefix='test')
+
+    def broken_render():
+        raise RuntimeError("render failed")
+
+    monkeypatch.setattr(metrics, 'render', broken_render)
+    with pytest.raises(RuntimeError):
+        metrics.write(str(path))
+
+    assert path.read_text() == 'previous\n'
+    assert os.listdir(tmp_path) == ['bot.prom']
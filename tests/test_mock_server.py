@@ -0,0 +1,69 @@
+from datetime import datetime
+
+from mock_server import MOCK_FUND_PASSWORD, MOCK_PASSWORD, MOCK_USERNAME, MockState, e2e_clock, e2e_problems, handle_api
+
+
+def make_state():
+    state = MockState(MOCK_USERNAME, MOCK_PASSWORD, MOCK_FUND_PASSWORD, tasks=2, balance=100.0)
+    state.clock = lambda: datetime(2026, 10, 16, 10, 0)
+    return state
+
+
+def login(state):
+    body = handle_api(state, 'User/login', {'username': MOCK_USERNAME, 'password': MOCK_PASSWORD})
+    assert body['code'] == 1
+    return body['data']['token']
+
+
+def run_day(state):
+    token = login(state)
+    for task_id in state.task_ids():
+        assert handle_api(state, 'Task/receiveTask', {'token': token, 'id': str(task_id)})['code'] == 1
+        assert handle_api(state, 'Task/submitTask', {'token': token, 'id': str(task_id)})['code'] == 1
+    body = handle_api(state, 'Withdraw/submitWithdraw',
+                      {'token': token, 'password': MOCK_FUND_PASSWORD, 'amount': '60'})
+    assert body['code'] == 1
+
+
+def test_wrong_password_and_unknown_token_are_rejected():
+    state = make_state()
+    assert handle_api(state, 'User/login', {'username': MOCK_USERNAME, 'password': 'nope'})['code'] == 0
+    assert handle_api(state, 'Task/getTaskList', {'token': 'stale'})['code'] == -1
+
+
+def test_task_must_be_received_before_submitting():
+    state = make_state()
+    token = login(state)
+    assert handle_api(state, 'Task/submitTask', {'token': token, 'id': '1000'})['msg'] == 'Task not received'
+
+
+def test_full_day_passes_the_e2e_checks():
+    state = make_state()
+    assert e2e_problems(state) == [
+        "completed 0 of 2 tasks",
+        "expected one new withdrawal record, found 0",
+        "balance did not drop (100.00 -> 100.00)",
+    ]
+
+    run_day(state)
+
+    assert e2e_problems(state) == []
+    assert state.balance == 100.0 + 2 * 2.5 - 60
+    assert state.records[0]['created_time'] == '16-10-2026 10:00:00'
+
+
+def test_reset_starts_a_fresh_day():
+    state = make_state()
+    token = login(state)
+    run_day(state)
+
+    state.reset()
+
+    assert (state.balance, state.completed, state.records) == (100.0, set(), [])
+    assert handle_api(state, 'Task/getTaskList', {'token': token})['code'] == -1
+
+
+def test_e2e_clock_is_a_weekday_after_nine():
+    now = e2e_clock()
+    assert now.weekday() < 5
+    assert now.hour >= 9
@@ -0,0 +1,112 @@
+import time
+
+import pytest
+
+from orchestrator import StageOrchestrator
+
+
+def sleeper(seconds, log=None, name=None):
+    def run():
+        if log is not None:
+            log.append(name)
+        time.sleep(seconds)
+        return name
+    return run
+
+
+def test_dependencies_run_in_order():
+    order = []
+    graph = StageOrchestrator()
+    graph.add('login', sleeper(0.01, order, 'login'))
+    graph.add('tasks', sleeper(0.01, order, 'tasks'), deps=['login'])
+    graph.add('report', sleeper(0.01, order, 'report'), deps=['tasks'])
+
+    stages = graph.run()
+
+    assert order == ['login', 'tasks', 'report']
+    assert all(stage.status == 'done' for stage in stages.values())
+    assert stages['report'].result == 'report'
+
+
+def test_independent_stages_overlap():
+    graph = StageOrchestrator(max_workers=2)
+    graph.add('ocr', sleeper(0.2))
+    graph.add('withdraw', sleeper(0.2))
+
+    stages = graph.run()
+
+    assert stages['withdraw'].start < stages['ocr'].end
+    assert stages['ocr'].start < stages['withdraw'].end
+
+
+def test_shared_resource_serialises_stages():
+    graph = StageOrchestrator(max_workers=2)
+    graph.add('screenshot', sleeper(0.1), resources=['browser'])
+    graph.add('withdraw', sleeper(0.1), resources=['browser'])
+
+    stages = graph.run()
+
+    first, second = sorted(stages.values(), key=lambda stage: stage.start)
+    assert second.start >= first.end
+    assert second.blocked_by == first.name
+
+
+def test_critical_path_follows_the_slowest_chain():
+    graph = StageOrchestrator(max_workers=3)
+    graph.add('login', sleeper(0.05))
+    graph.add('tasks', sleeper(0.3), deps=['login'])
+    graph.add('balance', sleeper(0.05), deps=['login'])
+    graph.add('report', sleeper(0.05), deps=['tasks', 'balance'])
+
+    graph.run()
+
+    assert [stage.name for stage in graph.critical_path()] == ['login', 'tasks', 'report']
+
+
+def test_critical_path_includes_resource_waits():
+    graph = StageOrchestrator(max_workers=2)
+    graph.add('login', sleeper(0.05), resources=['browser'])
+    graph.add('withdraw', sleeper(0.2), deps=['login'], resources=['browser'])
+    graph.add('ocr', sleeper(0.01), deps=['login'])
+    graph.add('screenshot', sleeper(0.05), deps=['ocr'], resources=['browser'])
+
+    graph.run()
+
+    # screenshot was ready early but had to wait for withdraw to release the browser
+    assert [stage.name for stage in graph.critical_path()] == ['login', 'withdraw', 'screenshot']
+
+
+def test_false_condition_skips_stage_and_dependents():
+    graph = StageOrchestrator()
+    graph.add('tasks', sleeper(0.01))
+    graph.add('open_whatsapp', sleeper(0.01), deps=['tasks'], condition=lambda: False)
+    graph.add('send_report', sleeper(0.01), deps=['open_whatsapp'])
+
+    stages = graph.run()
+
+    assert stages['open_whatsapp'].status == 'skipped'
+    assert stages['send_report'].status == 'skipped'
+    assert [stage.name for stage in graph.critical_path()] == ['tasks']
+
+
+def test_failure_skips_dependents_but_not_after_stages():
+    def fail():
+        raise RuntimeError("withdrawal failed")
+
+    graph = StageOrchestrator()
+    graph.add('withdraw', fail)
+    graph.add('verify', sleeper(0.01), deps=['withdraw'])
+    graph.add('send_report', sleeper(0.01), after=['withdraw'])
+
+    with pytest.raises(RuntimeError, match="withdrawal failed"):
+        graph.run()
+
+    assert graph.stages['withdraw'].status == 'failed'
+    assert graph.stages['verify'].status == 'skipped'
+    assert graph.stages['send_report'].status == 'done'
+
+
+def test_unknown_dependency_is_rejected():
+    graph = StageOrchestrator()
+    with pytest.raises(ValueError, match="unknown stages: login"):
+        graph.add('tasks', sleeper(0), deps=['login'])
@@ -0,0 +1,73 @@
+import pytest
+
+from run_history import RunHistory, percentile
+from tracing import Tracer
+
+
+@pytest.mark.parametrize('p, expected', [(0, 1), (10, 1), (50, 5), (90, 9), (95, 10), (100, 10)])
+def test_percentile_nearest_rank(p, expected):
+    assert percentile(list(range(1, 11)), p) == expected
+
+
+def test_percentile_of_single_value():
+    assert percentile([2.5], 95) == 2.5
+
+
+def test_percentile_needs_values():
+    with pytest.raises(ValueError):
+        percentile([], 50)
+
+
+def make_tracer(failed=False):
+    tracer = Tracer()
+    with tracer.span('run'):
+        with tracer.span('login_to_website'):
+            pass
+        if failed:
+            with pytest.raises(RuntimeError):
+                with tracer.span('start_tasks'):
+                    raise RuntimeError("task loop stalled")
+    return tracer
+
+
+def test_record_and_query_runs(tmp_path):
+    history = RunHistory(str(tmp_path / 'history.sqlite'))
+    try:
+        history.record_run(make_tracer(), {'method': 'api', 'tasks_completed': 5, 'stalled_attempts': 0,
+                                           'balance': 312.5, 'withdrawal_order_id': 'W1'})
+        history.record_run(make_tracer(failed=True), {'method': 'browser', 'tasks_completed': 2,
+                                                      'stalled_attempts': 3})
+
+        runs = history.recent_runs()
+        assert len(runs) == 2
+        assert {run[3]: run[4] for run in runs} == {'api': 'ok', 'browser': 'ok'}
+        assert history.step_names() == ['login_to_website', 'run', 'start_tasks']
+        assert len(history.step_durations('login_to_website')) == 2
+        days = history.stalled_days()
+        assert [(runs_count, stalled, tasks) for _, runs_count, stalled, tasks in days] == [(1, 3, 2)]
+    finally:
+        history.close()
+
+
+def test_failed_root_span_marks_run_as_error(tmp_path):
+    tracer = Tracer()
+    with pytest.raises(RuntimeError):
+        with tracer.span('run'):
+            raise RuntimeError("login failed")
+    history = RunHistory(str(tmp_path / 'history.sqlite'))
+    try:
+        history.record_run(tracer, {'method': 'browser'})
+        run = history.recent_runs()[0]
+        assert run[4] == 'error'
+        assert run[9] == 'RuntimeError: login failed'
+    finally:
+        history.close()
+
+
+def test_empty_tracer_is_not_recorded(tmp_path):
+    history = RunHistory(str(tmp_path / 'history.sqlite'))
+    try:
+        assert history.record_run(Tracer(), {}) is None
+        assert history.recent_runs() == []
+    finally:
+        history.close()
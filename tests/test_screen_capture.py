@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+import screen_capture
+from screen_capture import ScreenCapture
+
+FRAME = np.zeros((4, 4, 3), dtype=np.uint8)
+
+
+@pytest.fixture
+def broken_mss(monkeypatch):
+    """mss "installed" but every grab fails; pyautogui returns FRAME."""
+    def fail(self, region):
+        raise OSError("XGetImage failed")
+    monkeypatch.setattr(screen_capture, 'MSS_AVAILABLE', True)
+    monkeypatch.setattr(ScreenCapture, '_grab_mss', fail)
+    monkeypatch.setattr(ScreenCapture, '_grab_pyautogui', staticmethod(lambda region: FRAME))
+
+
+def test_failed_mss_grab_falls_back_to_pyautogui(broken_mss):
+    capture = ScreenCapture('mss')
+    assert capture.grab() is FRAME
+    assert capture.backend == 'pyautogui'
+
+
+def test_strict_capture_raises_instead_of_falling_back(broken_mss):
+    capture = ScreenCapture('mss', strict=True)
+    with pytest.raises(OSError):
+        capture.grab()
+    assert capture.backend == 'mss'
+
+
+def test_strict_capture_needs_mss_installed(monkeypatch):
+    monkeypatch.setattr(screen_capture, 'MSS_AVAILABLE', False)
+    assert ScreenCapture('mss').backend == 'pyautogui'
+    with pytest.raises(RuntimeError):
+        ScreenCapture('mss', strict=True)
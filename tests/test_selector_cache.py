@@ -0,0 +1,57 @@
+import json
+
+from selector_cache import SelectorCache
+
+SELECTORS = ["input[type='tel']", "input[name='username']", "#username"]
+
+
+def test_ordered_moves_last_winner_first(tmp_path):
+    cache = SelectorCache(str(tmp_path / 'cache.json'))
+    assert cache.ordered('username', SELECTORS) == SELECTORS
+
+    cache.record('username', '#username')
+
+    assert cache.ordered('username', SELECTORS) == ['#username', "input[type='tel']", "input[name='username']"]
+
+
+def test_winner_missing_from_list_is_ignored(tmp_path):
+    cache = SelectorCache(str(tmp_path / 'cache.json'))
+    cache.record('username', '#login-name')
+    assert cache.ordered('username', SELECTORS) == SELECTORS
+
+
+def test_hits_and_misses(tmp_path):
+    cache = SelectorCache(str(tmp_path / 'cache.json'))
+    cache.record('password', "input[type='password']")  # first sighting: miss
+    cache.record('password', "input[type='password']")  # cached one matched: hit
+    cache.record('password', None)  # nothing matched: miss, keeps the cached selector
+
+    assert cache.fields['password'] == {'selector': "input[type='password']", 'hits': 1, 'misses': 2}
+    assert cache.stats() == ["password: input[type='password'] (hit rate 33%, 1/3)"]
+
+
+def test_save_and_reload(tmp_path):
+    path = tmp_path / 'cache.json'
+    cache = SelectorCache(str(path))
+    cache.record('login_button', 'button.van-button--info')
+    cache.save()
+
+    assert [p.name for p in tmp_path.iterdir()] == ['cache.json']
+    reloaded = SelectorCache(str(path))
+    assert reloaded.ordered('login_button', ['button', 'button.van-button--info'])[0] == 'button.van-button--info'
+
+
+def test_save_skips_unchanged_cache(tmp_path):
+    path = tmp_path / 'cache.json'
+    SelectorCache(str(path)).save()
+    assert not path.exists()
+
+
+def test_unreadable_cache_is_ignored(tmp_path):
+    path = tmp_path / 'cache.json'
+    path.write_text('{not json')
+    cache = SelectorCache(str(path))
+    assert cache.fields == {}
+
+    path.write_text(json.dumps(['not', 'a', 'dict']))
+    assert SelectorCache(str(path)).fields == {}
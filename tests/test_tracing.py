@@ -0,0 +1,122 @@
+import contextvars
+import json
+import threading
+
+import pytest
+
+from tracing import STATUS_ERROR, STATUS_OK, Tracer, traced
+
+
+def test_spans_nest_under_the_open_span():
+    tracer = Tracer()
+    with tracer.span('run') as run:
+        with tracer.span('login_to_website') as login:
+            with tracer.span('wait: login form') as wait:
+                pass
+        with tracer.span('start_tasks') as tasks:
+            pass
+
+    assert [span.name for span in tracer.spans] == ['run', 'login_to_website', 'wait: login form', 'start_tasks']
+    assert (run.parent, login.parent, wait.parent, tasks.parent) == (None, run, login, run)
+    assert [span.depth for span in tracer.spans] == [0, 1, 2, 1]
+    assert all(span.trace_id == tracer.trace_id for span in tracer.spans)
+    assert tracer.current is None
+
+
+def test_error_marks_only_the_spans_it_passes_through():
+    tracer = Tracer()
+    with pytest.raises(RuntimeError):
+        with tracer.span('run'):
+            with tracer.span('login_to_website'):
+                pass
+            with tracer.span('start_tasks'):
+                raise RuntimeError("task loop stalled")
+
+    statuses = {span.name: (span.status, span.error) for span in tracer.spans}
+    assert statuses == {
+        'run': (STATUS_ERROR, 'RuntimeError: task loop stalled'),
+        'login_to_website': (STATUS_OK, None),
+        'start_tasks': (STATUS_ERROR, 'RuntimeError: task loop stalled'),
+    }
+
+
+def test_worker_threads_nest_under_the_copied_context():
+    tracer = Tracer()
+    worker = []
+
+    def ocr():
+        with tracer.span('ocr') as span:
+            worker.append(span)
+
+    with tracer.span('run') as run:
+        # What the stage orchestrator does for every stage it runs on its pool
+        context = contextvars.copy_context()
+        thread = threading.Thread(target=context.run, args=(ocr,))
+        thread.start()
+        thread.join()
+
+    assert worker[0].parent is run
+
+
+def test_traced_decorator_uses_the_method_name():
+    class Bot:
+        def __init__(self):
+            self.tracer = Tracer()
+
+        @traced()
+        def login_to_website(self):
+            return self.tracer.current.name
+
+        @traced('withdraw')
+        def check_balance_and_withdraw(self):
+            return self.tracer.current.name
+
+    bot = Bot()
+    assert bot.login_to_website() == 'login_to_website'
+    assert bot.check_balance_and_withdraw() == 'withdraw'
+    assert Bot.login_to_website.__name__ == 'login_to_website'
+
+
+def test_otlp_export(tmp_path):
+    tracer = Tracer()
+    with pytest.raises(ValueError):
+        with tracer.span('run', method='api'):
+            with tracer.span('start_tasks', tasks=5, ratio=0.5, headless=True):
+                pass
+            raise ValueError("no balance")
+
+    path = tracer.export(str(tmp_path / 'traces'))
+
+    body = json.loads(open(path).read())
+    resource_spans = body['resourceSpans'][0]
+    assert resource_spans['resource']['attributes'] == [
+        {'key': 'service.name', 'value': {'stringValue': 'ad-watcher-bot'}}]
+    run, tasks = resource_spans['scopeSpans'][0]['spans']
+    assert run['traceId'] == tasks['traceId'] == tracer.trace_id
+    assert len(run['traceId']) == 32 and len(run['spanId']) == 16
+    assert 'parentSpanId' not in run and tasks['parentSpanId'] == run['spanId']
+    assert run['status'] == {'code': STATUS_ERROR, 'message': 'ValueError: no balance'}
+    assert tasks['status'] == {'code': STATUS_OK}
+    assert int(run['startTimeUnixNano']) <= int(tasks['startTimeUnixNano']) <= int(tasks['endTimeUnixNano'])
+    assert tasks['attributes'] == [
+        {'key': 'tasks', 'value': {'intValue': '5'}},
+        {'key': 'ratio', 'value': {'doubleValue': 0.5}},
+        {'key': 'headless', 'value': {'boolValue': True}},
+    ]
+
+
+def test_empty_trace_is_not_exported(tmp_path):
+    assert Tracer().export(str(tmp_path)) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_summary_indents_by_depth():
+    tracer = Tracer()
+    with tracer.span('run'):
+        with tracer.span('login_to_website'):
+            pass
+
+    lines = tracer.summary()
+    assert lines[1].startswith('run ')
+    assert lines[2].startswith('  login_to_website ')
+    assert lines[2].endswith('ok')
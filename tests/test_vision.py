@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from vision import TASKS_CROP_BOX, WHATSAPP_GREEN, WhatsAppDetector, preprocess_tasks_screenshot
+
+CORPUS = Path(__file__).resolve().parent.parent / 'benchmarks' / 'corpus'
+
+
+class StubOcr:
+    """Stands in for OcrEngine: returns fixed text and remembers the regions it was asked to read."""
+
+    def __init__(self, text=''):
+        self.text = text
+        self.regions = []
+
+    def image_to_string(self, image, psm=None, **kwargs):
+        self.regions.append(image.shape[:2])
+        return self.text
+
+
+def load(name):
+    return np.array(Image.open(CORPUS / name).convert('RGB'))
+
+
+@pytest.mark.parametrize('name', ['screen_whatsapp_1440x900.png', 'screen_whatsapp_2880x1800.png'])
+def test_header_and_sidebar_are_found_by_colour(name, tmp_path):
+    screen = load(name)
+    detector = WhatsAppDetector(template_dir=str(tmp_path))
+    engine = StubOcr()
+
+    assert detector.detect(screen, engine) == 'color'
+    assert engine.regions == []
+    assert detector.geometry[:2] == (0, 0)
+
+
+def test_dark_theme_falls_back_to_ocr(tmp_path):
+    detector = WhatsAppDetector(template_dir=str(tmp_path))
+    engine = StubOcr('WhatsApp\nChats')
+
+    assert detector.detect(load('screen_whatsapp_dark_1440x900.png'), engine) == 'ocr'
+    # No green areas to look around, so the whole screen was read
+    assert engine.regions == [(900, 1440)]
+
+
+def test_desktop_without_whatsapp(tmp_path):
+    detector = WhatsAppDetector(template_dir=str(tmp_path))
+    assert detector.detect(load('screen_desktop_1440x900.png'), StubOcr()) is None
+
+
+def test_green_button_and_photo_are_not_a_window(tmp_path):
+    screen = np.full((900, 1440, 3), 240, dtype=np.uint8)
+    screen[400:440, 600:760] = WHATSAPP_GREEN  # send button
+    screen[100:400, 900:1200] = WHATSAPP_GREEN  # square photo
+    detector = WhatsAppDetector(template_dir=str(tmp_path))
+    engine = StubOcr()
+
+    assert detector.detect(screen, engine) is None
+    assert engine.regions  # OCR looked around the green areas instead
+
+
+def test_small_screenshot_is_padded_to_the_crop_box():
+    left, top, right, bottom = TASKS_CROP_BOX
+    full = np.zeros((bottom + 50, right + 50, 3), dtype=np.uint8)
+    full[150:250, 800:1000] = 255
+    # Same page captured by a smaller window: everything right of and below x=1100, y=260 is missing
+    small = np.ascontiguousarray(full[:260, :1100])
+
+    for expected, actual in zip(preprocess_tasks_screenshot(full), preprocess_tasks_screenshot(small)):
+        assert actual.shape == expected.shape
+        assert np.array_equal(actual, expected)
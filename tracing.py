@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Run tracing for the Ad Watcher Bot.
+Nested timed spans around bot steps, exported as OTLP-compatible JSON
+with a plain-text summary table.
+"""
+
+import contextvars
+import functools
+import json
+import logging
+import os
+import secrets
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = 'ad-watcher-bot'
+
+# OTLP status codes
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    """One timed step of a run."""
+
+    def __init__(self, name: str, trace_id: str, parent: Optional['Span'], attributes: Dict):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent = parent
+        self.depth = parent.depth + 1 if parent else 0
+        self.attributes = dict(attributes)
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.status = STATUS_OK
+        self.error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (up to now if the span is still open)."""
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e9
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def to_otlp(self) -> dict:
+        span = {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'name': self.name,
+            'kind': 1,  # SPAN_KIND_INTERNAL
+            'startTimeUnixNano': str(self.start_ns),
+            'endTimeUnixNano': str(self.end_ns or time.time_ns()),
+            'attributes': [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            'status': {'code': self.status},
+        }
+        if self.parent:
+            span['parentSpanId'] = self.parent.span_id
+        if self.error:
+            span['status']['message'] = self.error
+        return span
+
+
+def _otlp_attribute(key: str, value) -> dict:
+    if isinstance(value, bool):
+        return {'key': key, 'value': {'boolValue': value}}
+    if isinstance(value, int):
+        return {'key': key, 'value': {'intValue': str(value)}}
+    if isinstance(value, float):
+        return {'key': key, 'value': {'doubleValue': value}}
+    return {'key': key, 'value': {'stringValue': str(value)}}
+
+
+class Tracer:
+    """Collects nested spans for one bot run."""
+
+    def __init__(self, service_name: str = SERVICE_NAME):
+        self.service_name = service_name
+        self.trace_id = secrets.token_hex(16)
+        self.spans: List[Span] = []
+        self._current = contextvars.ContextVar(f'current_span_{id(self)}', default=None)
+
+    @property
+    def current(self) -> Optional[Span]:
+        """The innermost open span in the current context."""
+        return self._current.get()
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """Time a block as a child of the current span."""
+        span = Span(name, self.trace_id, self.current, attributes)
+        self.spans.append(span)
+        token = self._current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.status = STATUS_ERROR
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            self._current.reset(token)
+
+    def to_otlp(self) -> dict:
+        """Return the trace in the OTLP/JSON ExportTraceServiceRequest shape."""
+        return {
+            'resourceSpans': [{
+                'resource': {'attributes': [_otlp_attribute('service.name', self.service_name)]},
+                'scopeSpans': [{
+                    'scope': {'name': self.service_name},
+                    'spans': [span.to_otlp() for span in self.spans],
+                }],
+            }],
+        }
+
+    def export(self, directory: str = 'traces') -> Optional[str]:
+        """Write the trace to <directory>/trace_<timestamp>.json and return the path."""
+        if not self.spans:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime('%Y%m%d_%H%M%S', time.localtime(self.spans[0].start_ns / 1e9))
+        path = os.path.join(directory, f'trace_{stamp}_{self.trace_id[:8]}.json')
+        with open(path, 'w') as f:
+            json.dump(self.to_otlp(), f, indent=2)
+        return path
+
+    def summary(self) -> List[str]:
+        """Return a table of spans in start order, indented by nesting depth."""
+        lines = [f"{'Step':<48} {'Seconds':>9}  Status"]
+        for span in sorted(self.spans, key=lambda s: s.start_ns):
+            name = '  ' * span.depth + span.name
+            status = 'ok' if span.status == STATUS_OK else f'error ({span.error})'
+            lines.append(f"{name:<48} {span.duration:>9.2f}  {status}")
+        return lines
+
+
+def traced(name: Optional[str] = None):
+    """Decorator for bot methods: run the method inside a span on self.tracer."""
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.tracer.span(span_name):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
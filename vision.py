@@ -0,0 +1,562 @@
+#!/usr/bin/env python3
+"""
+Vision helpers for the Ad Watcher Bot.
+OCR engine and image processing shared by main.py and the benchmark scripts.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+import pytesseract
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# Crop box (left, top, right, bottom) of the task counter on the task list screenshot
+TASKS_CROP_BOX = (720, 100, 1420, 325)
+
+# Screen region (left, top, width, height) of the WhatsApp message box
+ADMIN_MESSAGE_REGION = (445, 905, 1024, 50)
+ADMIN_MESSAGES = ["Only admins can send messages", "Only admins"]
+
+WHATSAPP_GREEN = (37, 211, 102)
+
+# Optional: tesserocr binds the tesseract C API so the model stays loaded
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+
+class OcrEngine:
+    """OCR front-end that keeps tesseract loaded between calls when possible.
+
+    With tesserocr installed, one PyTessBaseAPI is initialised per
+    (psm, oem, whitelist) combination and reused for every later call.
+    Otherwise each call falls back to pytesseract, which forks a new
+    tesseract process. Calls are serialised with a lock because the
+    tesseract handles are not thread-safe.
+    """
+
+    def __init__(self, lang: str = 'eng', persistent: Optional[bool] = None):
+        self.lang = lang
+        self.persistent = TESSEROCR_AVAILABLE if persistent is None else persistent
+        if self.persistent and not TESSEROCR_AVAILABLE:
+            raise RuntimeError("Persistent OCR requested but tesserocr is not installed")
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._apis: Dict[Tuple[int, int, Optional[str]], 'tesserocr.PyTessBaseAPI'] = {}
+
+    @property
+    def backend(self) -> str:
+        return 'tesserocr' if self.persistent else 'pytesseract'
+
+    def image_to_string(self, image, psm: int = 3, oem: int = 3, whitelist: Optional[str] = None) -> str:
+        """Run OCR on a PIL image or NumPy array and return the raw text."""
+        with self._lock:
+            self.calls += 1
+            if self.persistent:
+                api = self._get_api(psm, oem, whitelist)
+                api.SetImage(image if isinstance(image, Image.Image) else Image.fromarray(image))
+                return api.GetUTF8Text()
+
+            config = f"--oem {oem} --psm {psm}"
+            if whitelist:
+                config += f" -c tessedit_char_whitelist={whitelist}"
+            return pytesseract.image_to_string(image, lang=self.lang, config=config)
+
+    def _get_api(self, psm: int, oem: int, whitelist: Optional[str]):
+        """Return a cached tesseract handle for the given configuration."""
+        key = (psm, oem, whitelist)
+        api = self._apis.get(key)
+        if api is None:
+            api = tesserocr.PyTessBaseAPI(lang=self.lang, psm=psm, oem=oem)
+            if whitelist:
+                api.SetVariable("tessedit_char_whitelist", whitelist)
+            self._apis[key] = api
+            logger.debug(f"Initialised tesseract handle psm={psm} oem={oem} whitelist={whitelist}")
+        return api
+
+    def close(self):
+        """Release every cached tesseract handle."""
+        for api in self._apis.values():
+            api.End()
+        self._apis.clear()
+
+
+_engine: Optional[OcrEngine] = None
+
+
+def get_ocr_engine() -> OcrEngine:
+    """Return the process-wide OCR engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        _engine = OcrEngine()
+        logger.info(f"OCR engine initialised ({_engine.backend})")
+    return _engine
+
+
+class FrameCache:
+    """Bounded LRU cache of results keyed by a hash of the captured pixels.
+
+    Screen checks that run in a retry loop recapture the same pixels
+    again and again; when the frame is unchanged the previous verdict is
+    returned without preprocessing or OCR. Keys are namespaced per call
+    site so different checks on the same frame do not collide.
+
+    mode='exact' hashes the raw bytes. mode='perceptual' uses a 64-bit
+    difference hash, which also ignores compression noise and cursor
+    blinks but may treat small text changes as the same frame.
+    """
+
+    MODES = ('exact', 'perceptual')
+
+    def __init__(self, max_entries: int = 32, mode: str = 'exact'):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown frame cache mode '{mode}' (choose from {', '.join(self.MODES)})")
+        self.max_entries = max_entries
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[Tuple[str, str], Any]' = OrderedDict()
+
+    def frame_key(self, frame: np.ndarray) -> str:
+        """Hash a frame according to the cache mode."""
+        if self.mode == 'perceptual':
+            gray = frame if frame.ndim == 2 else cv2.cvtColor(np.ascontiguousarray(frame[:, :, :3]), cv2.COLOR_RGB2GRAY)
+            small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+            bits = (small[:, 1:] > small[:, :-1]).ravel()
+            return f"{int(np.packbits(bits).view('>u8')[0]):016x}"
+        digest = hashlib.blake2b(str(frame.shape).encode(), digest_size=16)
+        digest.update(np.ascontiguousarray(frame).data)
+        return digest.hexdigest()
+
+    def get_or_compute(self, namespace: str, frame: np.ndarray, compute: Callable[[], Any]) -> Any:
+        """Return the cached result for this frame, or compute and store it."""
+        key = (namespace, self.frame_key(frame))
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            logger.debug(f"Frame cache hit for {namespace}")
+            return self._entries[key]
+
+        self.misses += 1
+        result = compute()
+        self._entries[key] = result
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> str:
+        total = self.hits + self.misses
+        rate = self.hits / total if total else 0.0
+        return (f"hits={self.hits} misses={self.misses} evictions={self.evictions} "
+                f"hit rate={rate:.0%} entries={len(self._entries)}/{self.max_entries}")
+
+
+_frame_cache: Optional[FrameCache] = None
+
+
+def get_frame_cache() -> FrameCache:
+    """Return the process-wide frame cache shared by the screen checks."""
+    global _frame_cache
+    if _frame_cache is None:
+        _frame_cache = FrameCache(
+            max_entries=int(os.getenv('FRAME_CACHE_SIZE', '32')),
+            mode=os.getenv('FRAME_CACHE_MODE', 'exact').lower(),
+        )
+    return _frame_cache
+
+
+def decode_png(data: bytes) -> np.ndarray:
+    """Decode PNG bytes straight into a BGR array without touching disk."""
+    img = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+    if img is None:
+        raise ValueError("Could not decode PNG data")
+    return img
+
+
+def preprocess_tasks_screenshot(screenshot: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Crop, upscale and binarise the task counter region of a BGR screenshot.
+
+    Returns the thresholded region, the padded digit crop and the label crop.
+    """
+    left, top, right, bottom = TASKS_CROP_BOX
+    img = screenshot[top:bottom, left:right]
+    if img.shape[:2] != (bottom - top, right - left):
+        # Like the PIL crop this replaced: the part of the box outside the screenshot is black
+        logger.warning(f"Screenshot {screenshot.shape[1]}x{screenshot.shape[0]} does not cover the task counter "
+                       f"box {TASKS_CROP_BOX} - padding it")
+        padded = np.zeros((bottom - top, right - left) + screenshot.shape[2:], dtype=screenshot.dtype)
+        padded[:img.shape[0], :img.shape[1]] = img
+        img = padded
+    img = cv2.resize(img, None, fx=2, fy=2)
+    img = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    img = cv2.threshold(img, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
+
+    # Split image into two parts
+    height, width = img.shape[:2]
+    img1 = img[int(height*0.2):int(height*0.6), int(width*0.45):int(width*0.6)]
+    img2 = img[int(height*0.6):height, 0:width]
+
+    # Optimize img1 for single digit OCR
+    h, w = img1.shape
+    target_height = 32  # Optimal height for digit recognition
+    if h != target_height:
+        scale = target_height / h
+        new_w = int(w * scale)
+        img1 = cv2.resize(img1, (new_w, target_height), interpolation=cv2.INTER_CUBIC)
+
+    # Add padding around the digit
+    img1 = cv2.copyMakeBorder(img1, 10, 10, 10, 10, cv2.BORDER_CONSTANT, value=255)
+    return img, img1, img2
+
+
+class GlyphVerifier:
+    """Cheap check of the task counter against glyphs learned from tesseract.
+
+    Every time tesseract confirms a count, the digit glyphs and the
+    "Tasks Completed Today" label are stored as templates. Later runs
+    compare the screenshot against those templates first and only
+    escalate to tesseract when the match is inconclusive.
+    """
+
+    GLYPH_SIZE = (20, 32)  # (width, height) every digit is normalised to
+    LABEL_WIDTH = 400
+
+    def __init__(self, template_dir: str = 'ocr_templates', threshold: float = 0.85):
+        self.template_dir = Path(template_dir)
+        self.threshold = threshold
+        self.stats_path = self.template_dir / 'stats.json'
+        self.run_stats = Counter()
+        self._templates: Dict[str, Optional[np.ndarray]] = {}
+
+    def verify(self, digits_img: np.ndarray, label_img: np.ndarray, expected: int) -> Optional[bool]:
+        """Return True when every glyph matches its template, None when inconclusive."""
+        label = self._template('label')
+        if label is None:
+            return None
+        if self._score(self._normalise_label(label_img), label) < self.threshold:
+            return None
+
+        glyphs = self._segment_digits(digits_img)
+        if len(glyphs) != len(str(expected)):
+            return None
+        for digit, glyph in zip(str(expected), glyphs):
+            template = self._template(f'digit_{digit}')
+            if template is None or self._score(glyph, template) < self.threshold:
+                return None
+        return True
+
+    def learn(self, digits_img: np.ndarray, label_img: np.ndarray, expected: int):
+        """Store templates from an image tesseract has just confirmed."""
+        glyphs = self._segment_digits(digits_img)
+        if len(glyphs) != len(str(expected)):
+            logger.debug(f"Not learning glyphs: found {len(glyphs)} for '{expected}'")
+            return
+        self.template_dir.mkdir(parents=True, exist_ok=True)
+        for digit, glyph in zip(str(expected), glyphs):
+            self._store(f'digit_{digit}', glyph)
+        if self._template('label') is None:
+            self._store('label', self._normalise_label(label_img))
+
+    def record(self, tier: str):
+        """Count which tier decided the result, for this run and across runs."""
+        self.run_stats[tier] += 1
+        totals = Counter()
+        try:
+            totals.update(json.loads(self.stats_path.read_text()))
+        except (OSError, ValueError):
+            pass
+        totals[tier] += 1
+        try:
+            self.template_dir.mkdir(parents=True, exist_ok=True)
+            self.stats_path.write_text(json.dumps(dict(totals), indent=2))
+        except OSError as e:
+            logger.warning(f"Could not save verification stats: {e}")
+        logger.info(f"Verification tiers (all runs): {', '.join(f'{k}={v}' for k, v in sorted(totals.items()))}")
+
+    def _template(self, name: str) -> Optional[np.ndarray]:
+        if name not in self._templates:
+            path = self.template_dir / f'{name}.png'
+            self._templates[name] = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE) if path.exists() else None
+        return self._templates[name]
+
+    def _store(self, name: str, img: np.ndarray):
+        cv2.imwrite(str(self.template_dir / f'{name}.png'), img)
+        self._templates[name] = img
+
+    def _normalise_label(self, img: np.ndarray) -> np.ndarray:
+        h, w = img.shape[:2]
+        return cv2.resize(img, (self.LABEL_WIDTH, max(1, int(h * self.LABEL_WIDTH / w))), interpolation=cv2.INTER_AREA)
+
+    def _segment_digits(self, img: np.ndarray) -> List[np.ndarray]:
+        """Split a binarised digit crop into normalised glyphs, left to right."""
+        # Foreground must be white for connected components
+        fg = cv2.bitwise_not(img) if img.mean() > 127 else img
+        count, _, stats, _ = cv2.connectedComponentsWithStats(fg, connectivity=8)
+        boxes = [stats[i] for i in range(1, count) if stats[i][cv2.CC_STAT_AREA] >= 15]
+        if not boxes:
+            return []
+        tallest = max(box[cv2.CC_STAT_HEIGHT] for box in boxes)
+        boxes = sorted((box for box in boxes if box[cv2.CC_STAT_HEIGHT] >= tallest * 0.5),
+                       key=lambda box: box[cv2.CC_STAT_LEFT])
+        return [
+            cv2.resize(fg[y:y + h, x:x + w], self.GLYPH_SIZE, interpolation=cv2.INTER_AREA)
+            for x, y, w, h, _ in boxes
+        ]
+
+    @staticmethod
+    def _score(img: np.ndarray, template: np.ndarray) -> float:
+        if img.shape != template.shape:
+            img = cv2.resize(img, (template.shape[1], template.shape[0]), interpolation=cv2.INTER_AREA)
+        return float(cv2.matchTemplate(img.astype(np.float32), template.astype(np.float32), cv2.TM_CCOEFF_NORMED)[0][0])
+
+
+def count_whatsapp_green(screenshot: np.ndarray, tolerance: int = 30) -> int:
+    """Count how many of five fixed sample points on an RGB screenshot are WhatsApp green."""
+    height, width = screenshot.shape[:2]
+    sample_points = [
+        (width // 4, height // 10),
+        (width // 10, height // 4),
+        (width // 2, height // 10),
+        (50, 50),
+        (100, 100)
+    ]
+    green = np.array(WHATSAPP_GREEN)
+    return sum(
+        1 for x, y in sample_points
+        if 0 <= x < width and 0 <= y < height
+        and np.all(np.abs(screenshot[y, x, :3].astype(int) - green) <= tolerance)
+    )
+
+
+class WhatsAppDetector:
+    """Tiered check for a visible WhatsApp window on an RGB screen capture.
+
+    Tiers, cheapest first: a solid WhatsApp-green band shaped like the
+    header or sidebar (a connected component on a downsampled frame, or a
+    solid band of one), a template match against the header learned from
+    an earlier OCR hit, and finally OCR around the green areas found (or
+    the whole screen if there are none). The geometry of the last detection is kept so later
+    checks know where to look.
+    """
+
+    SAMPLE_WIDTH = 360  # frames are subsampled to about this width
+    QUANT_SHIFT = 5  # 8 levels per channel -> 512 histogram bins
+    INDICATORS = ('whatsapp', 'chats')
+    MAX_OCR_REGIONS = 3
+
+    def __init__(self, template_dir: str = 'ocr_templates', min_component_fraction: float = 0.015,
+                 min_fill: float = 0.7, min_aspect: float = 3.0, match_threshold: float = 0.8):
+        self.template_path = Path(template_dir) / 'whatsapp_header.png'
+        # A green area must be this share of the frame, this solid and this elongated to count as a header/sidebar
+        self.min_component_fraction = min_component_fraction
+        self.min_fill = min_fill
+        self.min_aspect = min_aspect
+        self.match_threshold = match_threshold
+        self.geometry: Optional[Tuple[int, int, int, int]] = None  # (left, top, width, height) on the full frame
+        self._header: Optional[np.ndarray] = None
+        self._header_loaded = False
+        self._green_bin = self._bin(np.array(WHATSAPP_GREEN))
+
+    def detect(self, screen: np.ndarray, engine: OcrEngine) -> Optional[str]:
+        """Return the name of the tier that found WhatsApp, or None."""
+        step = max(1, screen.shape[1] // self.SAMPLE_WIDTH)
+        small = screen[::step, ::step, :3]
+
+        components = self._green_components(small)
+        if self._colour_match(components, small.shape, step):
+            return 'color'
+        gray = cv2.cvtColor(np.ascontiguousarray(small), cv2.COLOR_RGB2GRAY)
+        if self._template_match(gray, step):
+            return 'template'
+        if self._ocr_match(screen, engine, components, step):
+            self._learn_header(gray, step)
+            return 'ocr'
+        return None
+
+    def _bin(self, pixels: np.ndarray) -> np.ndarray:
+        q = pixels.astype(np.int32) >> self.QUANT_SHIFT
+        levels = 256 >> self.QUANT_SHIFT
+        return (q[..., 0] * levels + q[..., 1]) * levels + q[..., 2]
+
+    def _green_components(self, small: np.ndarray) -> List[Tuple[int, int, int, int, int]]:
+        """Connected WhatsApp-green areas (x, y, w, h, area) on the downsampled frame, largest first.
+
+        WhatsApp Web's header and sidebar touch and form one L-shaped area,
+        so a sparse area is replaced by its solid row and column bands.
+        """
+        mask = (self._bin(small) == self._green_bin).astype(np.uint8)
+        count, labels, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+        min_area = self.min_component_fraction * mask.size
+        components = []
+        for i in range(1, count):
+            x, y, w, h, area = (int(v) for v in stats[i])
+            if area < min_area:
+                continue
+            bands = []
+            if area < self.min_fill * w * h:
+                bands = self._solid_bands(labels[y:y + h, x:x + w] == i, x, y)
+            components.extend(band for band in bands if band[4] >= min_area)
+            if not bands:
+                components.append((x, y, w, h, area))
+        return sorted(components, key=lambda c: c[4], reverse=True)
+
+    def _solid_bands(self, mask: np.ndarray, x: int, y: int) -> List[Tuple[int, int, int, int, int]]:
+        """The longest run of rows and of columns that are at least min_fill green across the whole box."""
+        bands = []
+        rows = self._longest_run(mask.mean(axis=1) >= self.min_fill)
+        if rows:
+            top, bottom = rows
+            bands.append((x, y + top, mask.shape[1], bottom - top, int(mask[top:bottom].sum())))
+        cols = self._longest_run(mask.mean(axis=0) >= self.min_fill)
+        if cols:
+            left, right = cols
+            bands.append((x + left, y, right - left, mask.shape[0], int(mask[:, left:right].sum())))
+        return bands
+
+    @staticmethod
+    def _longest_run(flags: np.ndarray) -> Optional[Tuple[int, int]]:
+        """(start, end) of the longest stretch of True values, or None."""
+        idx = np.flatnonzero(flags)
+        if idx.size == 0:
+            return None
+        run = max(np.split(idx, np.flatnonzero(np.diff(idx) > 1) + 1), key=len)
+        return int(run[0]), int(run[-1]) + 1
+
+    def _window_shape(self, component: Tuple[int, int, int, int, int], shape: Tuple[int, ...]) -> Optional[str]:
+        """'header' for a wide solid band, 'sidebar' for a tall one, else None (buttons, icons, photos)."""
+        x, y, w, h, area = component
+        if area < self.min_fill * w * h:
+            return None
+        if w >= self.min_aspect * h and w >= shape[1] * 0.25:
+            return 'header'
+        if h >= self.min_aspect * w and h >= shape[0] * 0.4:
+            return 'sidebar'
+        return None
+
+    def _colour_match(self, components: List[Tuple[int, int, int, int, int]], shape: Tuple[int, ...],
+                      step: int) -> bool:
+        """Find a green header or sidebar band; the window starts at it."""
+        for component in components:
+            kind = self._window_shape(component, shape)
+            if kind is None:
+                continue
+            x, y, w, h, _ = (v * step for v in component)
+            height, width = shape[0] * step, shape[1] * step
+            # A header spans the window's width, a sidebar its height; the window extends below / right of it
+            self.geometry = (x, y, w, height - y) if kind == 'header' else (x, y, width - x, h)
+            logger.debug(f"WhatsApp green {kind} at {(x, y, w, h)}")
+            return True
+        return False
+
+    def _template_match(self, gray: np.ndarray, step: int) -> bool:
+        """Look for the learned header on the downsampled frame."""
+        if not self._header_loaded:
+            self._header_loaded = True
+            if self.template_path.exists():
+                self._header = cv2.imread(str(self.template_path), cv2.IMREAD_GRAYSCALE)
+        header = self._header
+        if header is None or header.shape[0] > gray.shape[0] or header.shape[1] > gray.shape[1]:
+            return False
+        result = cv2.matchTemplate(gray, header, cv2.TM_CCOEFF_NORMED)
+        _, score, _, (x, y) = cv2.minMaxLoc(result)
+        if score < self.match_threshold:
+            return False
+        self.geometry = (x * step, y * step, header.shape[1] * step, header.shape[0] * step)
+        return True
+
+    @staticmethod
+    def _header_region(window: Tuple[int, int, int, int], screen: np.ndarray) -> Tuple[int, int, int, int]:
+        """Top quarter of a window box, clipped to the screen."""
+        height, width = screen.shape[:2]
+        left, top, w, h = window
+        left, top = max(0, min(left, width - 1)), max(0, min(top, height - 1))
+        return left, top, max(1, min(w, width - left)), max(1, min(max(h // 4, 1), height - top))
+
+    def _ocr_regions(self, screen: np.ndarray, components: List[Tuple[int, int, int, int, int]],
+                     step: int) -> List[Tuple[int, int, int, int]]:
+        """Where to look for the title: the last window, then around each green area, else the whole screen."""
+        regions = [self._header_region(self.geometry, screen)] if self.geometry else []
+        height, width = screen.shape[:2]
+        for x, y, w, h, _ in components:
+            x, y, w, h = x * step, y * step, w * step, h * step
+            pad = max(w, h) // 2
+            left, top = max(0, x - pad), max(0, y - pad)
+            regions.append((left, top, min(width, x + w + pad) - left, min(height, y + h + pad) - top))
+        return regions[:self.MAX_OCR_REGIONS] or [(0, 0, width, height)]
+
+    def _ocr_match(self, screen: np.ndarray, engine: OcrEngine, components: List[Tuple[int, int, int, int, int]],
+                   step: int) -> bool:
+        for left, top, width, height in self._ocr_regions(screen, components, step):
+            roi = np.ascontiguousarray(screen[top:top + height, left:left + width, :3])
+            text = engine.image_to_string(roi, psm=11).lower()
+            if any(indicator in text for indicator in self.INDICATORS):
+                self.geometry = (left, top, width, height)
+                return True
+        return False
+
+    def _learn_header(self, gray: np.ndarray, step: int):
+        """Keep the OCR-confirmed header region as the template for the next checks."""
+        left, top, width, height = (v // step for v in self.geometry)
+        header = gray[top:top + height, left:left + width]
+        # A whole-screen fallback hit is no header: it would only ever match this exact screen
+        if header.size == 0 or header.std() < 1 or height > gray.shape[0] // 2:
+            return
+        self._header = header.copy()
+        self._header_loaded = True
+        try:
+            self.template_path.parent.mkdir(parents=True, exist_ok=True)
+            cv2.imwrite(str(self.template_path), self._header)
+        except OSError as e:
+            logger.warning(f"Could not save WhatsApp header template: {e}")
+
+
+def preprocess_chatbox(region: np.ndarray) -> np.ndarray:
+    """Upscale and binarise an RGB capture of the message box for OCR."""
+    img = cv2.cvtColor(region[:, :, :3], cv2.COLOR_RGB2BGR)
+    img = cv2.resize(img, None, fx=2, fy=2)
+    img = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    return cv2.threshold(img, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)[1]
+
+
+def contains_admin_message(text: str) -> bool:
+    """Return True if OCR text shows the admins-only restriction."""
+    return any(msg in text for msg in ADMIN_MESSAGES)
+
+
+def ocr_task_count(engine: OcrEngine, digits_img: np.ndarray, label_img: np.ndarray, expected: int) -> Optional[int]:
+    """Look for '<expected> Tasks Completed Today' with several page segmentation modes.
+
+    Returns the PSM that matched, or None.
+    """
+    for psm in [7, 10, 6, 11]:
+        # Part1: Digit whitelist + PSM for single digit/line
+        text1 = engine.image_to_string(digits_img, psm=psm, oem=3, whitelist="0123456789").strip().replace("\n", "")
+
+        # If OEM 3 fails, try legacy engine for part1
+        if not text1.isdigit():
+            text1 = engine.image_to_string(digits_img, psm=psm, oem=1, whitelist="0123456789").strip().replace("\n", "")
+
+        # Part2: Standard config (since it's working)
+        text2 = engine.image_to_string(label_img, psm=psm, oem=3).strip().replace("\n", "")
+        text = f"{text1} {text2}"
+        logger.info(f"Tasks page screenshot text with PSM {psm}: {text}")
+        if f'{expected} Tasks Completed Today' in text:
+            return psm
+    return None
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+WebDriver command profiler for the Ad Watcher Bot.
+Times every command the bot sends to ChromeDriver and attributes it to
+the tracer span (bot step) that issued it, so the chattiest steps can be
+found and optimised first.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+NO_STEP = '(no step)'
+
+
+class WebDriverProfiler:
+    """Per-step, per-command WebDriver call counts and timings."""
+
+    def __init__(self, top_n: int = 10):
+        self.top_n = top_n
+        self._lock = threading.Lock()
+        # (step, command) -> [calls, total seconds, max seconds]
+        self.commands: Dict[Tuple[str, str], list] = defaultdict(lambda: [0, 0.0, 0.0])
+
+    def record(self, span, command: str, seconds: float):
+        """Add one command that took `seconds`, issued inside `span` (or outside any span)."""
+        step = span.name if span is not None else NO_STEP
+        with self._lock:
+            entry = self.commands[(step, command)]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+            if span is not None:
+                # Also visible per span in the exported trace
+                span.set_attribute('webdriver.commands', span.attributes.get('webdriver.commands', 0) + 1)
+                span.set_attribute('webdriver.seconds',
+                                   round(span.attributes.get('webdriver.seconds', 0.0) + seconds, 4))
+
+    def steps(self) -> List[Tuple[str, int, float]]:
+        """(step, calls, seconds) for every step, most WebDriver time first."""
+        totals: Dict[str, list] = defaultdict(lambda: [0, 0.0])
+        with self._lock:
+            for (step, _), (calls, seconds, _) in self.commands.items():
+                totals[step][0] += calls
+                totals[step][1] += seconds
+        return sorted(((step, calls, seconds) for step, (calls, seconds) in totals.items()),
+                      key=lambda row: row[2], reverse=True)
+
+    def report(self) -> List[str]:
+        """Top steps and top step/command pairs by total WebDriver time."""
+        if not self.commands:
+            return []
+        steps = self.steps()
+        calls_total = sum(calls for _, calls, _ in steps)
+        seconds_total = sum(seconds for _, _, seconds in steps)
+        lines = [f"WebDriver: {calls_total} commands, {seconds_total:.2f}s in total",
+                 f"{'Step':<36} {'Calls':>6} {'Seconds':>8} {'Share':>6}"]
+        for step, calls, seconds in steps[:self.top_n]:
+            share = seconds / seconds_total if seconds_total else 0.0
+            lines.append(f"{step:<36} {calls:>6} {seconds:>8.2f} {share:>6.0%}")
+
+        lines.append(f"{'Step / command':<52} {'Calls':>6} {'Seconds':>8} {'Avg ms':>7} {'Max ms':>7}")
+        with self._lock:
+            ranked = sorted(self.commands.items(), key=lambda item: item[1][1], reverse=True)[:self.top_n]
+        for (step, command), (calls, seconds, longest) in ranked:
+            name = f"{step} / {command}"
+            lines.append(f"{name:<52} {calls:>6} {seconds:>8.2f} {seconds / calls * 1000:>7.1f} {longest * 1000:>7.1f}")
+        return lines
+
+    def clear(self):
+        with self._lock:
+            self.commands.clear()